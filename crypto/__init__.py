@@ -5,6 +5,9 @@ Cryptographic Module
 Mô-đun mật mã
 """
 
-from .rsa_engine import RSAEngine
+from .rsa_engine import RSAEngine, CancellationToken, OperationCancelled
+from .tree_hash import DIGEST_SHA256, DIGEST_TREE_SHA256_V1, DIGEST_TYPES, tree_hash, tree_hash_file
 
-__all__ = ['RSAEngine']
\ No newline at end of file
+__all__ = ['RSAEngine', 'CancellationToken', 'OperationCancelled',
+           'DIGEST_SHA256', 'DIGEST_TREE_SHA256_V1', 'DIGEST_TYPES',
+           'tree_hash', 'tree_hash_file']
\ No newline at end of file
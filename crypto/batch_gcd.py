@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch GCD Shared-Prime Scanner
+Quét số nguyên tố dùng chung bằng GCD hàng loạt
+
+Tìm các khóa công khai có module dùng chung một số nguyên tố bằng cây tích và
+cây số dư của Bernstein: thời gian gần tuyến tính thay vì gcd từng cặp.
+Finds public keys whose moduli share a prime with Bernstein's product tree and
+remainder tree: quasi-linear time instead of pairwise gcds.
+
+Chạy - Run:
+    python -m crypto.batch_gcd keys.txt
+
+Mỗi dòng của file là một khóa - Each line of the file is one key:
+    e n                      (thập phân hoặc 0x hex - decimal or 0x hex)
+    e,n
+    {"e": 17, "n": 3233}     (JSON; cũng nhận {"key_info": {...}} của báo cáo - also accepts report {"key_info": {...}})
+"""
+
+import json
+import math
+import sys
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+PublicKey = Tuple[int, int]
+
+# Dưới ngưỡng này (bit thương) dùng phép chia sẵn có - Below this quotient size, use built-in division
+_DIV_LIMIT = 4000
+
+
+def _div2n1n(a: int, b: int, n: int) -> Tuple[int, int]:
+    """Chia số 2n bit cho số n bit (Burnikel-Ziegler) - Divide a 2n-bit number by an n-bit one (Burnikel-Ziegler)"""
+    if a.bit_length() - n <= _DIV_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a <<= 1
+        b <<= 1
+        n += 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _div3n2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _div3n2n(r, a & mask, b, b1, b2, half)
+    if pad:
+        r >>= 1
+    return q1 << half | q2, r
+
+
+def _div3n2n(a12: int, a3: int, b: int, b1: int, b2: int, n: int) -> Tuple[int, int]:
+    """Bước 3n/2n của Burnikel-Ziegler - The 3n/2n step of Burnikel-Ziegler"""
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _div2n1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+
+def _remainder(a: int, b: int) -> int:
+    """
+    a mod b với chia đệ quy cho số rất lớn - a mod b with recursive division for huge numbers
+
+    Phép chia của CPython 3.11 là bậc hai, còn phép nhân dùng Karatsuba; chia
+    đệ quy Burnikel-Ziegler (như CPython 3.12 dùng nội bộ) quy phép chia về
+    phép nhân, nhanh khoảng 9 lần ở các tầng trên của cây số dư.
+    CPython 3.11 division is quadratic while multiplication uses Karatsuba;
+    recursive Burnikel-Ziegler division (as CPython 3.12 uses internally)
+    reduces division to multiplication, about 9x faster at the top levels of
+    the remainder tree.
+    """
+    n = b.bit_length()
+    if a.bit_length() - n <= _DIV_LIMIT:
+        return a % b
+    # Tách a thành các chữ số n bit, chia từ chữ số cao - Split a into n-bit digits, divide from the top
+    digits = []
+    mask = (1 << n) - 1
+    while a:
+        digits.append(a & mask)
+        a >>= n
+    r = 0
+    for digit in reversed(digits):
+        r = _div2n1n((r << n) | digit, b, n)[1]
+    return r
+
+
+def product_tree(values: Sequence[int]) -> List[List[int]]:
+    """
+    Cây tích: tầng 0 là các giá trị, tầng trên cùng là tích của tất cả
+    Product tree: level 0 holds the values, the top level their overall product
+
+    Args:
+        values: Các số nguyên dương - Positive integers
+
+    Returns:
+        List[List[int]]: Các tầng từ lá lên gốc - Levels from the leaves to the root
+    """
+    tree = [list(values)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)])
+    return tree
+
+
+def batch_gcd(moduli: Sequence[int]) -> List[int]:
+    """
+    gcd(n_i, ∏_{j≠i} n_j) cho mọi i - gcd(n_i, ∏_{j≠i} n_j) for every i
+
+    Đi xuống cây số dư với P mod n² ở mỗi nút, rồi g_i = gcd((P mod n_i²) / n_i, n_i).
+    Walks down the remainder tree keeping P mod n² at each node, then
+    g_i = gcd((P mod n_i²) / n_i, n_i).
+
+    Args:
+        moduli: Các module - Moduli
+
+    Returns:
+        List[int]: gcd của mỗi module với tích các module còn lại - gcd of each modulus with the product of the others
+    """
+    if not moduli:
+        return []
+    tree = product_tree(moduli)
+    remainders = tree[-1]
+    for level in reversed(tree[:-1]):
+        remainders = [_remainder(remainders[i // 2], value * value) for i, value in enumerate(level)]
+    return [math.gcd(remainder // n, n) for remainder, n in zip(remainders, moduli)]
+
+
+def find_shared_primes(keys: Sequence[PublicKey]) -> List[Dict[str, object]]:
+    """
+    Tìm các khóa có module dùng chung số nguyên tố - Find keys whose moduli share a prime
+
+    Module trùng nhau được báo riêng (chia sẻ cả hai thừa số, không khôi phục
+    được từ gcd). Khi g_i = n_i vì chung cả hai số nguyên tố với các khóa
+    khác, các khóa bị đánh dấu được gcd từng cặp, vì chúng thường rất ít.
+    Duplicate moduli are reported separately (they share both factors, which a
+    gcd cannot recover). When g_i = n_i because both primes are shared with
+    other keys, the flagged keys are gcd'ed pairwise, as they are usually few.
+
+    Args:
+        keys: Các khóa công khai (e, n) - Public keys (e, n)
+
+    Returns:
+        List[Dict[str, object]]: Mỗi phát hiện có index, n, kind ('shared_prime' hoặc 'duplicate'),
+            factor (thừa số tìm được, nếu có) và peers (chỉ số khóa liên quan)
+            - Each finding has index, n, kind ('shared_prime' or 'duplicate'),
+            factor (recovered factor, if any) and peers (indices of related keys)
+    """
+    # Gộp module trùng - Group duplicate moduli
+    positions: Dict[int, List[int]] = {}
+    for index, (_, n) in enumerate(keys):
+        positions.setdefault(n, []).append(index)
+    unique = list(positions)
+
+    findings = []
+    for n, indices in positions.items():
+        if len(indices) > 1:
+            for index in indices:
+                findings.append({'index': index, 'n': n, 'kind': 'duplicate', 'factor': None,
+                                 'peers': [peer for peer in indices if peer != index]})
+
+    gcds = batch_gcd(unique)
+    flagged = [(n, g) for n, g in zip(unique, gcds) if g > 1]
+    for n, g in flagged:
+        factor = g if g < n else None
+        peers = []
+        for other, _ in flagged:
+            if other == n:
+                continue
+            common = math.gcd(n, other)
+            if common > 1:
+                peers.extend(positions[other])
+                if factor is None and common < n:
+                    factor = common
+        for index in positions[n]:
+            findings.append({'index': index, 'n': n, 'kind': 'shared_prime', 'factor': factor,
+                             'peers': sorted(peers)})
+
+    return sorted(findings, key=lambda finding: finding['index'])
+
+
+def _parse_number(text: str) -> int:
+    """Đọc số thập phân hoặc 0x hex - Parse a decimal or 0x hex number"""
+    text = text.strip()
+    return int(text, 16) if text[:2].lower() == '0x' else int(text)
+
+
+def parse_public_key(line: str) -> PublicKey:
+    """
+    Đọc một khóa công khai từ một dòng - Parse one public key from a line
+
+    Args:
+        line: "e n", "e,n" hoặc JSON - "e n", "e,n" or JSON
+
+    Returns:
+        PublicKey: (e, n)
+
+    Raises:
+        ValueError: Nếu dòng không đúng định dạng - If the line is malformed
+    """
+    line = line.strip()
+    if line.startswith('{'):
+        record = json.loads(line)
+        record = record.get('key_info', record)
+        return int(record['e']), int(record['n'])
+    parts = line.replace(',', ' ').split()
+    if len(parts) != 2:
+        raise ValueError(f"Cần 'e n' - Expected 'e n': {line[:64]}")
+    return _parse_number(parts[0]), _parse_number(parts[1])
+
+
+def load_public_keys(path: str) -> Iterator[PublicKey]:
+    """
+    Đọc khóa công khai từ file, bỏ dòng trống và dòng chú thích #
+    Read public keys from a file, skipping blank lines and # comments
+
+    Args:
+        path: Đường dẫn file - File path
+
+    Yields:
+        PublicKey: Từng khóa (e, n) - Each key (e, n)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield parse_public_key(line)
+
+
+def main(argv: List[str]) -> int:
+    """Điểm vào dòng lệnh - Command-line entry point"""
+    if len(argv) != 1:
+        print("Cách dùng - Usage: python -m crypto.batch_gcd keys.txt", file=sys.stderr)
+        return 2
+
+    keys = list(load_public_keys(argv[0]))
+    findings = find_shared_primes(keys)
+    for finding in findings:
+        n = finding['n']
+        if finding['kind'] == 'duplicate':
+            detail = "module trùng - duplicate modulus"
+        elif finding['factor']:
+            detail = f"n = {finding['factor']} × {n // finding['factor']}"
+        else:
+            detail = "chung số nguyên tố - shares primes"
+        print(f"#{finding['index']}: {detail} (cùng - with {finding['peers']})")
+
+    vulnerable = len({finding['index'] for finding in findings})
+    print(f"{vulnerable}/{len(keys)} khóa yếu - weak keys", file=sys.stderr)
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
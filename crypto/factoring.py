@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Factoring Engine
+Động cơ phân tích thừa số
+
+Phân tích n thành thừa số nguyên tố để cho thấy khóa nhỏ bị phá nhanh thế
+nào: chia thử, Pollard p-1, Pollard rho (phát hiện chu trình Brent) và ECM
+(đường cong Montgomery), tất cả trong một ngân sách thời gian.
+Factors n into primes to show how quickly small keys break: trial division,
+Pollard p-1, Pollard rho (Brent cycle detection) and ECM (Montgomery curves),
+all within a time budget.
+
+Chạy - Run:
+    python -m crypto.factoring 3233
+    python -m crypto.factoring --benchmark [số bit tối đa - max bits]
+"""
+
+import math
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .rsa_engine import RSAEngine, CancellationToken, SMALL_PRIME_TABLE
+
+# Tên phương pháp - Method names
+METHOD_TRIAL_DIVISION = 'trial_division'
+METHOD_P_MINUS_1 = 'pollard_p_minus_1'
+METHOD_RHO = 'pollard_rho_brent'
+METHOD_ECM = 'ecm'
+METHOD_SQUARE = 'perfect_square'
+
+# Ngân sách thời gian mặc định (giây) - Default time budget in seconds
+DEFAULT_TIME_BUDGET = 10.0
+
+# Cận B1 của Pollard p-1 - Pollard p-1 bound B1
+P_MINUS_1_BOUND = 20000
+
+# Số vòng rho tối đa trước khi chuyển sang ECM (thừa số ~36 bit)
+# Rho iterations before switching to ECM (factors up to ~36 bits)
+RHO_MAX_ITERATIONS = 1 << 18
+
+# Số vòng giữa hai lần tính gcd trong rho - Rho iterations per batched gcd
+RHO_BATCH = 128
+
+# Lịch cận B1 của ECM và số đường cong mỗi mức (theo bảng GMP-ECM)
+# ECM B1 schedule and curves per level (after the GMP-ECM table)
+ECM_SCHEDULE = ((2000, 25), (11000, 90), (50000, 300), (250000, 700))
+
+# Bước lớn của giai đoạn 2 ECM - ECM stage 2 giant step
+ECM_STAGE2_STEP = 2310
+
+# Kích thước mặc định của bảng đo - Default benchmark sizes
+BENCHMARK_BITS = (16, 24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 100)
+
+
+class FactoringTimeout(Exception):
+    """Hết ngân sách thời gian - The time budget ran out"""
+
+
+class FactorResult(NamedTuple):
+    """Kết quả phân tích - Factoring result"""
+
+    factors: List[int]  # Thừa số nguyên tố đã tìm, có lặp, tăng dần - Prime factors found, with multiplicity, sorted
+    cofactor: int  # Phần chưa phân tích được (1 nếu xong) - Unfactored remainder (1 when done)
+    methods: List[str]  # Phương pháp đã tách được từng thừa số - Methods that split off each factor
+    elapsed: float  # Thời gian chạy (giây) - Running time in seconds
+
+    @property
+    def complete(self) -> bool:
+        """Đã phân tích hết chưa - Whether n was factored completely"""
+        return self.cofactor == 1
+
+
+class _Budget:
+    """Hạn chót và cờ hủy dùng chung cho mọi phương pháp - Deadline and cancel token shared by every method"""
+
+    def __init__(self, seconds: Optional[float], cancel_token: Optional[CancellationToken]):
+        self.deadline = None if seconds is None else time.perf_counter() + seconds
+        self.cancel_token = cancel_token
+
+    def check(self):
+        """Dừng nếu bị hủy hoặc hết giờ - Stop when cancelled or out of time"""
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise FactoringTimeout("Hết ngân sách thời gian - Time budget exhausted")
+
+
+def trial_division(n: int, primes: Sequence[int] = SMALL_PRIME_TABLE) -> Tuple[List[int], int]:
+    """
+    Chia thử bằng bảng số nguyên tố nhỏ - Trial division by the small-prime table
+
+    Args:
+        n: Số cần phân tích (> 0) - Number to factor (> 0)
+        primes: Các số nguyên tố tăng dần - Increasing primes
+
+    Returns:
+        Tuple[List[int], int]: (thừa số tìm được, phần còn lại) - (factors found, remainder)
+    """
+    factors = []
+    for prime in primes:
+        if prime * prime > n:
+            break
+        while n % prime == 0:
+            factors.append(prime)
+            n //= prime
+    # Phần còn lại nhỏ hơn bình phương số chia cuối thì là số nguyên tố
+    # A remainder below the square of the last divisor tried is prime
+    if 1 < n and primes and n < primes[-1] ** 2:
+        factors.append(n)
+        n = 1
+    return factors, n
+
+
+def pollard_p_minus_1(n: int, bound: int = P_MINUS_1_BOUND,
+                      budget: Optional[_Budget] = None) -> Optional[int]:
+    """
+    Pollard p-1: tìm p khi p-1 chỉ có ước nguyên tố nhỏ hơn bound
+    Pollard p-1: finds p when every prime factor of p-1 is below bound
+
+    Args:
+        n: Hợp số lẻ - Odd composite
+        bound: Cận B1 - Bound B1
+        budget: Ngân sách thời gian - Time budget
+
+    Returns:
+        Optional[int]: Thừa số không tầm thường, hoặc None - Non-trivial factor, or None
+    """
+    a = 2
+    for index, prime in enumerate(SMALL_PRIME_TABLE):
+        if prime > bound:
+            break
+        # a ← a^(p^k) với p^k ≤ bound - a ← a^(p^k) with p^k ≤ bound
+        power = prime
+        while power * prime <= bound:
+            power *= prime
+        a = pow(a, power, n)
+        if index % 256 == 255:
+            if budget is not None:
+                budget.check()
+            g = math.gcd(a - 1, n)
+            if 1 < g < n:
+                return g
+            if g == n:
+                return None
+    g = math.gcd(a - 1, n)
+    return g if 1 < g < n else None
+
+
+def pollard_rho_brent(n: int, max_iterations: Optional[int] = None,
+                      budget: Optional[_Budget] = None) -> Optional[int]:
+    """
+    Pollard rho với phát hiện chu trình Brent và gcd theo lô
+    Pollard rho with Brent cycle detection and batched gcds
+
+    Args:
+        n: Hợp số lẻ - Odd composite
+        max_iterations: Số vòng tối đa, None là không giới hạn - Iteration cap, None for unlimited
+        budget: Ngân sách thời gian - Time budget
+
+    Returns:
+        Optional[int]: Thừa số không tầm thường, hoặc None - Non-trivial factor, or None
+    """
+    if n % 2 == 0:
+        return 2
+
+    iterations = 0
+    while max_iterations is None or iterations < max_iterations:
+        # Mỗi lần thất bại thử một đa thức x² + c mới - Each failure retries with a new polynomial x² + c
+        y, c = random.randrange(1, n), random.randrange(1, n)
+        g = r = q = 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += RHO_BATCH
+            iterations += r
+            r *= 2
+            if budget is not None:
+                budget.check()
+            if max_iterations is not None and iterations >= max_iterations and g == 1:
+                return None
+
+        if g == n:
+            # Lô vượt qua thừa số: lùi lại từng bước - The batch overshot: step back one at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    return None
+
+
+def _ecm_double(x: int, z: int, a24: int, n: int) -> Tuple[int, int]:
+    """Nhân đôi điểm trên đường cong Montgomery - Double a point on a Montgomery curve"""
+    s = (x + z) * (x + z) % n
+    d = (x - z) * (x - z) % n
+    t = s - d
+    return s * d % n, t * (d + a24 * t) % n
+
+
+def _ecm_add(p: Tuple[int, int], q: Tuple[int, int], diff: Tuple[int, int], n: int) -> Tuple[int, int]:
+    """Cộng hai điểm khi biết hiệu của chúng - Add two points given their difference"""
+    u = (p[0] - p[1]) * (q[0] + q[1]) % n
+    v = (p[0] + p[1]) * (q[0] - q[1]) % n
+    return diff[1] * (u + v) * (u + v) % n, diff[0] * (u - v) * (u - v) % n
+
+
+def _ecm_multiply(k: int, point: Tuple[int, int], a24: int, n: int) -> Tuple[int, int]:
+    """Nhân vô hướng bằng thang Montgomery - Scalar multiplication with the Montgomery ladder"""
+    if k == 1:
+        return point
+    r0, r1 = point, _ecm_double(point[0], point[1], a24, n)
+    for bit in bin(k)[3:]:
+        if bit == '1':
+            r0, r1 = _ecm_add(r1, r0, point, n), _ecm_double(r1[0], r1[1], a24, n)
+        else:
+            r0, r1 = _ecm_double(r0[0], r0[1], a24, n), _ecm_add(r0, r1, point, n)
+    return r0
+
+
+def ecm_curve(n: int, b1: int, b2: Optional[int] = None,
+              budget: Optional[_Budget] = None) -> Optional[int]:
+    """
+    Thử một đường cong ECM ngẫu nhiên (tham số Suyama) - Try one random ECM curve (Suyama parametrization)
+
+    Giai đoạn 1 nhân điểm với mọi lũy thừa nguyên tố ≤ B1; giai đoạn 2 so
+    khớp m·D·P với j·P cho mọi số nguyên tố mD ± j ≤ B2.
+    Stage 1 multiplies the point by every prime power ≤ B1; stage 2 matches
+    m·D·P against j·P for every prime mD ± j ≤ B2.
+
+    Args:
+        n: Hợp số lẻ không chia hết cho 2, 3 - Odd composite not divisible by 2 or 3
+        b1: Cận giai đoạn 1 - Stage 1 bound
+        b2: Cận giai đoạn 2 (mặc định 100·B1) - Stage 2 bound (default 100·B1)
+        budget: Ngân sách thời gian - Time budget
+
+    Returns:
+        Optional[int]: Thừa số không tầm thường, hoặc None - Non-trivial factor, or None
+    """
+    b2 = 100 * b1 if b2 is None else b2
+    sigma = random.randrange(6, n - 1)
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+
+    # a24 = (A + 2) / 4 = (v - u)³(3u + v) / (16u³v); phép nghịch đảo thất bại cũng cho thừa số
+    # a24 = (A + 2) / 4 = (v - u)³(3u + v) / (16u³v); a failed inverse also yields a factor
+    denominator = 16 * x * v % n
+    g = math.gcd(denominator, n)
+    if g != 1:
+        return g if g != n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+
+    # Giai đoạn 1 - Stage 1
+    point = (x, z)
+    for index, prime in enumerate(SMALL_PRIME_TABLE):
+        if prime > b1:
+            break
+        power = prime
+        while power * prime <= b1:
+            power *= prime
+        point = _ecm_multiply(power, point, a24, n)
+        if budget is not None and index % 128 == 127:
+            budget.check()
+    g = math.gcd(point[1], n)
+    if g != 1:
+        return g if g != n else None
+
+    # Giai đoạn 2: bước nhỏ j·P với j lẻ, nguyên tố cùng nhau với D
+    # Stage 2: baby steps j·P for odd j coprime to D
+    step = ECM_STAGE2_STEP
+    one = point
+    two = _ecm_double(point[0], point[1], a24, n)
+    odd_multiples = {1: one}
+    previous, current = one, _ecm_add(two, one, one, n)
+    for j in range(3, step // 2, 2):
+        odd_multiples[j] = current
+        previous, current = current, _ecm_add(current, two, previous, n)
+    baby = [odd_multiples[j] for j in odd_multiples if math.gcd(j, step) == 1]
+
+    # Bước lớn m·D·P - Giant steps m·D·P
+    giant = _ecm_multiply(step, point, a24, n)
+    m = max(1, b1 // step)
+    prev_r = _ecm_multiply((m - 1) * step, point, a24, n) if m > 1 else point
+    r = _ecm_multiply(m * step, point, a24, n)
+    accumulator = 1
+    while m * step - step // 2 <= b2:
+        xr, zr = r
+        for xj, zj in baby:
+            accumulator = accumulator * (xr * zj - xj * zr) % n
+        if budget is not None:
+            budget.check()
+        if m == 1:
+            # (m-1)·D·P là điểm vô cực: dùng D·P làm hiệu - (m-1)·D·P is the point at infinity: use D·P as difference
+            prev_r, r = r, _ecm_double(r[0], r[1], a24, n)
+        else:
+            prev_r, r = r, _ecm_add(r, giant, prev_r, n)
+        m += 1
+    g = math.gcd(accumulator, n)
+    return g if 1 < g < n else None
+
+
+def _split(n: int, budget: _Budget) -> Tuple[int, str]:
+    """
+    Tách một hợp số lẻ không có ước nhỏ - Split an odd composite with no small factors
+
+    Returns:
+        Tuple[int, str]: (thừa số, phương pháp) - (factor, method)
+    """
+    root = math.isqrt(n)
+    if root * root == n:
+        return root, METHOD_SQUARE
+
+    factor = pollard_p_minus_1(n, budget=budget)
+    if factor:
+        return factor, METHOD_P_MINUS_1
+
+    factor = pollard_rho_brent(n, RHO_MAX_ITERATIONS, budget)
+    if factor:
+        return factor, METHOD_RHO
+
+    while True:
+        for b1, curves in ECM_SCHEDULE:
+            for _ in range(curves):
+                factor = ecm_curve(n, b1, budget=budget)
+                if factor:
+                    return factor, METHOD_ECM
+
+
+def factor(n: int, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+           cancel_token: Optional[CancellationToken] = None) -> FactorResult:
+    """
+    Phân tích n thành thừa số nguyên tố - Factor n into primes
+
+    Chia thử trước, rồi với mỗi hợp số còn lại lần lượt thử Pollard p-1,
+    Pollard rho (giới hạn số vòng) và ECM với cận tăng dần. Hết ngân sách thì
+    trả về kết quả dở dang thay vì báo lỗi.
+    Trial division first; each remaining composite then tries Pollard p-1,
+    Pollard rho (capped) and ECM with growing bounds. When the budget runs out
+    a partial result is returned instead of raising.
+
+    Args:
+        n: Số cần phân tích (> 1) - Number to factor (> 1)
+        time_budget: Thời gian tối đa (giây), None là không giới hạn - Maximum seconds, None for unlimited
+        cancel_token: Cờ hủy hợp tác - Cooperative cancellation token
+
+    Returns:
+        FactorResult: Thừa số, phần còn lại, phương pháp, thời gian - Factors, remainder, methods, time
+    """
+    if n < 2:
+        raise ValueError(f"Cần n > 1 - n must be > 1: {n}")
+
+    start = time.perf_counter()
+    budget = _Budget(time_budget, cancel_token)
+    engine = RSAEngine()
+
+    factors, remainder = trial_division(n)
+    methods = [METHOD_TRIAL_DIVISION] * len(factors)
+    pending = [remainder] if remainder > 1 else []
+    cofactor = 1
+
+    while pending:
+        m = pending.pop()
+        if engine.is_prime(m, k=20):
+            factors.append(m)
+            continue
+        try:
+            found, method = _split(m, budget)
+        except FactoringTimeout:
+            cofactor *= m
+            cofactor *= math.prod(pending)
+            break
+        methods.append(method)
+        pending.extend((found, m // found))
+
+    return FactorResult(sorted(factors), cofactor, methods, time.perf_counter() - start)
+
+
+def euler_phi(factors: Sequence[int]) -> int:
+    """
+    φ(n) từ các thừa số nguyên tố (có lặp) - φ(n) from prime factors (with multiplicity)
+
+    Args:
+        factors: Thừa số nguyên tố - Prime factors
+
+    Returns:
+        int: φ(n)
+    """
+    phi = 1
+    for prime in set(factors):
+        multiplicity = factors.count(prime)
+        phi *= (prime - 1) * prime ** (multiplicity - 1)
+    return phi
+
+
+def break_key(e: int, n: int, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+              cancel_token: Optional[CancellationToken] = None) -> Dict[str, object]:
+    """
+    Khôi phục khóa bí mật từ khóa công khai bằng cách phân tích n
+    Recover the private key from the public key by factoring n
+
+    Args:
+        e: Số mũ công khai - Public exponent
+        n: Module RSA - RSA modulus
+        time_budget: Thời gian tối đa (giây) - Maximum seconds
+        cancel_token: Cờ hủy hợp tác - Cooperative cancellation token
+
+    Returns:
+        Dict[str, object]: factors, methods, phi, d, elapsed
+
+    Raises:
+        ValueError: Nếu không phân tích xong trong ngân sách - If n is not factored within the budget
+    """
+    result = factor(n, time_budget, cancel_token)
+    if not result.complete:
+        raise ValueError(f"Không phân tích được n trong {time_budget} s - Could not factor n within "
+                         f"{time_budget} s (còn lại - remaining {result.cofactor.bit_length()} bit)")
+    phi = euler_phi(result.factors)
+    return {
+        'factors': result.factors,
+        'methods': result.methods,
+        'phi': phi,
+        'd': pow(e, -1, phi),
+        'elapsed': result.elapsed,
+    }
+
+
+def benchmark_factoring(bit_sizes: Sequence[int] = BENCHMARK_BITS, trials: int = 3,
+                        time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+                        progress: Optional[Callable[[dict], None]] = None,
+                        cancel_token: Optional[CancellationToken] = None) -> List[dict]:
+    """
+    Đo thời gian phân tích theo kích thước module - Measure factoring time against modulus size
+
+    Mỗi kích thước dùng các module hai số nguyên tố cân bằng như khi tạo khóa.
+    Dừng ở kích thước đầu tiên vượt ngân sách.
+    Each size uses balanced two-prime moduli, as produced by key generation.
+    Stops at the first size that exceeds the budget.
+
+    Args:
+        bit_sizes: Các số bit của n - Bit sizes of n
+        trials: Số module mỗi kích thước - Moduli per size
+        time_budget: Ngân sách mỗi lần phân tích (giây) - Budget per factorization (seconds)
+        progress: Callback nhận mỗi dòng kết quả - Callback receiving each result row
+        cancel_token: Cờ hủy hợp tác - Cooperative cancellation token
+
+    Returns:
+        List[dict]: Mỗi dòng có bits, seconds (trung vị), methods, complete
+            - Each row has bits, seconds (median), methods, complete
+    """
+    engine = RSAEngine()
+    rows = []
+    for bits in bit_sizes:
+        timings, methods, complete = [], set(), True
+        for _ in range(trials):
+            # Điểm hủy giữa các kích thước và các lần thử - Cancellation point between sizes and trials
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            p = engine.generate_prime(bits // 2, cancel_token=cancel_token)
+            q = engine.generate_prime(bits - bits // 2, cancel_token=cancel_token)
+            while q == p:
+                q = engine.generate_prime(bits - bits // 2, cancel_token=cancel_token)
+            result = factor(p * q, time_budget, cancel_token)
+            timings.append(result.elapsed)
+            methods.update(result.methods)
+            complete = complete and result.complete
+        row = {'bits': bits, 'seconds': statistics.median(timings),
+               'methods': sorted(methods), 'complete': complete}
+        rows.append(row)
+        if progress is not None:
+            progress(row)
+        if not complete:
+            break
+    return rows
+
+
+def main(argv: List[str]) -> int:
+    """Điểm vào dòng lệnh - Command-line entry point"""
+    if argv and argv[0] == '--benchmark':
+        max_bits = int(argv[1]) if len(argv) > 1 else BENCHMARK_BITS[-1]
+        print(f"{'bit':>5}  {'giây - s':>10}  phương pháp - methods", file=sys.stderr)
+        benchmark_factoring([bits for bits in BENCHMARK_BITS if bits <= max_bits],
+                            progress=lambda row: print(
+                                f"{row['bits']:>5}  {row['seconds']:>10.4f}  {', '.join(row['methods'])}"
+                                + ("" if row['complete'] else "  (hết giờ - timed out)")))
+        return 0
+
+    if len(argv) != 1:
+        print("Cách dùng - Usage: python -m crypto.factoring N | --benchmark [max_bits]", file=sys.stderr)
+        return 2
+
+    result = factor(int(argv[0]))
+    print(" × ".join(map(str, result.factors + ([result.cofactor] if result.cofactor > 1 else []))))
+    print(f"{result.elapsed:.4f} s, {', '.join(result.methods) or METHOD_TRIAL_DIVISION}"
+          + ("" if result.complete else " (chưa xong - incomplete)"), file=sys.stderr)
+    return 0 if result.complete else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
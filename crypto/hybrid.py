@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming Hybrid Encryption
+Mã hóa lai dạng luồng
+
+rsa_encrypt chỉ mã hóa một số nguyên nhỏ hơn n. Module này mã hóa luồng byte
+tùy ý: một khóa AES-256 ngẫu nhiên được bọc bằng RSA-OAEP (SHA-256), rồi dữ
+liệu được mã hóa theo từng khối bằng AES-GCM. Bộ nhớ dùng không đổi theo kích
+thước dữ liệu nên đọc được cả file lẫn pipe.
+rsa_encrypt only encrypts a single integer below n. This module encrypts
+arbitrary byte streams: a random AES-256 key is wrapped with RSA-OAEP
+(SHA-256), then the payload is encrypted chunk by chunk with AES-GCM. Memory
+use is constant in the payload size, so files and pipes both work.
+
+Định dạng hybrid-v1 - hybrid-v1 format:
+    MAGIC | chunk_size (>I) | độ dài khóa bọc - wrapped key length (>H) | khóa bọc - wrapped key
+    rồi các bản ghi - then records: AES-GCM(khối - chunk) | thẻ - tag (16 byte)
+
+Nonce của khối i là i (12 byte big-endian); dữ liệu xác thực kèm là header
+cùng cờ khối cuối. Mọi khối trừ khối cuối đều đầy, khối cuối luôn ngắn hơn
+(có thể rỗng), nên cắt bớt hay đổi thứ tự khối đều bị phát hiện.
+The nonce of chunk i is i (12 bytes big-endian); the associated data is the
+header plus a final-chunk flag. Every chunk but the last is full and the last
+is always shorter (possibly empty), so truncation and reordering are detected.
+
+Chạy - Run:
+    python -m crypto.hybrid encrypt E N [input] [output]
+    python -m crypto.hybrid decrypt E D N [input] [output]
+"""
+
+import os
+import struct
+import sys
+import tempfile
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# Định danh định dạng có phiên bản - Versioned format identifier
+MAGIC = b'RSAHYB1\x00'
+
+# Kích thước khối mặc định - Default chunk size (64 KiB)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Khối lớn nhất - Largest chunk size (16 MiB)
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Khóa AES-256 và thẻ GCM - AES-256 key and GCM tag sizes
+KEY_BYTES = 32
+TAG_BYTES = 16
+
+_HEADER = struct.Struct('>8sIH')
+
+# OAEP với SHA-256 cần n ≥ 2·32 + 2 + 32 byte - OAEP with SHA-256 needs n ≥ 2·32 + 2 + 32 bytes
+_HASH_BYTES = 32
+MIN_MODULUS_BYTES = 2 * _HASH_BYTES + 2 + KEY_BYTES
+
+_FINAL = b'\x01'
+_NOT_FINAL = b'\x00'
+
+
+def _oaep() -> padding.OAEP:
+    """Đệm OAEP với SHA-256 - OAEP padding with SHA-256"""
+    return padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+
+
+def _check_modulus(n: int):
+    """Báo lỗi nếu n quá nhỏ để bọc khóa AES - Raise if n is too small to wrap an AES key"""
+    if (n.bit_length() + 7) // 8 < MIN_MODULUS_BYTES:
+        raise ValueError(f"Module quá nhỏ cho RSA-OAEP: cần ít nhất {MIN_MODULUS_BYTES * 8} bit "
+                         f"- Modulus too small for RSA-OAEP: needs at least {MIN_MODULUS_BYTES * 8} bits, "
+                         f"got {n.bit_length()}")
+
+
+def _check_chunk_size(chunk_size: int):
+    """Kiểm tra kích thước khối - Validate the chunk size"""
+    if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"Kích thước khối phải trong (0, {MAX_CHUNK_SIZE}] "
+                         f"- Chunk size must be in (0, {MAX_CHUNK_SIZE}]: {chunk_size}")
+
+
+def _nonce(index: int) -> bytes:
+    """Nonce của khối thứ index - Nonce of chunk number index"""
+    return index.to_bytes(12, 'big')
+
+
+def _read_full(source: BinaryIO, view: memoryview) -> int:
+    """
+    Đọc đến khi đầy bộ đệm hoặc hết luồng (pipe có thể trả về ít hơn)
+    Read until the buffer is full or the stream ends (pipes may return short reads)
+    """
+    filled = 0
+    while filled < len(view):
+        count = source.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+
+def public_key_object(public_key: Tuple[int, int]) -> rsa.RSAPublicKey:
+    """
+    Tạo khóa công khai của cryptography - Build a cryptography public key
+
+    Args:
+        public_key: Khóa công khai (e, n) - Public key
+
+    Returns:
+        rsa.RSAPublicKey: Khóa công khai - Public key object
+
+    Raises:
+        ValueError: Nếu n quá nhỏ cho RSA-OAEP - If n is too small for RSA-OAEP
+    """
+    e, n = public_key
+    _check_modulus(n)
+    return rsa.RSAPublicNumbers(e, n).public_key()
+
+
+def private_key_object(private_key: Tuple[int, int], e: int,
+                       primes: Optional[Sequence[int]] = None) -> rsa.RSAPrivateKey:
+    """
+    Tạo khóa bí mật của cryptography - Build a cryptography private key
+
+    Không có p, q thì khôi phục chúng từ e và d.
+    Without p and q they are recovered from e and d.
+
+    Args:
+        private_key: Khóa bí mật (d, n) - Private key
+        e: Số mũ công khai - Public exponent
+        primes: Hai thừa số nguyên tố, nếu biết - The two prime factors, if known
+
+    Returns:
+        rsa.RSAPrivateKey: Khóa bí mật - Private key object
+
+    Raises:
+        ValueError: Nếu n quá nhỏ hoặc khóa có hơn hai số nguyên tố
+            - If n is too small or the key has more than two primes
+    """
+    d, n = private_key
+    _check_modulus(n)
+    if primes is None:
+        try:
+            p, q = rsa.rsa_recover_prime_factors(n, e, d)
+        except ValueError:
+            p = q = None
+    elif len(primes) == 2:
+        p, q = primes
+    else:
+        raise ValueError(f"RSA-OAEP của cryptography chỉ hỗ trợ khóa hai số nguyên tố "
+                         f"- cryptography's RSA-OAEP only supports two-prime keys: {len(primes)} primes")
+    # Với khóa nhiều số nguyên tố, việc khôi phục thất bại hoặc trả về một thừa số
+    # hợp số: p × q = n nhưng e × d ≢ 1 theo q - 1
+    # For a multi-prime key, recovery fails or returns a composite factor:
+    # p × q = n but e × d ≢ 1 modulo q - 1
+    if p is None or p * q != n or (e * d - 1) % (p - 1) or (e * d - 1) % (q - 1):
+        raise ValueError("RSA-OAEP của cryptography chỉ hỗ trợ khóa hai số nguyên tố p × q = n "
+                         "- cryptography's RSA-OAEP only supports two-prime keys p × q = n")
+    numbers = rsa.RSAPrivateNumbers(p, q, d, rsa.rsa_crt_dmp1(d, p), rsa.rsa_crt_dmq1(d, q),
+                                    rsa.rsa_crt_iqmp(p, q), rsa.RSAPublicNumbers(e, n))
+    return numbers.private_key()
+
+
+def encrypt_stream(source: BinaryIO, destination: BinaryIO, public_key: Tuple[int, int],
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Mã hóa một luồng byte - Encrypt a byte stream
+
+    Args:
+        source: Luồng vào nhị phân (file hoặc pipe) - Binary input stream (file or pipe)
+        destination: Luồng ra nhị phân - Binary output stream
+        public_key: Khóa công khai (e, n) - Public key
+        chunk_size: Kích thước khối - Chunk size in bytes
+
+    Returns:
+        int: Số byte bản rõ đã mã hóa - Plaintext bytes encrypted
+
+    Raises:
+        ValueError: Nếu n quá nhỏ hoặc kích thước khối sai - If n is too small or the chunk size is invalid
+    """
+    _check_chunk_size(chunk_size)
+    key_object = public_key_object(public_key)
+
+    key = AESGCM.generate_key(bit_length=KEY_BYTES * 8)
+    wrapped = key_object.encrypt(key, _oaep())
+    header = _HEADER.pack(MAGIC, chunk_size, len(wrapped)) + wrapped
+    destination.write(header)
+
+    aead = AESGCM(key)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    total = 0
+    index = 0
+    while True:
+        count = _read_full(source, view)
+        # Khối ngắn hơn chunk_size là khối cuối - A chunk shorter than chunk_size is the last one
+        final = count < chunk_size
+        destination.write(aead.encrypt(_nonce(index), view[:count],
+                                       header + (_FINAL if final else _NOT_FINAL)))
+        total += count
+        index += 1
+        if final:
+            return total
+
+
+def decrypt_stream(source: BinaryIO, destination: BinaryIO, private_key: Tuple[int, int], e: int,
+                   primes: Optional[Sequence[int]] = None) -> int:
+    """
+    Giải mã một luồng do encrypt_stream tạo - Decrypt a stream produced by encrypt_stream
+
+    Mỗi khối được xác thực trước khi ghi ra. Khi có lỗi, phần đã ghi phải bị bỏ.
+    Each chunk is authenticated before it is written. On error, whatever was
+    already written must be discarded.
+
+    Args:
+        source: Luồng vào nhị phân - Binary input stream
+        destination: Luồng ra nhị phân - Binary output stream
+        private_key: Khóa bí mật (d, n) - Private key
+        e: Số mũ công khai - Public exponent
+        primes: Hai thừa số nguyên tố, nếu biết - The two prime factors, if known
+
+    Returns:
+        int: Số byte bản rõ đã giải mã - Plaintext bytes decrypted
+
+    Raises:
+        ValueError: Nếu định dạng sai, sai khóa, dữ liệu bị sửa hoặc bị cắt
+            - If the format is wrong, the key is wrong, or the data was modified or truncated
+    """
+    key_object = private_key_object(private_key, e, primes)
+
+    fixed = source.read(_HEADER.size)
+    if len(fixed) != _HEADER.size:
+        raise ValueError("Thiếu header - Missing header")
+    magic, chunk_size, wrapped_length = _HEADER.unpack(fixed)
+    if magic != MAGIC:
+        raise ValueError("Không phải định dạng hybrid-v1 - Not in hybrid-v1 format")
+    _check_chunk_size(chunk_size)
+    if wrapped_length != (key_object.key_size + 7) // 8:
+        raise ValueError("Khóa bọc không khớp với module - Wrapped key does not match the modulus")
+    wrapped = source.read(wrapped_length)
+    header = fixed + wrapped
+
+    try:
+        key = key_object.decrypt(wrapped, _oaep())
+    except ValueError:
+        raise ValueError("Không mở được khóa bọc: sai khóa hoặc dữ liệu hỏng "
+                         "- Cannot unwrap the key: wrong key or corrupted data") from None
+    aead = AESGCM(key)
+
+    record_size = chunk_size + TAG_BYTES
+    buffer = bytearray(record_size)
+    view = memoryview(buffer)
+    total = 0
+    index = 0
+    while True:
+        count = _read_full(source, view)
+        if count == 0:
+            raise ValueError("Dữ liệu bị cắt: thiếu khối cuối - Data truncated: missing final chunk")
+        final = count < record_size
+        try:
+            plaintext = aead.decrypt(_nonce(index), view[:count], header + (_FINAL if final else _NOT_FINAL))
+        except InvalidTag:
+            raise ValueError(f"Khối {index} bị sửa hoặc sai khóa - Chunk {index} was modified or the key "
+                             f"is wrong") from None
+        destination.write(plaintext)
+        total += len(plaintext)
+        index += 1
+        if final:
+            return total
+
+
+def _open_input(path: str) -> BinaryIO:
+    """Mở file vào, '-' là stdin - Open the input file, '-' means stdin"""
+    return sys.stdin.buffer if path == '-' else open(path, 'rb')
+
+
+def _open_output(path: str) -> Tuple[BinaryIO, Optional[str]]:
+    """
+    Mở file tạm cạnh file ra, '-' là stdout - Open a temporary file next to the output, '-' means stdout
+
+    File ra chỉ bị thay khi thành công, nên lỗi không làm hỏng file cũ và không
+    để lại bản rõ dở dang.
+    The output is only replaced on success, so a failure neither damages an
+    existing file nor leaves partial plaintext behind.
+
+    Returns:
+        Tuple[BinaryIO, Optional[str]]: (luồng ra, đường dẫn file tạm hoặc None)
+            - (output stream, temporary file path or None)
+    """
+    if path == '-':
+        return sys.stdout.buffer, None
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+    return os.fdopen(fd, 'wb'), temp_path
+
+
+def main(argv: List[str]) -> int:
+    """Điểm vào dòng lệnh - Command-line entry point"""
+    usage = ("Cách dùng - Usage: python -m crypto.hybrid encrypt E N [input] [output]\n"
+             "                   python -m crypto.hybrid decrypt E D N [input] [output]")
+    key_counts = {'encrypt': 2, 'decrypt': 3}
+    if not argv or argv[0] not in key_counts or not 0 <= len(argv) - 1 - key_counts[argv[0]] <= 2:
+        print(usage, file=sys.stderr)
+        return 2
+
+    command = argv[0]
+    input_path, output_path = (argv[1 + key_counts[command]:] + ['-', '-'])[:2]
+    try:
+        # Số thập phân hoặc 0x hex - Decimal or 0x hex numbers
+        numbers = [int(text, 0) for text in argv[1:1 + key_counts[command]]]
+
+        # Kiểm tra khóa trước khi chạm vào file - Validate the key before touching any file
+        if command == 'encrypt':
+            e, n = numbers
+            public_key_object((e, n))
+        else:
+            e, d, n = numbers
+            private_numbers = private_key_object((d, n), e).private_numbers()
+            primes = (private_numbers.p, private_numbers.q)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    source = destination = temp_path = None
+    try:
+        source = _open_input(input_path)
+        destination, temp_path = _open_output(output_path)
+        if command == 'encrypt':
+            total = encrypt_stream(source, destination, (e, n))
+        else:
+            total = decrypt_stream(source, destination, (d, n), e, primes)
+        destination.flush()
+        if temp_path is not None:
+            destination.close()
+            os.replace(temp_path, output_path)
+            temp_path = None
+    except (ValueError, OSError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    finally:
+        if source is not None and input_path != '-':
+            source.close()
+        if temp_path is not None:
+            # Bỏ kết quả dở dang - Discard the partial output
+            destination.close()
+            os.unlink(temp_path)
+    print(f"{total} byte - bytes", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Key Quality Audit
+Kiểm tra chất lượng khóa
+
+Sàng lọc nhanh các điểm yếu đã biết của khóa RSA trước khi đưa vào sử dụng:
+số mũ e nhỏ hoặc chẵn, thừa số nhỏ, p và q quá gần (Fermat), d nhỏ (Wiener),
+gcd(e, φ(n)) != 1 và, khi kiểm tra cả tập khóa, số nguyên tố dùng chung.
+Mỗi phép kiểm tra bị giới hạn thời gian.
+Quickly screens RSA keys for known weaknesses before they go live: small or
+even e, small factors, p and q too close (Fermat), small d (Wiener),
+gcd(e, φ(n)) != 1 and, when auditing a key set, shared primes. Every check is
+bounded in time.
+
+Chạy - Run:
+    python -m crypto.key_audit keys.txt [--workers N]
+"""
+
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from .rsa_engine import RSAEngine
+from .factoring import trial_division, euler_phi
+from .batch_gcd import PublicKey, find_shared_primes, load_public_keys
+from visualization.number_format import elide_int
+
+# Tên phép kiểm tra - Check names
+CHECK_EXPONENT = 'exponent'
+CHECK_SMALL_FACTOR = 'small_factor'
+CHECK_FERMAT = 'fermat'
+CHECK_WIENER = 'wiener'
+CHECK_PHI_GCD = 'phi_gcd'
+CHECK_SHARED_PRIME = 'shared_prime'
+
+CHECK_TITLES = {
+    CHECK_EXPONENT: "Số mũ e - Exponent e",
+    CHECK_SMALL_FACTOR: "Thừa số nhỏ - Small factors",
+    CHECK_FERMAT: "Fermat (p, q gần nhau - close p, q)",
+    CHECK_WIENER: "Wiener (d nhỏ - small d)",
+    CHECK_PHI_GCD: "gcd(e, φ(n))",
+    CHECK_SHARED_PRIME: "Số nguyên tố dùng chung - Shared primes",
+}
+
+# Trạng thái - Statuses
+STATUS_PASS = 'pass'
+STATUS_WARN = 'warn'
+STATUS_FAIL = 'fail'
+STATUS_SKIPPED = 'skipped'
+
+STATUS_ICONS = {STATUS_PASS: "✅", STATUS_WARN: "⚠️", STATUS_FAIL: "❌", STATUS_SKIPPED: "⏭️"}
+
+# Thời gian tối đa mỗi phép kiểm tra (giây) - Time limit per check in seconds
+DEFAULT_CHECK_BUDGET = 0.25
+
+# Số vòng Fermat tối đa - Maximum Fermat iterations
+FERMAT_ITERATIONS = 1 << 16
+
+# e nhỏ nhất được khuyến nghị (FIPS 186-5: e > 2^16) - Smallest recommended e (FIPS 186-5: e > 2^16)
+MIN_RECOMMENDED_EXPONENT = 65537
+
+# Dưới số khóa này kiểm tra tuần tự, không tạo nhóm tiến trình
+# Below this many keys the audit runs in-process, without a process pool
+POOL_MIN_KEYS = 64
+
+# Bảng số chính phương modulo 64, 63, 65, 11: chỉ ~0.6% ứng viên qua được cả bốn
+# Square tables mod 64, 63, 65, 11: only ~0.6% of candidates pass all four
+_SQUARE_FLAGS = {modulus: bytes(1 if any(x * x % modulus == r for x in range(modulus)) else 0
+                                for r in range(modulus))
+                 for modulus in (64, 63, 65, 11)}
+_RESIDUE_MODULUS = 64 * 63 * 65 * 11
+
+
+class AuditFinding(NamedTuple):
+    """Kết quả một phép kiểm tra - Result of one check"""
+
+    check: str  # Tên phép kiểm tra - Check name
+    status: str  # pass, warn, fail hoặc skipped - pass, warn, fail or skipped
+    detail: str  # Giải thích - Explanation
+
+
+class AuditResult(NamedTuple):
+    """Kết quả kiểm tra một khóa - Audit result of one key"""
+
+    e: int
+    n: int
+    findings: List[AuditFinding]
+    factors: List[int]  # Thừa số đã biết hoặc khôi phục được, tăng dần - Known or recovered factors, sorted
+    elapsed: float  # Thời gian chạy (giây) - Running time in seconds
+
+    @property
+    def passed(self) -> bool:
+        """Không có phép kiểm tra nào thất bại - No check failed"""
+        return all(finding.status != STATUS_FAIL for finding in self.findings)
+
+    @property
+    def issues(self) -> List[AuditFinding]:
+        """Các cảnh báo và lỗi - Warnings and failures"""
+        return [finding for finding in self.findings if finding.status in (STATUS_WARN, STATUS_FAIL)]
+
+
+def format_finding(finding: AuditFinding) -> str:
+    """
+    Một dòng mô tả kết quả kiểm tra - One-line description of a finding
+
+    Args:
+        finding: Kết quả kiểm tra - Finding
+
+    Returns:
+        str: Biểu tượng, tên và giải thích - Icon, title and explanation
+    """
+    return f"{STATUS_ICONS[finding.status]} {CHECK_TITLES[finding.check]}: {finding.detail}"
+
+
+def fermat_factor(n: int, iterations: int = FERMAT_ITERATIONS,
+                  deadline: Optional[float] = None) -> Optional[int]:
+    """
+    Phân tích Fermat: tìm a sao cho a² - n là số chính phương
+    Fermat factorization: find a such that a² - n is a perfect square
+
+    Tìm ra thừa số sau khoảng (p - q)² / (8√n) vòng, nên chỉ thành công khi
+    p và q rất gần nhau.
+    Finds a factor after about (p - q)² / (8√n) iterations, so it only
+    succeeds when p and q are very close.
+
+    Args:
+        n: Module lẻ - Odd modulus
+        iterations: Số vòng tối đa - Maximum iterations
+        deadline: Hạn chót theo time.perf_counter() - Deadline in time.perf_counter() seconds
+
+    Returns:
+        Optional[int]: Thừa số không tầm thường, hoặc None - A non-trivial factor, or None
+    """
+    root = math.isqrt(n)
+    if root * root == n:
+        return root
+    start = root + 1
+
+    # Theo dõi a² - n theo modulo bằng số nhỏ, chỉ tính số lớn khi qua bộ lọc
+    # Track a² - n modulo small numbers, touching big integers only past the filter
+    flags64, flags63, flags65, flags11 = (_SQUARE_FLAGS[modulus] for modulus in (64, 63, 65, 11))
+    residue = (start * start - n) % _RESIDUE_MODULUS
+    step = (2 * start + 1) % _RESIDUE_MODULUS
+    for iteration in range(iterations):
+        if flags64[residue & 63] and flags63[residue % 63] and flags65[residue % 65] and flags11[residue % 11]:
+            a = start + iteration
+            b = math.isqrt(a * a - n)
+            if b * b == a * a - n:
+                return a - b if a - b > 1 else None
+        # (a + 1)² - n = a² - n + 2a + 1
+        residue = (residue + step) % _RESIDUE_MODULUS
+        step = (step + 2) % _RESIDUE_MODULUS
+        if iteration & 4095 == 4095 and deadline is not None and time.perf_counter() > deadline:
+            break
+    return None
+
+
+def fermat_iterations(n: int, p: int, q: int) -> int:
+    """
+    Số vòng fermat_factor cần để tách n = p × q, tính từ p và q đã biết
+    Iterations fermat_factor needs to split n = p × q, computed from known p and q
+
+    Args:
+        n: Module lẻ - Odd modulus
+        p, q: Hai thừa số lẻ của n - The two odd factors of n
+
+    Returns:
+        int: Số vòng - Iteration count
+    """
+    root = math.isqrt(n)
+    if root * root == n:
+        return 0
+    # a = (p + q) / 2 cho a² - n = ((p - q) / 2)² - a = (p + q) / 2 gives a² - n = ((p - q) / 2)²
+    return (p + q) // 2 - (root + 1)
+
+
+def wiener_attack(e: int, n: int, deadline: Optional[float] = None) -> Optional[int]:
+    """
+    Tấn công Wiener: tìm d nhỏ trong các phân số hội tụ của e/n
+    Wiener's attack: find a small d among the convergents of e/n
+
+    Thành công khi d < n^(1/4) / 3, nên chỉ duyệt các phân số hội tụ có mẫu
+    nhỏ hơn n^(1/4). Ứng viên được thử bằng một chữ ký, đúng cho cả khóa
+    nhiều số nguyên tố.
+    Succeeds when d < n^(1/4) / 3, so only convergents with a denominator
+    below n^(1/4) are tried. Candidates are tested with a signature, which
+    also works for multi-prime keys.
+
+    Args:
+        e: Số mũ công khai (< n) - Public exponent (< n)
+        n: Module RSA - RSA modulus
+        deadline: Hạn chót theo time.perf_counter() - Deadline in time.perf_counter() seconds
+
+    Returns:
+        Optional[int]: d khôi phục được, hoặc None - The recovered d, or None
+    """
+    limit = math.isqrt(math.isqrt(n)) + 1
+    witnesses = [(base, pow(base, e, n)) for base in (2, 3)]
+
+    # Phân số hội tụ k/d của e/n - Convergents k/d of e/n
+    numerator, denominator = e, n
+    k_prev, k = 0, 1
+    d_prev, d = 1, 0
+    while denominator:
+        quotient = numerator // denominator
+        numerator, denominator = denominator, numerator - quotient * denominator
+        k_prev, k = k, quotient * k + k_prev
+        d_prev, d = d, quotient * d + d_prev
+        if d > limit:
+            break
+        # e·d = 1 + k·φ(n) nên k chia hết e·d - 1 - e·d = 1 + k·φ(n), so k divides e·d - 1
+        if k and (e * d - 1) % k == 0:
+            if all(pow(signature, d, n) == base % n for base, signature in witnesses):
+                return d
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+    return None
+
+
+def _factors_from_d(e: int, d: int, n: int) -> List[int]:
+    """Tách n = p·q từ d khi φ(n) = n - (p + q) + 1 - Split n = p·q from d using φ(n) = n - (p + q) + 1"""
+    ed = e * d - 1
+    # φ(n) hơi nhỏ hơn n nên k = (e·d - 1) / φ(n) gần (e·d - 1) / n
+    # φ(n) is slightly below n, so k = (e·d - 1) / φ(n) is close to (e·d - 1) / n
+    estimate = ed // n
+    for k in range(max(1, estimate), estimate + 2):
+        if ed % k:
+            continue
+        total = n - ed // k + 1
+        root = math.isqrt(max(total * total - 4 * n, 0))
+        if root * root == total * total - 4 * n and (total + root) % 2 == 0:
+            p = (total + root) // 2
+            if 1 < p < n and n % p == 0:
+                return sorted((p, n // p))
+    return []
+
+
+def _check_exponent(e: int, n: int) -> AuditFinding:
+    """Kiểm tra e lẻ, > 1, < n và đủ lớn - Check that e is odd, > 1, < n and large enough"""
+    try:
+        RSAEngine.validate_public_exponent(e)
+    except ValueError:
+        return AuditFinding(CHECK_EXPONENT, STATUS_FAIL,
+                            f"e = {elide_int(e)}: phải lẻ và > 1 - must be odd and > 1")
+    if e >= n:
+        return AuditFinding(CHECK_EXPONENT, STATUS_FAIL, "e phải nhỏ hơn n - e must be below n")
+    if e < MIN_RECOMMENDED_EXPONENT:
+        return AuditFinding(CHECK_EXPONENT, STATUS_WARN,
+                            f"e = {elide_int(e)} < {MIN_RECOMMENDED_EXPONENT}: RSA không đệm dễ bị tấn công căn bậc e "
+                            f"- unpadded RSA is open to e-th root attacks")
+    return AuditFinding(CHECK_EXPONENT, STATUS_PASS, f"e = {elide_int(e)}")
+
+
+def audit_key(e: int, n: int, primes: Optional[Sequence[int]] = None, d: Optional[int] = None,
+              check_budget: float = DEFAULT_CHECK_BUDGET) -> AuditResult:
+    """
+    Kiểm tra nhanh các điểm yếu đã biết của một khóa - Quickly check one key for known weaknesses
+
+    Chỉ cần khóa công khai; khi biết thừa số nguyên tố hoặc d, các phép kiểm
+    tra dùng trực tiếp chúng. gcd(e, φ(n)) chỉ kiểm tra được khi biết hoặc
+    khôi phục được thừa số.
+    Only the public key is required; when the prime factors or d are known,
+    the checks use them directly. gcd(e, φ(n)) can only be checked when the
+    factors are known or recovered.
+
+    Args:
+        e: Số mũ công khai - Public exponent
+        n: Module RSA - RSA modulus
+        primes: Các thừa số nguyên tố, nếu biết - Prime factors, if known
+        d: Số mũ bí mật, nếu biết - Private exponent, if known
+        check_budget: Thời gian tối đa mỗi phép kiểm tra (giây) - Time limit per check (seconds)
+
+    Returns:
+        AuditResult: Kết quả kiểm tra - Audit result
+
+    Raises:
+        ValueError: Nếu n <= 1 hoặc tích các thừa số khác n - If n <= 1 or the factors do not multiply to n
+    """
+    if n <= 1:
+        raise ValueError(f"Module phải lớn hơn 1 - Modulus must be greater than 1: {n}")
+    if primes and math.prod(primes) != n:
+        raise ValueError("Tích các thừa số khác n - The factors do not multiply to n")
+
+    start = time.perf_counter()
+    engine = RSAEngine()
+    findings = [_check_exponent(e, n)]
+    factors = sorted(primes) if primes else []
+
+    # Thừa số nhỏ, kể cả n chẵn - Small factors, including an even n
+    small, rest = trial_division(n)
+    if small:
+        findings.append(AuditFinding(CHECK_SMALL_FACTOR, STATUS_FAIL,
+                                     f"n chia hết cho - n is divisible by {', '.join(map(str, sorted(set(small))[:4]))}"))
+        if rest == 1 and not factors:
+            factors = small
+    else:
+        findings.append(AuditFinding(CHECK_SMALL_FACTOR, STATUS_PASS,
+                                     "không có thừa số < 2^16 - no factor below 2^16"))
+
+    # p và q quá gần; n chẵn đã bị kiểm tra thừa số nhỏ bắt
+    # p and q too close; an even n is already caught by the small-factor check
+    if n % 2 == 0:
+        findings.append(AuditFinding(CHECK_FERMAT, STATUS_SKIPPED,
+                                     "n chẵn, xem kiểm tra thừa số nhỏ - n is even, see the small-factor check"))
+    elif primes and len(primes) == 2:
+        # Thừa số đã biết: tính thẳng, không cần tìm - Known factors: compute directly, no search
+        p, q = factors
+        gap = (q - p).bit_length()
+        if fermat_iterations(n, p, q) < FERMAT_ITERATIONS:
+            findings.append(AuditFinding(CHECK_FERMAT, STATUS_FAIL,
+                                         f"|p - q| chỉ có {gap} bit, Fermat tách được n - |p - q| has only "
+                                         f"{gap} bits, Fermat splits n"))
+        else:
+            findings.append(AuditFinding(CHECK_FERMAT, STATUS_PASS,
+                                         f"|p - q| có {gap} bit - |p - q| has {gap} bits"))
+    else:
+        split = fermat_factor(n, deadline=time.perf_counter() + check_budget)
+        if split:
+            gap = abs(n // split - split).bit_length()
+            findings.append(AuditFinding(CHECK_FERMAT, STATUS_FAIL,
+                                         f"tách được n, |p - q| chỉ có {gap} bit - split n, |p - q| has only {gap} bits"))
+            if not factors and engine.is_prime(split) and engine.is_prime(n // split):
+                factors = sorted((split, n // split))
+        else:
+            findings.append(AuditFinding(CHECK_FERMAT, STATUS_PASS,
+                                         f"không tách được trong {FERMAT_ITERATIONS} vòng - no split within "
+                                         f"{FERMAT_ITERATIONS} iterations"))
+
+    # d nhỏ - Small d
+    if d is not None:
+        if (3 * d) ** 4 < n:
+            findings.append(AuditFinding(CHECK_WIENER, STATUS_FAIL,
+                                         f"d < n^(1/4) / 3 ({d.bit_length()} bit)"))
+        elif d.bit_length() < 0.292 * n.bit_length():
+            findings.append(AuditFinding(CHECK_WIENER, STATUS_WARN,
+                                         f"d < n^0.292 ({d.bit_length()} bit): Boneh-Durfee"))
+        else:
+            findings.append(AuditFinding(CHECK_WIENER, STATUS_PASS, f"d có {d.bit_length()} bit - d has "
+                                                                    f"{d.bit_length()} bits"))
+    elif e >= n:
+        findings.append(AuditFinding(CHECK_WIENER, STATUS_SKIPPED, "e >= n"))
+    else:
+        recovered = wiener_attack(e, n, deadline=time.perf_counter() + check_budget)
+        if recovered:
+            findings.append(AuditFinding(CHECK_WIENER, STATUS_FAIL, f"khôi phục được d ({recovered.bit_length()} bit) - recovered d ({recovered.bit_length()} bits)"))
+            factors = factors or _factors_from_d(e, recovered, n)
+        else:
+            findings.append(AuditFinding(CHECK_WIENER, STATUS_PASS,
+                                         "không có d < n^(1/4) / 3 - no d below n^(1/4) / 3"))
+
+    # e phải khả nghịch modulo φ(n) - e must be invertible modulo φ(n)
+    if not factors:
+        findings.append(AuditFinding(CHECK_PHI_GCD, STATUS_SKIPPED,
+                                     "cần thừa số của n - needs the factors of n"))
+    elif not all(engine.is_prime(factor) for factor in factors):
+        composite = next(factor for factor in factors if not engine.is_prime(factor))
+        findings.append(AuditFinding(CHECK_PHI_GCD, STATUS_FAIL,
+                                     f"{elide_int(composite)} không nguyên tố nên φ(n) sai - is not prime, so φ(n) is wrong"))
+    else:
+        common = math.gcd(e, euler_phi(factors))
+        if common != 1:
+            findings.append(AuditFinding(CHECK_PHI_GCD, STATUS_FAIL,
+                                         f"gcd(e, φ(n)) = {common}: không có d - no valid d"))
+        else:
+            findings.append(AuditFinding(CHECK_PHI_GCD, STATUS_PASS, "gcd(e, φ(n)) = 1"))
+
+    return AuditResult(e, n, findings, factors, time.perf_counter() - start)
+
+
+def _shared_prime_findings(keys: Sequence[PublicKey]) -> List[Optional[dict]]:
+    """Phát hiện số nguyên tố dùng chung theo chỉ số khóa - Shared-prime findings by key index"""
+    by_index: List[Optional[dict]] = [None] * len(keys)
+    for finding in find_shared_primes(keys):
+        # Module trùng được báo trước, giữ phát hiện đầu tiên - Duplicates come first, keep the first finding
+        if by_index[finding['index']] is None:
+            by_index[finding['index']] = finding
+    return by_index
+
+
+def audit_keys(keys: Sequence[PublicKey], check_budget: float = DEFAULT_CHECK_BUDGET,
+               max_workers: Optional[int] = None,
+               progress: Optional[Callable[[int, int], None]] = None) -> List[AuditResult]:
+    """
+    Kiểm tra cả tập khóa công khai trên nhóm tiến trình - Audit a set of public keys on a process pool
+
+    Mỗi khóa được kiểm tra độc lập trên một tiến trình con ("spawn", an toàn
+    khi gọi từ ứng dụng đa luồng), sau đó GCD hàng loạt tìm số nguyên tố dùng
+    chung giữa các khóa. Tập nhỏ được kiểm tra ngay trong tiến trình.
+    Each key is audited independently in a worker process ("spawn", safe to
+    call from a multithreaded application), then a batch GCD looks for primes
+    shared between keys. Small sets are audited in-process.
+
+    Args:
+        keys: Các khóa công khai (e, n) - Public keys (e, n)
+        check_budget: Thời gian tối đa mỗi phép kiểm tra (giây) - Time limit per check (seconds)
+        max_workers: Số tiến trình tối đa - Maximum worker processes
+        progress: Callback (số khóa đã xong, tổng số khóa) - Callback (keys done, total keys)
+
+    Returns:
+        List[AuditResult]: Kết quả theo thứ tự khóa - Results in key order
+    """
+    keys = list(keys)
+    workers = max_workers or os.cpu_count() or 1
+    audit = partial(audit_key, check_budget=check_budget)
+    exponents = [e for e, _ in keys]
+    moduli = [n for _, n in keys]
+
+    results = []
+
+    def collect(audited):
+        for result in audited:
+            results.append(result)
+            if progress is not None:
+                progress(len(results), len(keys))
+
+    if workers == 1 or len(keys) < POOL_MIN_KEYS:
+        collect(map(audit, exponents, moduli))
+    else:
+        chunksize = max(1, len(keys) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            collect(pool.map(audit, exponents, moduli, chunksize=chunksize))
+
+    # Số nguyên tố dùng chung giữa các khóa - Primes shared between keys
+    for index, shared in enumerate(_shared_prime_findings(keys)):
+        result = results[index]
+        if shared is None:
+            finding = AuditFinding(CHECK_SHARED_PRIME, STATUS_PASS,
+                                   f"không chung với {len(keys) - 1} khóa khác - none shared with "
+                                   f"{len(keys) - 1} other keys")
+        elif shared['kind'] == 'duplicate':
+            finding = AuditFinding(CHECK_SHARED_PRIME, STATUS_FAIL,
+                                   f"module trùng với khóa - duplicate modulus of keys {shared['peers']}")
+        else:
+            finding = AuditFinding(CHECK_SHARED_PRIME, STATUS_FAIL,
+                                   f"chung số nguyên tố với khóa - shares a prime with keys {shared['peers']}")
+        factors = result.factors
+        if not factors and shared is not None and shared['factor']:
+            factors = sorted((shared['factor'], result.n // shared['factor']))
+        results[index] = result._replace(findings=result.findings + [finding], factors=factors)
+
+    return results
+
+
+def main(argv: List[str]) -> int:
+    """Điểm vào dòng lệnh - Command-line entry point"""
+    if len(argv) not in (1, 3) or (len(argv) == 3 and argv[1] != '--workers'):
+        print("Cách dùng - Usage: python -m crypto.key_audit keys.txt [--workers N]", file=sys.stderr)
+        return 2
+
+    max_workers = int(argv[2]) if len(argv) == 3 else None
+    results = audit_keys(list(load_public_keys(argv[0])), max_workers=max_workers)
+    for index, result in enumerate(results):
+        for finding in result.issues:
+            print(f"#{index}: {format_finding(finding)}")
+
+    failed = sum(not result.passed for result in results)
+    print(f"{failed}/{len(results)} khóa không đạt - keys failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -10,9 +10,268 @@ This module contains RSA algorithm implementations
 
 import random
 import math
-import sympy
-from typing import Tuple, Optional, List
 import hashlib
+import itertools
+import threading
+import time
+from functools import lru_cache
+from typing import Tuple, Optional, List, Union, Callable, Sequence
+
+from .tree_hash import DIGEST_SHA256, digest_bytes, digest_file
+
+
+def _sieve_flags(limit: int) -> bytearray:
+    """
+    Sàng Eratosthenes dạng cờ - Sieve of Eratosthenes as flags
+
+    Args:
+        limit: Giới hạn trên (không bao gồm) - Exclusive upper bound
+
+    Returns:
+        bytearray: flags[i] == 1 khi i nguyên tố - flags[i] == 1 when i is prime
+    """
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b'\x00\x00'
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(range(i * i, limit, i)))
+    return sieve
+
+
+def _sieve_primes(limit: int) -> List[int]:
+    """
+    Sàng Eratosthenes - Sieve of Eratosthenes
+
+    Args:
+        limit: Giới hạn trên (không bao gồm) - Exclusive upper bound
+
+    Returns:
+        List[int]: Các số nguyên tố nhỏ hơn limit - Primes below limit
+    """
+    return list(itertools.compress(range(limit), _sieve_flags(limit)))
+
+
+# Bảng tra số nguyên tố dưới 2^16, dựng khi nạp mô-đun: is_prime O(1) và chọn
+# trực tiếp số nguyên tố nhỏ cho chế độ demo
+# Lookup table of primes below 2^16, built at import: O(1) is_prime and direct
+# selection of small primes for the demo mode
+SMALL_TABLE_BITS = 16
+SMALL_TABLE_LIMIT = 1 << SMALL_TABLE_BITS
+_SMALL_PRIME_FLAGS = _sieve_flags(SMALL_TABLE_LIMIT)
+SMALL_PRIME_TABLE = list(itertools.compress(range(SMALL_TABLE_LIMIT), _SMALL_PRIME_FLAGS))
+
+# Số nguyên tố trong bảng theo độ dài bit - Table primes grouped by bit length
+_PRIMES_BY_BITS = {bits: [] for bits in range(2, SMALL_TABLE_BITS + 1)}
+for _prime in SMALL_PRIME_TABLE:
+    _PRIMES_BY_BITS[_prime.bit_length()].append(_prime)
+del _prime
+
+
+@lru_cache(maxsize=64)
+def _table_primes(bit_length: int, e: Optional[int] = None, safe: bool = False) -> Tuple[int, ...]:
+    """
+    Số nguyên tố trong bảng có đúng bit_length bit, dùng được với e
+    Table primes of exactly bit_length bits that are usable with e
+
+    Args:
+        bit_length: Độ dài bit (<= 16) - Bit length (<= 16)
+        e: Số mũ công khai - Public exponent
+        safe: Chỉ lấy số nguyên tố an toàn - Safe primes only
+
+    Returns:
+        Tuple[int, ...]: Các số nguyên tố phù hợp - Suitable primes
+    """
+    return tuple(prime for prime in _PRIMES_BY_BITS[bit_length]
+                 if (e is None or math.gcd(e, prime - 1) == 1)
+                 and (not safe or (prime > 3 and _SMALL_PRIME_FLAGS[(prime - 1) // 2])))
+
+
+def _table_stats(bit_length: int) -> dict:
+    """Thống kê khi số nguyên tố được lấy từ bảng - Stats when the prime comes from the table"""
+    return {
+        'bit_length': bit_length,
+        'candidates': 1,
+        'sieve_rejections': 0,
+        'e_rejections': 0,
+        'miller_rabin_rounds': 0,
+        'expected_candidates': 1.0,
+        'expected_tests': 0.0,
+        'elapsed': 0.0,
+        'eta_seconds': 0.0,
+        'done': True,
+    }
+
+
+# Số nguyên tố nhỏ dùng để sàng ứng viên trước Miller-Rabin
+# Small primes used to sieve candidates before Miller-Rabin
+SIEVE_LIMIT = 2000
+SMALL_PRIMES = _sieve_primes(SIEVE_LIMIT)
+
+# Xác suất một số lẻ sống sót qua sàng - Probability that an odd number survives the sieve
+_SIEVE_SURVIVAL = math.prod(1 - 1 / p for p in SMALL_PRIMES[1:])
+
+# Sàng cho số nguyên tố an toàn dùng cả bảng vì mỗi ứng viên sống sót tốn hai
+# phép lũy thừa modulo lớn
+# The safe-prime sieve uses the whole table since every survivor costs two
+# large modular exponentiations
+SAFE_SIEVE_PRIMES = SMALL_PRIME_TABLE
+
+# Số ứng viên q liên tiếp được sàng cùng lúc - Consecutive q candidates sieved at once
+SAFE_PRIME_WINDOW = 1 << 14
+
+# Hằng số số nguyên tố sinh đôi, dùng ước lượng mật độ Sophie Germain
+# Twin prime constant, used to estimate the Sophie Germain density
+_TWIN_PRIME_CONSTANT = 0.6601618158
+
+# Số thừa số nguyên tố cho phép của khóa (RFC 8017 đa số nguyên tố)
+# Allowed number of prime factors per key (RFC 8017 multi-prime)
+MIN_PRIME_COUNT = 2
+MAX_PRIME_COUNT = 4
+
+# Khoảng thời gian tối thiểu giữa hai lần báo tiến trình - Minimum seconds between progress reports
+PROGRESS_INTERVAL = 0.1
+
+ProgressCallback = Callable[[dict], None]
+
+
+def prime_stage_name(index: int) -> str:
+    """
+    Tên thừa số nguyên tố thứ index: p, q, r3, r4 - Name of the index-th prime factor: p, q, r3, r4
+
+    Args:
+        index: Chỉ số bắt đầu từ 0 - Zero-based index
+
+    Returns:
+        str: Tên thừa số - Factor name
+    """
+    return ('p', 'q')[index] if index < 2 else f"r{index + 1}"
+
+
+def crt_parameters(d: int, primes: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Tham số CRT theo RFC 8017 §3.2 - CRT parameters per RFC 8017 §3.2
+
+    Số mũ d_i = d mod (r_i - 1); hệ số thứ nhất là qInv = r_2^-1 mod r_1, các
+    hệ số sau là t_i = (r_1 ··· r_(i-1))^-1 mod r_i.
+    Exponents d_i = d mod (r_i - 1); the first coefficient is qInv = r_2^-1 mod r_1,
+    later coefficients are t_i = (r_1 ··· r_(i-1))^-1 mod r_i.
+
+    Args:
+        d: Số mũ bí mật - Private exponent
+        primes: Các thừa số nguyên tố (r_1, r_2, ...) - Prime factors (r_1, r_2, ...)
+
+    Returns:
+        Tuple[Tuple[int, ...], Tuple[int, ...]]: (số mũ, hệ số) - (exponents, coefficients)
+    """
+    exponents = tuple(d % (prime - 1) for prime in primes)
+    coefficients = [pow(primes[1], -1, primes[0])]
+    product = primes[0] * primes[1]
+    for prime in primes[2:]:
+        coefficients.append(pow(product, -1, prime))
+        product *= prime
+    return exponents, tuple(coefficients)
+
+
+def crt_power(base: int, d: int, primes: Sequence[int],
+              parameters: Optional[Tuple[Tuple[int, ...], Tuple[int, ...]]] = None) -> int:
+    """
+    Tính base^d mod ∏r_i bằng CRT (RSASP1, RFC 8017 §5.1.2 bước 2b)
+    Compute base^d mod ∏r_i with the CRT (RSASP1, RFC 8017 §5.1.2 step 2b)
+
+    Mỗi lũy thừa chỉ dùng một thừa số nên nhỏ hơn nhiều so với mod n.
+    Each exponentiation uses a single factor, so it is much smaller than mod n.
+
+    Args:
+        base: Cơ số - Base
+        d: Số mũ bí mật - Private exponent
+        primes: Các thừa số nguyên tố - Prime factors
+        parameters: Kết quả crt_parameters đã tính sẵn - Precomputed crt_parameters result
+
+    Returns:
+        int: base^d mod n
+    """
+    primes = tuple(primes)
+    exponents, coefficients = parameters or crt_parameters(d, primes)
+    r1, r2 = primes[0], primes[1]
+    s1 = pow(base, exponents[0], r1)
+    s2 = pow(base, exponents[1], r2)
+    # Garner: kết hợp r_1, r_2 rồi lần lượt từng r_i - Garner: combine r_1, r_2, then each r_i
+    result = s2 + r2 * ((s1 - s2) * coefficients[0] % r1)
+    product = r1 * r2
+    for prime, exponent, coefficient in zip(primes[2:], exponents[2:], coefficients[1:]):
+        s_i = pow(base, exponent, prime)
+        result += product * ((s_i - result) * coefficient % prime)
+        product *= prime
+    return result
+
+
+class OperationCancelled(Exception):
+    """Thao tác bị hủy - Raised when an operation is cancelled"""
+
+
+class CancellationToken:
+    """
+    Cờ hủy hợp tác giữa các luồng - Cooperative cross-thread cancellation flag
+
+    Thao tác dài kiểm tra cờ này định kỳ và dừng bằng OperationCancelled.
+    Long-running operations poll this flag and stop with OperationCancelled.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Yêu cầu hủy - Request cancellation"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Đã yêu cầu hủy chưa - Whether cancellation was requested"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Ném OperationCancelled nếu đã hủy - Raise OperationCancelled if cancelled"""
+        if self._event.is_set():
+            raise OperationCancelled("Thao tác đã bị hủy - Operation cancelled")
+
+
+class IncrementalHasher:
+    """
+    Băm SHA-256 tăng dần cho văn bản đang được gõ - Incremental SHA-256 for text being edited
+
+    Nếu văn bản mới chỉ nối thêm vào văn bản trước, chỉ phần thêm được băm;
+    nếu không, băm lại toàn bộ. Kết quả giống hệt RSAEngine.hash_message.
+    When the new text only appends to the previous text, just the suffix is
+    hashed; otherwise everything is re-hashed. Results match RSAEngine.hash_message.
+    """
+
+    def __init__(self):
+        self._text = ''
+        self._state = hashlib.sha256()
+        self.full_rehashes = 0  # Số lần băm lại toàn bộ - Number of full re-hashes
+
+    def hash_text(self, text: str) -> int:
+        """
+        Băm văn bản, dùng lại trạng thái khi có thể - Hash text, reusing state when possible
+
+        Args:
+            text: Văn bản hiện tại - Current text
+
+        Returns:
+            int: Giá trị băm dưới dạng số nguyên - Hash value as integer
+        """
+        if text.startswith(self._text):
+            # UTF-8 giữ nguyên tiền tố nên chỉ cần băm phần thêm
+            # UTF-8 preserves prefixes, so only the suffix needs hashing
+            suffix = text[len(self._text):]
+        else:
+            self._state = hashlib.sha256()
+            self.full_rehashes += 1
+            suffix = text
+
+        self._state.update(suffix.encode('utf-8'))
+        self._text = text
+        return int.from_bytes(self._state.digest(), 'big')
 
 
 class RSAEngine:
@@ -22,29 +281,35 @@ class RSAEngine:
         """Khởi tạo động cơ RSA - Initialize RSA engine"""
         self.p = None  # Số nguyên tố lớn đầu tiên
         self.q = None  # Số nguyên tố lớn thứ hai
-        self.n = None  # Module RSA (n = p * q)
-        self.phi = None  # Hàm Euler φ(n) = (p-1)(q-1)
+        self.primes = None  # Mọi thừa số nguyên tố (p, q, r3, ...) - All prime factors
+        self.n = None  # Module RSA (n = p * q · ...)
+        self.phi = None  # Hàm Euler φ(n) = (p-1)(q-1) · ...
         self.e = None  # Số mũ công khai
         self.d = None  # Số mũ bí mật
         self.public_key = None  # Khóa công khai (e, n)
         self.private_key = None  # Khóa bí mật (d, n)
+        # Tham số CRT của khóa hiện tại, không lưu ở mức mô-đun để không giữ bí mật sau khi engine bị hủy
+        # CRT parameters of the current key, kept per engine so secrets do not outlive it
+        self.crt_params = None
 
-    def is_prime(self, n: int, k: int = 5) -> bool:
+    def is_prime(self, n: int, k: int = 5, stats: Optional[dict] = None) -> bool:
         """
         Kiểm tra số nguyên tố bằng Miller-Rabin
         Primality test using Miller-Rabin
 
+        Số nhỏ hơn 2^16 được tra bảng, không cần Miller-Rabin.
+        Numbers below 2^16 are looked up in the table, without Miller-Rabin.
+
         Args:
             n: Số cần kiểm tra - Number to test
             k: Số vòng lặp - Number of iterations
+            stats: Nếu có, cộng dồn 'miller_rabin_rounds' - If given, 'miller_rabin_rounds' is accumulated
 
         Returns:
             bool: True nếu là số nguyên tố - True if prime
         """
-        if n <= 1:
-            return False
-        elif n <= 3:
-            return True
+        if n < SMALL_TABLE_LIMIT:
+            return n > 1 and _SMALL_PRIME_FLAGS[n] == 1
         elif n % 2 == 0:
             return False
 
@@ -57,6 +322,8 @@ class RSAEngine:
 
         # Thực hiện k vòng kiểm tra - Perform k test rounds
         for _ in range(k):
+            if stats is not None:
+                stats['miller_rabin_rounds'] += 1
             a = random.randint(2, n - 2)
             x = pow(a, d, n)
             if x == 1 or x == n - 1:
@@ -69,61 +336,350 @@ class RSAEngine:
                 return False
         return True
 
-    def generate_prime(self, bit_length: int = 8) -> int:
+    @staticmethod
+    def validate_public_exponent(e: int):
+        """
+        Kiểm tra số mũ công khai - Validate the public exponent
+
+        Args:
+            e: Số mũ công khai - Public exponent
+
+        Raises:
+            ValueError: Nếu e không lẻ hoặc không lớn hơn 1 - If e is not odd and greater than 1
+        """
+        if e <= 1 or e % 2 == 0:
+            raise ValueError(f"Số mũ công khai phải lẻ và > 1 - Public exponent must be odd and > 1: {e}")
+
+    def generate_prime(self, bit_length: int = 8,
+                       progress: Optional[ProgressCallback] = None,
+                       cancel_token: Optional[CancellationToken] = None,
+                       e: Optional[int] = None) -> int:
         """
         Tạo số nguyên tố ngẫu nhiên - Generate random prime number
 
+        Ứng viên chia hết cho một số nguyên tố nhỏ, hoặc có gcd(e, p-1) != 1 khi
+        truyền e, bị loại ở bước sàng, trước khi chạy Miller-Rabin. Nhờ vậy số
+        nguyên tố trả về luôn dùng được với e. Đến 16 bit, số nguyên tố được
+        chọn thẳng từ bảng.
+        Candidates divisible by a small prime, or with gcd(e, p-1) != 1 when e
+        is given, are rejected in the sieve stage, before Miller-Rabin runs. The
+        returned prime is therefore always usable with e. Up to 16 bits the
+        prime is picked straight from the table.
+
         Args:
             bit_length: Độ dài bit - Bit length
+            progress: Callback nhận dict thống kê - Callback receiving a stats dict
+                (candidates, sieve_rejections, e_rejections, miller_rabin_rounds, eta_seconds, ...)
+            cancel_token: Cờ hủy hợp tác - Cooperative cancellation token
+            e: Số mũ công khai sẽ dùng với số nguyên tố này - Public exponent the prime will be used with
 
         Returns:
             int: Số nguyên tố - Prime number
         """
+        if bit_length < 2:
+            raise ValueError(f"Độ dài bit phải >= 2 - Bit length must be >= 2: {bit_length}")
+        if e is not None:
+            self.validate_public_exponent(e)
+
+        if bit_length <= SMALL_TABLE_BITS:
+            return self._pick_table_prime(bit_length, progress, e)
+
+        # Mô hình mật độ: trung bình ln(2^b)/2 số lẻ mới gặp một số nguyên tố
+        # Density model: on average ln(2^b)/2 odd numbers per prime
+        expected_candidates = max(1.0, bit_length * math.log(2) / 2)
+        stats = {
+            'bit_length': bit_length,
+            'candidates': 0,
+            'sieve_rejections': 0,
+            'e_rejections': 0,
+            'miller_rabin_rounds': 0,
+            'expected_candidates': expected_candidates,
+            'expected_tests': expected_candidates * _SIEVE_SURVIVAL,
+            'elapsed': 0.0,
+            'eta_seconds': None,
+            'done': False,
+        }
+        start = time.perf_counter()
+        last_report = start
+
         while True:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
             # Tạo số ngẫu nhiên có độ dài bit_length - Generate random number
             num = random.getrandbits(bit_length)
             # Đảm bảo số lẻ và đủ lớn - Ensure odd and large enough
             num |= (1 << bit_length - 1) | 1
-            if self.is_prime(num):
+            stats['candidates'] += 1
+
+            if num >= SIEVE_LIMIT and any(num % small == 0 for small in SMALL_PRIMES):
+                stats['sieve_rejections'] += 1
+                found = False
+            elif e is not None and math.gcd(e, num - 1) != 1:
+                # p - 1 chung ước với e thì e không khả nghịch mod φ(n)
+                # If p - 1 shares a factor with e, e is not invertible mod φ(n)
+                stats['e_rejections'] += 1
+                found = False
+            else:
+                found = self.is_prime(num, stats=stats)
+
+            if progress is not None:
+                now = time.perf_counter()
+                if found or now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    stats['elapsed'] = now - start
+                    stats['done'] = found
+                    # Phân phối hình học không có trí nhớ: thời gian còn lại kỳ vọng
+                    # luôn bằng số ứng viên kỳ vọng nhân chi phí mỗi ứng viên
+                    # The geometric distribution is memoryless: expected remaining time
+                    # is always the expected candidate count times the cost per candidate
+                    per_candidate = stats['elapsed'] / stats['candidates']
+                    stats['eta_seconds'] = 0.0 if found else per_candidate * expected_candidates
+                    progress(dict(stats))
+
+            if found:
                 return num
 
+    @staticmethod
+    def _pick_table_prime(bit_length: int, progress: Optional[ProgressCallback],
+                          e: Optional[int], safe: bool = False) -> int:
+        """
+        Chọn ngẫu nhiên một số nguyên tố trong bảng - Pick a random prime from the table
+
+        Args:
+            bit_length: Độ dài bit (<= 16) - Bit length (<= 16)
+            progress: Callback tiến trình - Progress callback
+            e: Số mũ công khai - Public exponent
+            safe: Chỉ lấy số nguyên tố an toàn - Safe primes only
+
+        Returns:
+            int: Số nguyên tố - Prime
+        """
+        choices = _table_primes(bit_length, e, safe)
+        if not choices:
+            raise ValueError(f"Không có số nguyên tố {bit_length} bit phù hợp với e = {e} "
+                             f"- No suitable {bit_length}-bit prime for e = {e}")
+        if progress is not None:
+            progress(_table_stats(bit_length))
+        return random.choice(choices)
+
+    def is_safe_prime(self, p: int) -> bool:
+        """
+        Kiểm tra p và (p-1)/2 cùng là số nguyên tố - Check that p and (p-1)/2 are both prime
+
+        Args:
+            p: Số cần kiểm tra - Number to test
+
+        Returns:
+            bool: True nếu p là số nguyên tố an toàn - True if p is a safe prime
+        """
+        return p > 3 and p % 2 == 1 and self.is_prime((p - 1) // 2) and self.is_prime(p)
+
+    def generate_safe_prime(self, bit_length: int = 8,
+                            progress: Optional[ProgressCallback] = None,
+                            cancel_token: Optional[CancellationToken] = None,
+                            e: Optional[int] = None) -> int:
+        """
+        Tạo số nguyên tố an toàn p = 2q + 1 (q cũng nguyên tố)
+        Generate a safe prime p = 2q + 1 (with q also prime)
+
+        Một cửa sổ q liên tiếp được sàng một lần cho cả q và 2q + 1: với mỗi số
+        nguyên tố nhỏ s, loại q ≡ 0 và q ≡ (s-1)/2 (mod s) bằng gán lát cắt.
+        Ứng viên sống sót qua kiểm tra Fermat cơ số 2 trên q trước, rồi trên p;
+        cuối cùng Miller-Rabin chỉ chạy trên q. Khi q nguyên tố, 2^(p-1) ≡ 1
+        (mod p) và gcd(2^2 - 1, p) = 1 đã chứng minh p nguyên tố (Pocklington).
+        A window of consecutive q is sieved once for both q and 2q + 1: for every
+        small prime s, q ≡ 0 and q ≡ (s-1)/2 (mod s) are struck out with slice
+        assignment. Survivors take a base-2 Fermat test on q first, then on p;
+        Miller-Rabin finally runs on q only. With q prime, 2^(p-1) ≡ 1 (mod p)
+        and gcd(2^2 - 1, p) = 1 already prove p prime (Pocklington).
+
+        Args:
+            bit_length: Độ dài bit của p - Bit length of p
+            progress: Callback nhận dict thống kê như generate_prime
+                - Callback receiving a stats dict as in generate_prime
+            cancel_token: Cờ hủy hợp tác - Cooperative cancellation token
+            e: Số mũ công khai sẽ dùng với số nguyên tố này - Public exponent the prime will be used with
+
+        Returns:
+            int: Số nguyên tố an toàn - Safe prime
+        """
+        if bit_length < 3:
+            raise ValueError(f"Độ dài bit phải >= 3 - Bit length must be >= 3: {bit_length}")
+        if e is not None:
+            self.validate_public_exponent(e)
+
+        # Khoảng nhỏ: chọn trực tiếp trong bảng - Small range: pick straight from the table
+        if bit_length <= SMALL_TABLE_BITS:
+            return self._pick_table_prime(bit_length, progress, e, safe=True)
+
+        # Hardy-Littlewood: trung bình ln(q)·ln(p) / (4·C2) số q lẻ mới gặp một cặp
+        # Hardy-Littlewood: on average ln(q)·ln(p) / (4·C2) odd q per pair
+        log_p = bit_length * math.log(2)
+        expected_candidates = max(1.0, log_p * log_p / (4 * _TWIN_PRIME_CONSTANT))
+        stats = {
+            'bit_length': bit_length,
+            'candidates': 0,
+            'sieve_rejections': 0,
+            'e_rejections': 0,
+            'q_rejections': 0,
+            'p_rejections': 0,
+            'miller_rabin_rounds': 0,
+            'expected_candidates': expected_candidates,
+            'expected_tests': None,
+            'elapsed': 0.0,
+            'eta_seconds': None,
+            'done': False,
+        }
+        start = time.perf_counter()
+        last_report = start
+
+        def report(found: bool):
+            nonlocal last_report
+            now = time.perf_counter()
+            if found or now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                stats['elapsed'] = now - start
+                stats['done'] = found
+                per_candidate = stats['elapsed'] / max(1, stats['candidates'])
+                stats['eta_seconds'] = 0.0 if found else per_candidate * expected_candidates
+                progress(dict(stats))
+
+        q_bits = bit_length - 1
+        # Chỉ sàng bằng số nguyên tố nhỏ hơn mọi q để không loại chính q
+        # Only sieve with primes below every q so q itself is never struck out
+        sieve_primes = [small for small in SAFE_SIEVE_PRIMES[1:] if small < 1 << (q_bits - 1)]
+        while True:
+            # q lẻ ngẫu nhiên đủ lớn để p có đúng bit_length bit; cửa sổ các q0 + 2i
+            # Random odd q large enough for p to have exactly bit_length bits; window of q0 + 2i
+            q0 = random.getrandbits(q_bits) | (1 << (q_bits - 1)) | 1
+            window = min(SAFE_PRIME_WINDOW, ((1 << q_bits) - q0) // 2)
+            if window <= 0:
+                continue
+            sieve = bytearray([1]) * window
+            for small in sieve_primes:
+                # 2 khả nghịch mod s nên chỉ số i giải được trực tiếp
+                # 2 is invertible mod s, so the index i is solved directly
+                half = (small + 1) // 2
+                residue = q0 % small
+                # q0 + 2i ≡ 0 (mod s)  →  s | q
+                first = (-residue * half) % small
+                sieve[first::small] = bytes(len(range(first, window, small)))
+                # q0 + 2i ≡ (s-1)/2 (mod s)  →  s | 2q + 1
+                first = (((small - 1) // 2 - residue) * half) % small
+                sieve[first::small] = bytes(len(range(first, window, small)))
+
+            for i in range(window):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                stats['candidates'] += 1
+                found = False
+                if not sieve[i]:
+                    stats['sieve_rejections'] += 1
+                else:
+                    q = q0 + 2 * i
+                    p = 2 * q + 1
+                    if e is not None and math.gcd(e, p - 1) != 1:
+                        stats['e_rejections'] += 1
+                    elif pow(2, q - 1, q) != 1:
+                        stats['q_rejections'] += 1
+                    elif pow(2, p - 1, p) != 1:
+                        stats['p_rejections'] += 1
+                    else:
+                        found = self.is_prime(q, stats=stats)
+
+                if progress is not None:
+                    report(found)
+                if found:
+                    return p
+
     def generate_keys(self, p: Optional[int] = None, q: Optional[int] = None,
-                     e: int = 65537) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+                     e: int = 65537, prime_bits: int = 8,
+                     progress: Optional[ProgressCallback] = None,
+                     cancel_token: Optional[CancellationToken] = None,
+                     safe_primes: bool = False,
+                     prime_count: int = MIN_PRIME_COUNT) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         """
         Tạo cặp khóa RSA - Generate RSA key pair
 
+        Với prime_count > 2 khóa có 3 hoặc 4 thừa số nguyên tố (RFC 8017). Để
+        giữ nguyên kích thước n, chọn prime_bits = số bit của n // prime_count.
+        With prime_count > 2 the key has 3 or 4 prime factors (RFC 8017). To keep
+        the size of n, choose prime_bits = bits of n // prime_count.
+
         Args:
             p: Số nguyên tố thứ nhất - First prime (optional)
             q: Số nguyên tố thứ hai - Second prime (optional)
             e: Số mũ công khai - Public exponent (default: 65537)
+            prime_bits: Độ dài bit của số nguyên tố ngẫu nhiên (mặc định 8 cho demo)
+                - Bit length of random primes (default 8 for demo)
+            progress: Callback tiến trình; dict có thêm 'stage' ('p', 'q', 'r3', ...),
+                'stage_index' và 'stage_count'
+                - Progress callback; the dict also carries 'stage' ('p', 'q', 'r3', ...),
+                'stage_index' and 'stage_count'
+            cancel_token: Cờ hủy hợp tác - Cooperative cancellation token
+            safe_primes: Dùng số nguyên tố an toàn p = 2p' + 1 - Use safe primes p = 2p' + 1
+            prime_count: Số thừa số nguyên tố (2 đến 4) - Number of prime factors (2 to 4)
 
         Returns:
             Tuple[Tuple[int, int], Tuple[int, int]]: ((e, n), (d, n))
-        """
-        # Tạo hoặc sử dụng số nguyên tố p - Generate or use prime p
-        if p is None:
-            self.p = self.generate_prime(8)  # 8-bit cho demo - 8-bit for demo
-        else:
-            if not self.is_prime(p):
-                raise ValueError(f"{p} không phải là số nguyên tố - is not prime")
-            self.p = p
 
-        # Tạo hoặc sử dụng số nguyên tố q - Generate or use prime q
-        if q is None:
-            self.q = self.generate_prime(8)
-        else:
-            if not self.is_prime(q):
-                raise ValueError(f"{q} không phải là số nguyên tố - is not prime")
-            self.q = q
+        Raises:
+            ValueError: Nếu e không hợp lệ, p, q cho trước không dùng được với e hoặc
+                không đủ số nguyên tố prime_bits bit khác nhau
+                - If e is invalid, a given p, q cannot be used with e or there are
+                not enough distinct prime_bits-bit primes
+        """
+        # Kiểm tra trước khi tìm số nguyên tố - Validate before any prime search
+        self.validate_public_exponent(e)
+        if not MIN_PRIME_COUNT <= prime_count <= MAX_PRIME_COUNT:
+            raise ValueError(f"Số thừa số nguyên tố phải từ {MIN_PRIME_COUNT} đến {MAX_PRIME_COUNT} "
+                             f"- Prime count must be {MIN_PRIME_COUNT} to {MAX_PRIME_COUNT}: {prime_count}")
+
+        def stage_progress(index):
+            if progress is None:
+                return None
+            stage = dict(stage=prime_stage_name(index), stage_index=index, stage_count=prime_count)
+            return lambda stats: progress(dict(stats, **stage))
+
+        generate = self.generate_safe_prime if safe_primes else self.generate_prime
+
+        # Số nguyên tố nhỏ lấy từ bảng có hạn: báo lỗi thay vì lặp mãi khi không đủ thừa số khác nhau
+        # Small primes come from a finite table: fail instead of looping forever without enough distinct ones
+        given_primes = [prime for prime in (p, q) if prime is not None]
+        if prime_bits <= SMALL_TABLE_BITS:
+            available = set(_table_primes(prime_bits, e, safe_primes)) - set(given_primes)
+            needed = prime_count - len(given_primes)
+            if len(available) < needed:
+                raise ValueError(f"Chỉ có {len(available)} số nguyên tố {prime_bits} bit phù hợp, cần {needed} "
+                                 f"- Only {len(available)} suitable {prime_bits}-bit primes, {needed} needed")
+
+        # Tạo hoặc sử dụng các số nguyên tố p, q, r3, ... - Generate or use primes p, q, r3, ...
+        primes = []
+        for index, given in enumerate((p, q) + (None,) * (prime_count - 2)):
+            if given is None:
+                # RFC 8017 yêu cầu các thừa số khác nhau - RFC 8017 requires distinct factors
+                prime = generate(prime_bits, stage_progress(index), cancel_token, e)
+                while prime in primes:
+                    prime = generate(prime_bits, stage_progress(index), cancel_token, e)
+            else:
+                self._check_given_prime(given, e, safe_primes)
+                if given in primes:
+                    raise ValueError(f"Các thừa số phải khác nhau - Factors must be distinct: {given}")
+                prime = given
+            primes.append(prime)
 
         # Tính các tham số RSA - Calculate RSA parameters
-        self.n = self.p * self.q
-        self.phi = (self.p - 1) * (self.q - 1)
+        self.primes = tuple(primes)
+        self.p, self.q = primes[0], primes[1]
+        self.n = math.prod(primes)
+        self.phi = math.prod(prime - 1 for prime in primes)
         self.e = e
 
         # Tính số mũ bí mật d - Calculate private exponent d
         # e * d ≡ 1 (mod φ(n)) - Modular inverse
         self.d = self.mod_inverse(self.e, self.phi)
+        self.crt_params = crt_parameters(self.d, self.primes)
 
         # Tạo cặp khóa - Create key pairs
         self.public_key = (self.e, self.n)
@@ -131,6 +687,22 @@ class RSAEngine:
 
         return self.public_key, self.private_key
 
+    def _check_given_prime(self, prime: int, e: int, safe: bool = False):
+        """
+        Kiểm tra số nguyên tố do người dùng nhập - Validate a user-supplied prime
+
+        Args:
+            prime: Số nguyên tố - Prime
+            e: Số mũ công khai - Public exponent
+            safe: Yêu cầu số nguyên tố an toàn - Require a safe prime
+        """
+        if not self.is_prime(prime):
+            raise ValueError(f"{prime} không phải là số nguyên tố - is not prime")
+        if safe and not self.is_safe_prime(prime):
+            raise ValueError(f"{prime} không phải số nguyên tố an toàn - is not a safe prime")
+        if math.gcd(e, prime - 1) != 1:
+            raise ValueError(f"gcd(e, {prime} - 1) != 1: e = {e} không khả nghịch - is not invertible")
+
     def extended_gcd(self, a: int, b: int) -> Tuple[int, int, int]:
         """
         Thuật toán Euclid mở rộng - Extended Euclidean Algorithm
@@ -170,46 +742,109 @@ class RSAEngine:
         else:
             return x % m
 
-    def hash_message(self, message: str) -> int:
+    def hash_message(self, message: Union[str, bytes],
+                     digest_type: str = DIGEST_SHA256) -> int:
         """
-        Băm thông điệp bằng SHA-256 - Hash message with SHA-256
+        Băm thông điệp - Hash message
 
         Args:
             message: Thông điệp cần băm - Message to hash
+            digest_type: Loại băm (sha256 hoặc tree-sha256-v1) - Digest type
+
+        Returns:
+            int: Giá trị băm dưới dạng số nguyên - Hash value as integer
+        """
+        data = message.encode('utf-8') if isinstance(message, str) else message
+        return int.from_bytes(digest_bytes(data, digest_type), 'big')
+
+    def hash_file(self, path: str, digest_type: str = DIGEST_SHA256) -> int:
+        """
+        Băm nội dung file - Hash file contents
+
+        Args:
+            path: Đường dẫn file - File path
+            digest_type: Loại băm - Digest type
 
         Returns:
             int: Giá trị băm dưới dạng số nguyên - Hash value as integer
         """
-        hash_obj = hashlib.sha256(message.encode('utf-8'))
-        hash_hex = hash_obj.hexdigest()
-        return int(hash_hex, 16)
+        return int.from_bytes(digest_file(path, digest_type), 'big')
 
-    def sign(self, message: str, private_key: Optional[Tuple[int, int]] = None) -> int:
+    def sign(self, message: Union[str, bytes], private_key: Optional[Tuple[int, int]] = None,
+             digest_type: str = DIGEST_SHA256, primes: Optional[Sequence[int]] = None) -> int:
         """
         Ký thông điệp - Sign message
 
         Args:
             message: Thông điệp cần ký - Message to sign
             private_key: Khóa bí mật (d, n) - Private key
+            digest_type: Loại băm - Digest type
+            primes: Thừa số nguyên tố của n để ký bằng CRT - Prime factors of n for CRT signing
+
+        Returns:
+            int: Chữ ký số - Digital signature
+        """
+        # Băm thông điệp - Hash message
+        hashed_msg = self.hash_message(message, digest_type)
+
+        return self.sign_digest(hashed_msg, private_key, primes)
+
+    def sign_file(self, path: str, private_key: Optional[Tuple[int, int]] = None,
+                  digest_type: str = DIGEST_SHA256, primes: Optional[Sequence[int]] = None) -> int:
+        """
+        Ký nội dung file - Sign file contents
+
+        Args:
+            path: Đường dẫn file - File path
+            private_key: Khóa bí mật (d, n) - Private key
+            digest_type: Loại băm (nên dùng tree-sha256-v1 cho file lớn)
+                - Digest type (tree-sha256-v1 recommended for large files)
+            primes: Thừa số nguyên tố của n để ký bằng CRT - Prime factors of n for CRT signing
+
+        Returns:
+            int: Chữ ký số - Digital signature
+        """
+        return self.sign_digest(self.hash_file(path, digest_type), private_key, primes)
+
+    def sign_digest(self, hashed_msg: int, private_key: Optional[Tuple[int, int]] = None,
+                    primes: Optional[Sequence[int]] = None) -> int:
+        """
+        Ký giá trị băm đã tính - Sign a precomputed hash value
+
+        Khi biết các thừa số nguyên tố của n, chữ ký được tính bằng CRT trên từng
+        thừa số; kết quả giống hệt pow(hash, d, n).
+        When the prime factors of n are known, the signature is computed with the
+        CRT over each factor; the result is identical to pow(hash, d, n).
+
+        Args:
+            hashed_msg: Giá trị băm - Hash value
+            private_key: Khóa bí mật (d, n) - Private key
+            primes: Thừa số nguyên tố của n; mặc định của khóa hiện tại khi không truyền khóa
+                - Prime factors of n; defaults to the current key's when no key is passed
 
         Returns:
             int: Chữ ký số - Digital signature
         """
         if private_key is None:
             private_key = self.private_key
+            if primes is None:
+                primes = self.primes
 
         d, n = private_key
 
-        # Băm thông điệp - Hash message
-        hashed_msg = self.hash_message(message)
+        if primes is not None:
+            if math.prod(primes) != n:
+                raise ValueError("Tích các thừa số khác n - The product of the factors differs from n")
+            # Ký bằng CRT trên từng thừa số - CRT signing over each factor
+            parameters = self.crt_params if (d, tuple(primes)) == (self.d, self.primes) else None
+            return crt_power(hashed_msg % n, d, primes, parameters)
 
         # Ký: s = hash(m)^d mod n - Sign: s = hash(m)^d mod n
-        signature = pow(hashed_msg, d, n)
-
-        return signature
+        return pow(hashed_msg, d, n)
 
-    def verify(self, message: str, signature: int,
-               public_key: Optional[Tuple[int, int]] = None) -> bool:
+    def verify(self, message: Union[str, bytes], signature: int,
+               public_key: Optional[Tuple[int, int]] = None,
+               digest_type: str = DIGEST_SHA256) -> bool:
         """
         Xác thực chữ ký - Verify signature
 
@@ -217,6 +852,42 @@ class RSAEngine:
             message: Thông điệp gốc - Original message
             signature: Chữ ký cần xác thực - Signature to verify
             public_key: Khóa công khai (e, n) - Public key
+            digest_type: Loại băm đã dùng khi ký - Digest type used when signing
+
+        Returns:
+            bool: True nếu chữ ký hợp lệ - True if signature is valid
+        """
+        # Băm thông điệp gốc - Hash original message
+        hashed_msg = self.hash_message(message, digest_type)
+
+        return self.verify_digest(hashed_msg, signature, public_key)
+
+    def verify_file(self, path: str, signature: int,
+                    public_key: Optional[Tuple[int, int]] = None,
+                    digest_type: str = DIGEST_SHA256) -> bool:
+        """
+        Xác thực chữ ký của file - Verify a file signature
+
+        Args:
+            path: Đường dẫn file - File path
+            signature: Chữ ký cần xác thực - Signature to verify
+            public_key: Khóa công khai (e, n) - Public key
+            digest_type: Loại băm đã dùng khi ký - Digest type used when signing
+
+        Returns:
+            bool: True nếu chữ ký hợp lệ - True if signature is valid
+        """
+        return self.verify_digest(self.hash_file(path, digest_type), signature, public_key)
+
+    def verify_digest(self, hashed_msg: int, signature: int,
+                      public_key: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Xác thực chữ ký với giá trị băm đã tính - Verify against a precomputed hash
+
+        Args:
+            hashed_msg: Giá trị băm - Hash value
+            signature: Chữ ký cần xác thực - Signature to verify
+            public_key: Khóa công khai (e, n) - Public key
 
         Returns:
             bool: True nếu chữ ký hợp lệ - True if signature is valid
@@ -226,9 +897,6 @@ class RSAEngine:
 
         e, n = public_key
 
-        # Băm thông điệp gốc - Hash original message
-        hashed_msg = self.hash_message(message)
-
         # Xác thực: hash(m) ≡ s^e mod n - Verify: hash(m) ≡ s^e mod n
         decrypted_signature = pow(signature, e, n)
 
@@ -241,9 +909,14 @@ class RSAEngine:
         Returns:
             dict: Thông tin chi tiết về khóa - Detailed key information
         """
+        exponents, coefficients = self.crt_params or (None, None)
         return {
             'p': self.p,
             'q': self.q,
+            'primes': None if self.primes is None else list(self.primes),
+            # Tham số CRT (RFC 8017 §3.2), None khi chưa có khóa - CRT parameters (RFC 8017 §3.2), None without keys
+            'crt_exponents': None if exponents is None else list(exponents),
+            'crt_coefficients': None if coefficients is None else list(coefficients),
             'n': self.n,
             'phi': self.phi,
             'e': self.e,
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel Tree Hashing
+Băm cây song song
+
+Module này băm dữ liệu lớn theo từng khối trên nhiều luồng rồi kết hợp lại
+This module hashes large inputs chunk by chunk on a thread pool and combines them
+
+hashlib nhả GIL khi băm bộ đệm lớn, nên các khối được băm thực sự song song
+hashlib releases the GIL on large buffers, so chunks are hashed truly in parallel
+"""
+
+import hashlib
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Union
+
+
+# Loại băm có phiên bản - Versioned digest types
+DIGEST_SHA256 = 'sha256'
+DIGEST_TREE_SHA256_V1 = 'tree-sha256-v1'
+
+DIGEST_TYPES = (DIGEST_SHA256, DIGEST_TREE_SHA256_V1)
+
+# Kích thước khối mặc định - Default chunk size (4 MiB)
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Tiền tố phân biệt lá và gốc - Domain separation prefixes for leaves and root
+_LEAF_PREFIX = b'\x00'
+_ROOT_PREFIX = b'\x01' + DIGEST_TREE_SHA256_V1.encode('ascii')
+
+
+def _default_workers() -> int:
+    """Số luồng mặc định - Default number of worker threads"""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _hash_leaf(chunk) -> bytes:
+    """
+    Băm một khối lá - Hash a single leaf chunk
+
+    Args:
+        chunk: Dữ liệu khối (bytes hoặc memoryview) - Chunk data
+
+    Returns:
+        bytes: Giá trị băm của lá - Leaf digest
+    """
+    leaf = hashlib.sha256(_LEAF_PREFIX)
+    leaf.update(chunk)
+    return leaf.digest()
+
+
+def _combine(leaf_digests, total_length: int, chunk_size: int) -> bytes:
+    """
+    Kết hợp các giá trị băm lá thành gốc - Combine leaf digests into the root
+
+    Gốc ràng buộc kích thước khối và tổng độ dài nên hai cách chia khác nhau
+    không thể cho cùng một giá trị băm.
+    The root binds chunk size and total length, so different splits can never
+    produce the same digest.
+    """
+    root = hashlib.sha256(_ROOT_PREFIX)
+    root.update(struct.pack('>QQ', chunk_size, total_length))
+    for digest in leaf_digests:
+        root.update(digest)
+    return root.digest()
+
+
+def _check_chunk_size(chunk_size: int):
+    """Kiểm tra kích thước khối - Validate chunk size"""
+    if chunk_size <= 0:
+        raise ValueError(f"Kích thước khối phải dương - Chunk size must be positive: {chunk_size}")
+
+
+def tree_hash(data: Union[bytes, bytearray, memoryview],
+              chunk_size: int = DEFAULT_CHUNK_SIZE,
+              max_workers: Optional[int] = None) -> bytes:
+    """
+    Băm cây song song cho dữ liệu trong bộ nhớ - Parallel tree hash of in-memory data
+
+    Args:
+        data: Dữ liệu cần băm - Data to hash
+        chunk_size: Kích thước khối - Chunk size in bytes
+        max_workers: Số luồng tối đa - Maximum worker threads
+
+    Returns:
+        bytes: Giá trị băm 32 byte - 32-byte digest
+    """
+    _check_chunk_size(chunk_size)
+    view = memoryview(data).cast('B')
+    total_length = len(view)
+    chunks = [view[i:i + chunk_size] for i in range(0, total_length, chunk_size)] or [view[0:0]]
+
+    # Một khối thì không cần luồng - A single chunk does not need threads
+    if len(chunks) == 1:
+        return _combine([_hash_leaf(chunks[0])], total_length, chunk_size)
+
+    with ThreadPoolExecutor(max_workers=max_workers or _default_workers()) as executor:
+        leaf_digests = list(executor.map(_hash_leaf, chunks))
+
+    return _combine(leaf_digests, total_length, chunk_size)
+
+
+def _chunk_ranges(chunk_size: int, total_length: int) -> Iterator[tuple]:
+    """Sinh vị trí các khối trong file - Yield (offset, length) of each chunk"""
+    for offset in range(0, total_length, chunk_size):
+        yield offset, min(chunk_size, total_length - offset)
+
+
+def tree_hash_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   max_workers: Optional[int] = None) -> bytes:
+    """
+    Băm cây song song cho một file lớn - Parallel tree hash of a large file
+
+    Mỗi luồng tự đọc khối của mình nên việc đọc đĩa cũng chạy song song,
+    và bộ nhớ chỉ giữ khoảng max_workers khối cùng lúc.
+    Each worker reads its own chunk, so disk reads run in parallel too, and
+    only about max_workers chunks are held in memory at once.
+
+    Args:
+        path: Đường dẫn file - File path
+        chunk_size: Kích thước khối - Chunk size in bytes
+        max_workers: Số luồng tối đa - Maximum worker threads
+
+    Returns:
+        bytes: Giá trị băm 32 byte - 32-byte digest
+    """
+    _check_chunk_size(chunk_size)
+    total_length = os.path.getsize(path)
+    workers = max_workers or _default_workers()
+
+    def hash_range(chunk_range):
+        offset, length = chunk_range
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return _hash_leaf(f.read(length))
+
+    if total_length <= chunk_size:
+        with open(path, 'rb') as f:
+            return _combine([_hash_leaf(f.read())], total_length, chunk_size)
+
+    leaf_digests = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Giới hạn số khối đang xử lý - Bound the number of chunks in flight
+        pending = []
+        for chunk_range in _chunk_ranges(chunk_size, total_length):
+            pending.append(executor.submit(hash_range, chunk_range))
+            if len(pending) >= workers * 2:
+                leaf_digests.append(pending.pop(0).result())
+        leaf_digests.extend(future.result() for future in pending)
+
+    return _combine(leaf_digests, total_length, chunk_size)
+
+
+def digest_bytes(data: Union[bytes, bytearray, memoryview],
+                 digest_type: str = DIGEST_SHA256) -> bytes:
+    """
+    Băm dữ liệu theo loại băm cho trước - Hash data with the given digest type
+
+    Args:
+        data: Dữ liệu cần băm - Data to hash
+        digest_type: Loại băm - Digest type
+
+    Returns:
+        bytes: Giá trị băm - Digest
+    """
+    if digest_type == DIGEST_SHA256:
+        return hashlib.sha256(data).digest()
+    if digest_type == DIGEST_TREE_SHA256_V1:
+        return tree_hash(data)
+    raise ValueError(f"Loại băm không hỗ trợ - Unsupported digest type: {digest_type}")
+
+
+def digest_file(path: str, digest_type: str = DIGEST_SHA256) -> bytes:
+    """
+    Băm file theo loại băm cho trước - Hash a file with the given digest type
+
+    Args:
+        path: Đường dẫn file - File path
+        digest_type: Loại băm - Digest type
+
+    Returns:
+        bytes: Giá trị băm - Digest
+    """
+    if digest_type == DIGEST_TREE_SHA256_V1:
+        return tree_hash_file(path)
+    if digest_type == DIGEST_SHA256:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(DEFAULT_CHUNK_SIZE), b''):
+                sha.update(block)
+        return sha.digest()
+    raise ValueError(f"Loại băm không hỗ trợ - Unsupported digest type: {digest_type}")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorized RSA for Small Moduli
+RSA vector hóa cho module nhỏ
+
+Với số nguyên tố demo, n chỉ có vài chục bit. Module này ký và xác thực cả
+mảng giá trị băm cùng lúc bằng lũy thừa nhân-bình phương trên mảng NumPy
+uint64, thay vì lặp qua từng số nguyên Python.
+With the demo primes, n has only a few dozen bits. This module signs and
+verifies whole arrays of hash values at once with square-and-multiply on
+NumPy uint64 arrays, instead of looping over Python integers.
+
+Mọi tích trung gian nhỏ hơn n² < 2^64 nên chỉ hỗ trợ n < 2^32.
+Every intermediate product is below n² < 2^64, so only n < 2^32 is supported.
+
+NumPy chỉ được nạp khi thực sự tính toán - NumPy is only imported when computing.
+"""
+
+from typing import Iterable, Tuple, Union
+
+from .rsa_engine import RSAEngine
+from .tree_hash import DIGEST_SHA256
+
+# Module lớn nhất cho đường vector hóa (không bao gồm) - Exclusive modulus bound of the vectorized path
+MAX_VECTOR_MODULUS = 1 << 32
+
+
+def supports_modulus(n: int) -> bool:
+    """
+    Module có dùng được đường vector hóa không - Whether a modulus fits the vectorized path
+
+    Args:
+        n: Module RSA - RSA modulus
+
+    Returns:
+        bool: True nếu 1 < n < 2^32 - True if 1 < n < 2^32
+    """
+    return 1 < n < MAX_VECTOR_MODULUS
+
+
+def _check_modulus(n: int):
+    """Báo lỗi nếu module quá lớn - Raise if the modulus is too large"""
+    if not supports_modulus(n):
+        raise ValueError(f"Module phải nhỏ hơn 2^32 cho đường vector hóa "
+                         f"- Modulus must be below 2^32 for the vectorized path: {n.bit_length()} bit")
+
+
+def powmod(bases: "np.ndarray", exponent: int, modulus: int) -> "np.ndarray":
+    """
+    Lũy thừa modulo từng phần tử bằng nhân-bình phương - Element-wise modular power by square-and-multiply
+
+    Args:
+        bases: Mảng cơ số không âm - Array of non-negative bases
+        exponent: Số mũ không âm - Non-negative exponent
+        modulus: Module (< 2^32) - Modulus (< 2^32)
+
+    Returns:
+        np.ndarray: bases^exponent mod modulus (uint64)
+    """
+    import numpy as np
+
+    _check_modulus(modulus)
+    if exponent < 0:
+        raise ValueError(f"Số mũ phải không âm - Exponent must be non-negative: {exponent}")
+
+    m = np.uint64(modulus)
+    base = np.asarray(bases, dtype=np.uint64) % m
+    result = np.ones_like(base)
+
+    # Duyệt bit của số mũ từ thấp đến cao - Walk the exponent bits from low to high
+    while exponent:
+        if exponent & 1:
+            np.multiply(result, base, out=result)
+            np.remainder(result, m, out=result)
+        exponent >>= 1
+        if exponent:
+            np.multiply(base, base, out=base)
+            np.remainder(base, m, out=base)
+    return result
+
+
+def reduce_hashes(hashed_values: Iterable[int], n: int) -> "np.ndarray":
+    """
+    Rút gọn giá trị băm (số nguyên Python) theo mod n - Reduce Python-int hash values mod n
+
+    Args:
+        hashed_values: Các giá trị băm - Hash values
+        n: Module RSA - RSA modulus
+
+    Returns:
+        np.ndarray: Giá trị băm mod n (uint64) - Hash values mod n (uint64)
+    """
+    import numpy as np
+
+    _check_modulus(n)
+    return np.fromiter((value % n for value in hashed_values), dtype=np.uint64)
+
+
+def hash_messages(messages: Iterable[Union[str, bytes]], n: int,
+                  digest_type: str = DIGEST_SHA256) -> "np.ndarray":
+    """
+    Băm nhiều thông điệp thành mảng giá trị mod n - Hash many messages into an array of values mod n
+
+    Args:
+        messages: Các thông điệp - Messages
+        n: Module RSA - RSA modulus
+        digest_type: Loại băm - Digest type
+
+    Returns:
+        np.ndarray: Giá trị băm mod n (uint64) - Hash values mod n (uint64)
+    """
+    engine = RSAEngine()
+    return reduce_hashes((engine.hash_message(message, digest_type) for message in messages), n)
+
+
+def batch_sign(hashed: "np.ndarray", private_key: Tuple[int, int]) -> "np.ndarray":
+    """
+    Ký cả mảng giá trị băm - Sign a whole array of hash values
+
+    Args:
+        hashed: Giá trị băm mod n - Hash values mod n
+        private_key: Khóa bí mật (d, n) - Private key
+
+    Returns:
+        np.ndarray: Chữ ký s = h^d mod n (uint64) - Signatures s = h^d mod n (uint64)
+    """
+    d, n = private_key
+    return powmod(hashed, d, n)
+
+
+def batch_verify(hashed: "np.ndarray", signatures: "np.ndarray",
+                 public_key: Tuple[int, int]) -> "np.ndarray":
+    """
+    Xác thực cả mảng chữ ký - Verify a whole array of signatures
+
+    Args:
+        hashed: Giá trị băm mod n - Hash values mod n
+        signatures: Chữ ký - Signatures
+        public_key: Khóa công khai (e, n) - Public key
+
+    Returns:
+        np.ndarray: Mảng bool, True khi h ≡ s^e (mod n) - Bool array, True where h ≡ s^e (mod n)
+    """
+    import numpy as np
+
+    e, n = public_key
+    _check_modulus(n)
+    return powmod(signatures, e, n) == np.asarray(hashed, dtype=np.uint64) % np.uint64(n)
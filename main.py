@@ -6,19 +6,102 @@ RSA Digital Signature System
 
 Giới thiệu: Ứng dụng thực hiện chữ ký điện tử RSA với giao diện đồ họa
 Introduction: Application implementing RSA digital signature with GUI
+
+Tùy chọn - Options:
+    --profile-startup   Đo thời gian khởi động - Report startup and import timings
 """
 
 import sys
 import os
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QTranslator
-from PyQt6.QtGui import QIcon
-from ui.main_window import MainWindow
+import time
+import builtins
+
+# Mốc thời gian bắt đầu tiến trình - Process start reference point
+_START_TIME = time.perf_counter()
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+
+class StartupProfiler:
+    """Đo thời gian nạp mô-đun và vẽ lần đầu - Measure import costs and time to first paint"""
+
+    def __init__(self):
+        self.import_times = []  # (tên mô-đun, độ sâu, giây) - (module, depth, seconds)
+        self.marks = []  # (nhãn, giây từ lúc bắt đầu) - (label, seconds since start)
+        self._depth = 0
+        self._original_import = None
+
+    def install(self):
+        """Cài móc đo thời gian import - Install the import timing hook"""
+        self._original_import = builtins.__import__
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Chỉ đo lần nạp đầu tiên - Only the first, uncached load is measured
+            if level or name in sys.modules:
+                return self._original_import(name, globals, locals, fromlist, level)
+
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return self._original_import(name, globals, locals, fromlist, level)
+            finally:
+                self._depth -= 1
+                self.import_times.append((name, self._depth, time.perf_counter() - start))
+
+        builtins.__import__ = timed_import
+
+    def uninstall(self):
+        """Gỡ móc đo thời gian import - Remove the import timing hook"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def mark(self, label: str):
+        """Ghi lại một mốc thời gian - Record a timeline mark"""
+        self.marks.append((label, time.perf_counter() - _START_TIME))
+
+    def report(self, stream=None):
+        """
+        In báo cáo khởi động - Print the startup report
+
+        Args:
+            stream: Luồng xuất (mặc định stderr) - Output stream (default stderr)
+        """
+        stream = stream or sys.stderr
+        print("=" * 60, file=stream)
+        print("STARTUP PROFILE - HỒ SƠ KHỞI ĐỘNG", file=stream)
+        print("=" * 60, file=stream)
+        for label, elapsed in self.marks:
+            print(f"  {elapsed * 1000:9.1f} ms  {label}", file=stream)
+
+        print("\nImports (inclusive, top-level) - Chi phí import:", file=stream)
+        top_level = sorted((item for item in self.import_times if item[1] == 0),
+                           key=lambda item: item[2], reverse=True)
+        for name, _, seconds in top_level:
+            print(f"  {seconds * 1000:9.1f} ms  {name}", file=stream)
+
+        deferred = [name for name in ("matplotlib", "numpy", "sympy") if name not in sys.modules]
+        print(f"\nDeferred (not loaded) - Chưa nạp: {', '.join(deferred) or '-'}", file=stream)
 
 
 def main():
     """Hàm chính của ứng dụng - Main application function"""
 
+    profiler = None
+    if PROFILE_STARTUP_FLAG in sys.argv:
+        sys.argv.remove(PROFILE_STARTUP_FLAG)
+        profiler = StartupProfiler()
+        profiler.install()
+
+    # Nạp Qt và giao diện tại đây để đo được - Import Qt and UI here so they can be measured
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTranslator, QObject, QEvent
+    from PyQt6.QtGui import QIcon
+    from ui.main_window import MainWindow
+
+    if profiler:
+        profiler.mark("imports done - nạp xong")
+
     # Tạo ứng dụng Qt - Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("Hệ Chữ Ký Điện Tử RSA")
@@ -47,14 +130,36 @@ def main():
 
     # Tạo và hiển thị cửa sổ chính - Create and show main window
     window = MainWindow()
+    if profiler:
+        profiler.mark("MainWindow constructed - tạo cửa sổ xong")
     window.show()
 
     # Thiết lập cửa sổ ở trung tâm màn hình - Center window on screen
     window.center_on_screen()
 
+    if profiler:
+        class FirstPaintFilter(QObject):
+            """Bắt sự kiện vẽ đầu tiên - Catch the first paint event"""
+
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint:
+                    app.removeEventFilter(self)
+                    profiler.mark("first paint - vẽ lần đầu")
+                    profiler.uninstall()
+                    profiler.report()
+                return False
+
+        # Lọc ở cấp ứng dụng để bắt widget vẽ đầu tiên - App-level filter catches whichever widget paints first
+        first_paint_filter = FirstPaintFilter(app)
+        app.installEventFilter(first_paint_filter)
+
     # Chạy ứng dụng - Run application
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Cần cho nhóm tiến trình "spawn" trong bản build PyInstaller
+    # Required for "spawn" process pools in PyInstaller builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+    main()
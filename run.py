@@ -10,6 +10,10 @@ with proper environment setup and error handling.
 
 import sys
 import os
+import json
+import hashlib
+import importlib.util
+import importlib.metadata
 import subprocess
 import platform
 
@@ -23,44 +27,145 @@ def check_python_version():
     return True
 
 
-def check_dependencies():
-    """Kiểm tra và cài đặt các thư viện cần thiết - Check and install required libraries"""
-    try:
-        import PyQt6
-        print("✓ PyQt6 is installed")
-    except ImportError:
-        print("✗ PyQt6 is not installed")
-        return False
+# (tên hiển thị, tên import, tên phân phối) - (display name, import name, distribution name)
+REQUIRED_PACKAGES = [
+    ("PyQt6", "PyQt6", "PyQt6"),
+    ("matplotlib", "matplotlib", "matplotlib"),
+    ("numpy", "numpy", "numpy"),
+    ("sympy", "sympy", "sympy"),
+    ("cryptography", "cryptography", "cryptography"),
+    ("Pillow", "PIL", "Pillow"),
+]
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REQUIREMENTS_FILE = os.path.join(BASE_DIR, "requirements.txt")
+DEPENDENCY_STAMP_FILE = os.path.join(BASE_DIR, ".dependency_stamp.json")
+
+# Thư mục cài gói được đưa vào dấu vân tay - Package install directories included in the fingerprint
+SITE_PACKAGE_DIRS = ("site-packages", "dist-packages")
+
+
+def _version_tuple(version):
+    """Chuyển chuỗi phiên bản thành tuple số - Convert a version string to a numeric tuple"""
+    parts = []
+    for part in version.split("."):
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
 
+
+def _read_minimum_versions():
+    """Đọc phiên bản tối thiểu từ requirements.txt - Read minimum versions from requirements.txt"""
+    minimums = {}
     try:
-        import matplotlib
-        print("✓ matplotlib is installed")
-    except ImportError:
-        print("✗ matplotlib is not installed")
-        return False
+        with open(REQUIREMENTS_FILE, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if ">=" in line:
+                    name, version = line.split(">=", 1)
+                    minimums[name.strip().lower()] = version.split(",")[0].strip()
+    except OSError:
+        pass
+    return minimums
+
+
+def _environment_fingerprint():
+    """
+    Dấu vân tay môi trường Python - Fingerprint of the Python environment
 
+    Thay đổi khi đổi trình thông dịch, requirements.txt hoặc khi cài/gỡ gói
+    (thư mục site-packages đổi mtime khi thêm/xóa gói). Chỉ xét các thư mục
+    cài gói: thư mục dự án đổi mtime mỗi khi ghi file dấu hay __pycache__.
+    Changes when the interpreter, requirements.txt or installed packages change
+    (site-packages directories change mtime when packages are added/removed).
+    Only package install directories count: the project directory changes
+    mtime whenever the stamp file or __pycache__ is written.
+    """
+    digest = hashlib.sha256()
+    digest.update(sys.executable.encode("utf-8"))
+    digest.update(sys.version.encode("utf-8"))
     try:
-        import numpy
-        print("✓ numpy is installed")
-    except ImportError:
-        print("✗ numpy is not installed")
-        return False
+        with open(REQUIREMENTS_FILE, "rb") as f:
+            digest.update(f.read())
+    except OSError:
+        pass
+    for path in sys.path:
+        if os.path.basename(os.path.normpath(path)) in SITE_PACKAGE_DIRS and os.path.isdir(path):
+            digest.update(f"{path}:{os.stat(path).st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
 
+def _load_stamp():
+    """Đọc file dấu kiểm tra - Read the dependency stamp file"""
     try:
-        import sympy
-        print("✓ sympy is installed")
-    except ImportError:
-        print("✗ sympy is not installed")
-        return False
+        with open(DEPENDENCY_STAMP_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
 
+
+def _save_stamp(fingerprint):
+    """Ghi file dấu kiểm tra - Write the dependency stamp file"""
     try:
-        from PIL import Image
-        print("✓ Pillow is installed")
-    except ImportError:
-        print("✗ Pillow is not installed")
-        return False
+        with open(DEPENDENCY_STAMP_FILE, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint}, f)
+    except OSError:
+        pass  # Không ghi được thì lần sau kiểm tra lại - Probe again next time
 
-    return True
+
+def probe_dependencies():
+    """
+    Dò các thư viện mà không import chúng - Probe libraries without importing them
+
+    Returns:
+        list: Danh sách (tên, phiên bản hoặc None, lỗi hoặc None)
+            - List of (name, version or None, problem or None)
+    """
+    minimums = _read_minimum_versions()
+    results = []
+    for display_name, import_name, dist_name in REQUIRED_PACKAGES:
+        if importlib.util.find_spec(import_name) is None:
+            results.append((display_name, None, "not installed"))
+            continue
+
+        try:
+            version = importlib.metadata.version(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            version = None
+
+        minimum = minimums.get(dist_name.lower())
+        if minimum and version and _version_tuple(version) < _version_tuple(minimum):
+            results.append((display_name, version, f"version {version} < required {minimum}"))
+        else:
+            results.append((display_name, version, None))
+    return results
+
+
+def check_dependencies():
+    """Kiểm tra các thư viện cần thiết - Check required libraries"""
+    fingerprint = _environment_fingerprint()
+    stamp = _load_stamp()
+    if stamp and stamp.get("fingerprint") == fingerprint:
+        print("✓ All dependencies are installed (cached)")
+        return True
+
+    all_ok = True
+    for name, version, problem in probe_dependencies():
+        if problem:
+            print(f"✗ {name}: {problem}")
+            all_ok = False
+        else:
+            print(f"✓ {name} is installed" + (f" ({version})" if version else ""))
+
+    if all_ok:
+        _save_stamp(fingerprint)
+    return all_ok
 
 
 def install_dependencies():
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử GCD hàng loạt - Batch GCD tests
+"""
+
+import math
+
+import pytest
+
+from crypto.batch_gcd import batch_gcd, find_shared_primes, parse_public_key, product_tree
+from crypto.rsa_engine import RSAEngine
+
+
+@pytest.fixture(scope="module")
+def primes():
+    engine = RSAEngine()
+    found = set()
+    while len(found) < 8:
+        found.add(engine.generate_prime(128))
+    return sorted(found)
+
+
+def test_product_tree():
+    tree = product_tree([3, 5, 7, 11, 13])
+
+    assert tree[0] == [3, 5, 7, 11, 13]
+    assert tree[-1] == [3 * 5 * 7 * 11 * 13]
+
+
+def test_batch_gcd_matches_pairwise(primes):
+    moduli = [primes[0] * primes[1], primes[1] * primes[2], primes[3] * primes[4], primes[5] * primes[6]]
+
+    expected = [math.gcd(n, math.prod(moduli[:i] + moduli[i + 1:])) for i, n in enumerate(moduli)]
+    assert batch_gcd(moduli) == expected
+    assert batch_gcd([]) == []
+
+
+def test_shared_prime_found(primes):
+    p, q, r, s, t = primes[:5]
+    keys = [(65537, p * q), (65537, p * r), (65537, s * t)]
+
+    findings = find_shared_primes(keys)
+    assert [finding['index'] for finding in findings] == [0, 1]
+    for finding in findings:
+        assert finding['kind'] == 'shared_prime'
+        assert finding['factor'] == p
+    assert findings[0]['peers'] == [1]
+
+
+def test_both_primes_shared_are_split_pairwise(primes):
+    p, q, r, s = primes[:4]
+    keys = [(3, p * q), (3, p * r), (3, q * s)]
+
+    findings = find_shared_primes(keys)
+    # g_0 = n_0, nhưng gcd từng cặp vẫn tách được - g_0 = n_0, yet pairwise gcds still split it
+    assert findings[0]['factor'] in (p, q)
+    assert findings[0]['peers'] == [1, 2]
+
+
+def test_duplicate_moduli(primes):
+    n = primes[0] * primes[1]
+    keys = [(3, n), (65537, n), (65537, primes[2] * primes[3])]
+
+    findings = find_shared_primes(keys)
+    assert [(finding['index'], finding['kind']) for finding in findings] == [(0, 'duplicate'), (1, 'duplicate')]
+    assert findings[0]['peers'] == [1]
+
+
+def test_no_shared_primes(primes):
+    keys = [(65537, primes[0] * primes[1]), (65537, primes[2] * primes[3])]
+
+    assert find_shared_primes(keys) == []
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("65537 3233", (65537, 3233)),
+    ("17, 0xca1", (17, 3233)),
+    ('{"key_info": {"e": 17, "n": 3233}}', (17, 3233)),
+])
+def test_parse_public_key(line, expected):
+    assert parse_public_key(line) == expected
+
+
+def test_parse_public_key_rejects_malformed():
+    with pytest.raises(ValueError):
+        parse_public_key("17")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử phân tích thừa số - Factoring tests
+"""
+
+import pytest
+
+from crypto.factoring import benchmark_factoring, break_key, euler_phi, factor, trial_division
+from crypto.rsa_engine import CancellationToken, OperationCancelled, RSAEngine
+
+
+def test_trial_division():
+    # Bảng chia thử dừng dưới 2^16 - The trial table stops below 2^16
+    factors, rest = trial_division(2 ** 3 * 3 * 65537 * 1000003)
+
+    assert factors == [2, 2, 2, 3]
+    assert rest == 65537 * 1000003
+
+
+def test_factor_semiprime():
+    engine = RSAEngine()
+    p, q = engine.generate_prime(40), engine.generate_prime(40)
+
+    result = factor(p * q, time_budget=30)
+    assert result.complete
+    assert result.factors == sorted((p, q))
+    assert len(result.methods) == 1
+
+
+def test_factor_with_multiplicity():
+    result = factor(101 ** 3 * 1000003 ** 2)
+
+    assert result.factors == [101, 101, 101, 1000003, 1000003]
+    assert euler_phi(result.factors) == 100 * 101 ** 2 * 1000002 * 1000003
+
+
+def test_break_key_recovers_d():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=32, prime_count=3)
+
+    broken = break_key(engine.e, engine.n, time_budget=30)
+    assert broken['factors'] == sorted(engine.primes)
+    assert broken['phi'] == engine.phi
+    message = 424242 % engine.n
+    assert pow(pow(message, broken['d'], engine.n), engine.e, engine.n) == message
+
+
+def test_break_key_out_of_budget():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=256)
+
+    result = factor(engine.n, time_budget=0.05)
+    assert not result.complete
+    assert result.cofactor == engine.n
+    with pytest.raises(ValueError):
+        break_key(engine.e, engine.n, time_budget=0.05)
+
+
+def test_factor_rejects_small_n():
+    with pytest.raises(ValueError):
+        factor(1)
+
+
+def test_benchmark_reports_each_size():
+    rows = []
+
+    assert benchmark_factoring((16, 24), trials=2, progress=rows.append) == rows
+    assert [row['bits'] for row in rows] == [16, 24]
+    assert all(row['complete'] for row in rows)
+
+
+def test_benchmark_stops_when_cancelled():
+    token = CancellationToken()
+    rows = []
+
+    def cancel_after_first(row):
+        rows.append(row)
+        token.cancel()
+
+    with pytest.raises(OperationCancelled):
+        benchmark_factoring((16, 24, 32), trials=2, progress=cancel_after_first, cancel_token=token)
+    assert [row['bits'] for row in rows] == [16]
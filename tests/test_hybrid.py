@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử mã hóa lai dạng luồng - Streaming hybrid encryption tests
+"""
+
+import io
+import os
+
+import pytest
+
+from crypto.hybrid import (
+    MAGIC, TAG_BYTES, decrypt_stream, encrypt_stream, main, private_key_object
+)
+from crypto.rsa_engine import RSAEngine
+
+CHUNK = 1024
+
+
+@pytest.fixture(scope="module")
+def key():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=512)
+    return engine
+
+
+def _encrypt(key, data: bytes, chunk_size: int = CHUNK) -> bytes:
+    output = io.BytesIO()
+    assert encrypt_stream(io.BytesIO(data), output, (key.e, key.n), chunk_size) == len(data)
+    return output.getvalue()
+
+
+def _decrypt(key, data: bytes, primes=None) -> bytes:
+    output = io.BytesIO()
+    decrypt_stream(io.BytesIO(data), output, (key.d, key.n), key.e, primes)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("size", [0, 1, CHUNK - 1, CHUNK, CHUNK + 1, 5 * CHUNK])
+def test_round_trip(key, size):
+    data = os.urandom(size)
+
+    encrypted = _encrypt(key, data)
+    assert encrypted.startswith(MAGIC)
+    assert _decrypt(key, encrypted) == data
+    assert _decrypt(key, encrypted, key.primes) == data
+
+
+def test_tampered_chunk_is_rejected(key):
+    encrypted = bytearray(_encrypt(key, os.urandom(3 * CHUNK)))
+    encrypted[-TAG_BYTES - CHUNK // 2] ^= 1
+
+    with pytest.raises(ValueError):
+        _decrypt(key, bytes(encrypted))
+
+
+@pytest.mark.parametrize("cut", [1, TAG_BYTES, CHUNK + TAG_BYTES])
+def test_truncation_is_rejected(key, cut):
+    # 3 khối đầy và một khối cuối rỗng - Three full chunks and an empty final chunk
+    encrypted = _encrypt(key, os.urandom(3 * CHUNK))
+
+    with pytest.raises(ValueError):
+        _decrypt(key, encrypted[:-cut])
+
+
+def test_wrong_key_is_rejected(key):
+    other = RSAEngine()
+    other.generate_keys(prime_bits=512)
+    encrypted = _encrypt(key, b"secret")
+
+    with pytest.raises(ValueError):
+        _decrypt(other, encrypted)
+
+
+def test_multi_prime_key_is_rejected():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=300, prime_count=3)
+
+    for primes in (None, engine.primes):
+        with pytest.raises(ValueError, match="two-prime"):
+            private_key_object((engine.d, engine.n), engine.e, primes)
+
+
+def test_cli_round_trip(key, tmp_path):
+    plain, encrypted, decrypted = tmp_path / "plain", tmp_path / "enc", tmp_path / "dec"
+    plain.write_bytes(os.urandom(100000))
+
+    assert main(['encrypt', str(key.e), hex(key.n), str(plain), str(encrypted)]) == 0
+    assert main(['decrypt', str(key.e), str(key.d), str(key.n), str(encrypted), str(decrypted)]) == 0
+    assert decrypted.read_bytes() == plain.read_bytes()
+
+
+def test_cli_bad_key_keeps_existing_output(tmp_path):
+    plain, output = tmp_path / "plain", tmp_path / "out"
+    plain.write_bytes(b"data")
+    output.write_bytes(b"keep me")
+
+    assert main(['encrypt', '3', '3233', str(plain), str(output)]) == 1
+    assert output.read_bytes() == b"keep me"
+    assert sorted(os.listdir(tmp_path)) == ["out", "plain"]
+
+
+def test_cli_tamper_leaves_no_plaintext(key, tmp_path):
+    encrypted, output = tmp_path / "enc", tmp_path / "out"
+    data = bytearray(_encrypt(key, os.urandom(200000), chunk_size=64 * 1024))
+    data[-100] ^= 1
+    encrypted.write_bytes(bytes(data))
+
+    assert main(['decrypt', str(key.e), str(key.d), str(key.n), str(encrypted), str(output)]) == 1
+    assert sorted(os.listdir(tmp_path)) == ["enc"]
+
+
+def test_cli_missing_input(key, tmp_path, capsys):
+    output = tmp_path / "out"
+
+    assert main(['encrypt', str(key.e), str(key.n), str(tmp_path / "missing"), str(output)]) == 1
+    assert "missing" in capsys.readouterr().err
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử kiểm tra chất lượng khóa - Key quality audit tests
+"""
+
+import math
+
+import pytest
+
+from crypto.key_audit import (
+    CHECK_EXPONENT, CHECK_FERMAT, CHECK_PHI_GCD, CHECK_SHARED_PRIME, CHECK_SMALL_FACTOR, CHECK_WIENER,
+    FERMAT_ITERATIONS, STATUS_FAIL, STATUS_PASS, STATUS_SKIPPED, STATUS_WARN,
+    audit_key, audit_keys, fermat_factor, fermat_iterations, wiener_attack
+)
+from crypto.rsa_engine import RSAEngine
+
+
+def _statuses(result):
+    """Phép kiểm tra -> trạng thái - Check -> status"""
+    return {finding.check: finding.status for finding in result.findings}
+
+
+def _next_prime(engine, value):
+    """Số nguyên tố đầu tiên >= value - First prime >= value"""
+    value |= 1
+    while not engine.is_prime(value, k=20):
+        value += 2
+    return value
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return RSAEngine()
+
+
+@pytest.fixture(scope="module")
+def good_key():
+    key = RSAEngine()
+    key.generate_keys(prime_bits=256)
+    return key
+
+
+def test_good_key_passes(good_key):
+    result = audit_key(good_key.e, good_key.n)
+
+    assert result.passed
+    assert _statuses(result)[CHECK_PHI_GCD] == STATUS_SKIPPED
+    known = audit_key(good_key.e, good_key.n, primes=good_key.primes, d=good_key.d)
+    assert known.passed
+    assert _statuses(known) == {CHECK_EXPONENT: STATUS_PASS, CHECK_SMALL_FACTOR: STATUS_PASS,
+                                CHECK_FERMAT: STATUS_PASS, CHECK_WIENER: STATUS_PASS,
+                                CHECK_PHI_GCD: STATUS_PASS}
+
+
+def test_close_primes_found_by_fermat(engine):
+    p = engine.generate_prime(256)
+    q = _next_prime(engine, p + 2 ** 100)
+    n = p * q
+
+    assert fermat_factor(n) in (p, q)
+    assert fermat_iterations(n, p, q) < FERMAT_ITERATIONS
+    searched = audit_key(65537, n)
+    assert _statuses(searched)[CHECK_FERMAT] == STATUS_FAIL
+    assert searched.factors == [p, q]
+    known = audit_key(65537, n, primes=[q, p])
+    assert _statuses(known)[CHECK_FERMAT] == STATUS_FAIL
+
+
+def test_fermat_iterations_agree_with_search(engine):
+    p = engine.generate_prime(256)
+    for gap in (2 ** 200, 2 ** 262, 2 ** 300):
+        q = _next_prime(engine, p + gap)
+        n = p * q
+        assert (fermat_factor(n) is not None) == (fermat_iterations(n, p, q) < FERMAT_ITERATIONS)
+
+
+def test_even_modulus_skips_fermat(engine):
+    result = audit_key(65537, 2 * engine.generate_prime(128))
+
+    statuses = _statuses(result)
+    assert statuses[CHECK_SMALL_FACTOR] == STATUS_FAIL
+    assert statuses[CHECK_FERMAT] == STATUS_SKIPPED
+
+
+def test_wiener_recovers_small_d(engine):
+    p, q = engine.generate_prime(256), engine.generate_prime(256)
+    n, phi = p * q, (p - 1) * (q - 1)
+    d = engine.generate_prime(60)
+    while math.gcd(d, phi) != 1:
+        d = engine.generate_prime(60)
+    e = pow(d, -1, phi)
+
+    assert wiener_attack(e, n) == d
+    result = audit_key(e, n)
+    assert _statuses(result)[CHECK_WIENER] == STATUS_FAIL
+    assert result.factors == sorted((p, q))
+    assert _statuses(audit_key(e, n, d=d))[CHECK_WIENER] == STATUS_FAIL
+
+
+def test_small_and_huge_exponents(good_key):
+    assert _statuses(audit_key(3, good_key.n))[CHECK_EXPONENT] == STATUS_WARN
+
+    huge = audit_key(2 ** 600, good_key.n)
+    finding = next(finding for finding in huge.findings if finding.check == CHECK_EXPONENT)
+    assert finding.status == STATUS_FAIL
+    # Số lớn được rút gọn - Big values are elided
+    assert str(2 ** 600) not in finding.detail
+    assert "…" in finding.detail
+
+
+def test_factors_must_multiply_to_n(good_key):
+    with pytest.raises(ValueError):
+        audit_key(good_key.e, good_key.n, primes=[3, 5])
+
+
+def test_audit_keys_flags_shared_prime(engine):
+    p, q, r, s, t = (engine.generate_prime(128) for _ in range(5))
+    keys = [(65537, p * q), (65537, p * r), (65537, s * t)]
+
+    results = audit_keys(keys, max_workers=1)
+    assert [_statuses(result)[CHECK_SHARED_PRIME] for result in results] == [STATUS_FAIL, STATUS_FAIL, STATUS_PASS]
+    assert results[0].factors == sorted((p, q))
+    assert not results[0].passed and results[2].passed
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử định dạng số nguyên lớn - Big integer formatting tests
+"""
+
+import pytest
+
+from visualization.number_format import BASE_DECIMAL, BASE_HEX, ELIDE_DIGITS, elide_int, full_text, parse_int
+
+# Vượt giới hạn 4300 chữ số của int() - Beyond int()'s 4300-digit limit
+HUGE = 3 ** 20000 + 12345
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 10 ** ELIDE_DIGITS, 2 ** 2048 - 1, HUGE, -HUGE],
+                         ids=["0", "1", "-1", "10^16", "2^2048-1", "huge", "-huge"])
+@pytest.mark.parametrize("base", [BASE_DECIMAL, BASE_HEX])
+def test_full_text_round_trip(value, base):
+    text = full_text(value, base)
+
+    assert parse_int(text) == value
+    if base == BASE_HEX:
+        assert text.lstrip('-').startswith('0x')
+
+
+@pytest.mark.parametrize("value", [2 ** 2048 - 1, HUGE, -HUGE], ids=["2^2048-1", "huge", "-huge"])
+@pytest.mark.parametrize("base", [BASE_DECIMAL, BASE_HEX])
+def test_elided_ends_match_full_text(value, base):
+    full = full_text(value, base)
+    elided = elide_int(value, base=base)
+
+    head, rest = elided.split('…')
+    tail, bits = rest.split(' (')
+    assert full.startswith(head)
+    assert full.endswith(tail)
+    assert len(tail) == ELIDE_DIGITS
+    assert bits == f"{abs(value).bit_length()} bit)"
+
+
+@pytest.mark.parametrize("value", [0, 7, -3233, 10 ** (2 * ELIDE_DIGITS)])
+@pytest.mark.parametrize("base", [BASE_DECIMAL, BASE_HEX])
+def test_short_values_are_not_elided(value, base):
+    elided = elide_int(value, base=base)
+
+    assert '…' not in elided
+    assert parse_int(elided) == value
+
+
+def test_parse_int_accepts_separators_and_signs():
+    assert parse_int(" 1_000_000 ") == 1000000
+    assert parse_int("+0xFF") == 255
+    assert parse_int("-0x_ff") == -255
+
+
+@pytest.mark.parametrize("text", ["", "12a", "1.5", "--1", "+-1", "0x", "0x-5", "0x 5", "١٢"])
+def test_parse_int_rejects_garbage(text):
+    with pytest.raises(ValueError):
+        parse_int(text)
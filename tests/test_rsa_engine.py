@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử động cơ RSA - RSA engine tests
+"""
+
+import math
+
+import pytest
+
+from crypto.rsa_engine import RSAEngine, crt_parameters, crt_power
+
+
+@pytest.mark.parametrize("prime_count", [2, 3, 4])
+def test_multi_prime_crt_round_trip(prime_count):
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=128, prime_count=prime_count)
+
+    assert len(engine.primes) == prime_count
+    hashed = engine.hash_message("Hello RSA")
+    signature = engine.sign_digest(hashed)
+    assert signature == pow(hashed % engine.n, engine.d, engine.n)
+    assert engine.verify("Hello RSA", signature)
+    assert not engine.verify("Hello RSB", signature)
+
+
+def test_crt_power_matches_pow():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=96, prime_count=3)
+
+    for base in (0, 1, 2, engine.n - 1, 123456789):
+        expected = pow(base, engine.d, engine.n)
+        assert crt_power(base, engine.d, engine.primes) == expected
+        assert crt_power(base, engine.d, engine.primes, engine.crt_params) == expected
+
+
+def test_crt_parameters_are_kept_per_engine():
+    first, second = RSAEngine(), RSAEngine()
+    first.generate_keys(prime_bits=64)
+    second.generate_keys(prime_bits=64)
+
+    assert first.crt_params == crt_parameters(first.d, first.primes)
+    assert second.crt_params == crt_parameters(second.d, second.primes)
+    # Không có bộ đệm cấp mô-đun giữ số mũ bí mật - No module-level cache holds private exponents
+    assert not hasattr(crt_parameters, 'cache_info')
+
+
+def test_key_info_without_keys():
+    info = RSAEngine().get_key_info()
+
+    assert info['primes'] is None
+    assert info['crt_exponents'] is None
+    assert info['crt_coefficients'] is None
+
+
+@pytest.mark.parametrize("bits", [8, 64])
+def test_primes_are_usable_with_e(bits):
+    engine = RSAEngine()
+    stats = []
+
+    for _ in range(20):
+        prime = engine.generate_prime(bits, progress=stats.append, e=3)
+        assert engine.is_prime(prime) and prime.bit_length() == bits
+        assert math.gcd(3, prime - 1) == 1
+        engine.generate_keys(e=3, prime_bits=bits)
+        assert engine.e * engine.d % engine.phi == 1
+    assert stats[-1]['done']
+
+
+def test_unusable_primes_and_exponents_are_rejected():
+    engine = RSAEngine()
+
+    # 7 - 1 chia hết cho 3 - 7 - 1 is divisible by 3
+    with pytest.raises(ValueError):
+        engine.generate_keys(p=7, q=11, e=3)
+    for e in (1, 4):
+        with pytest.raises(ValueError):
+            engine.generate_keys(e=e)
+
+
+@pytest.mark.parametrize("bits", [12, 64])
+def test_safe_primes(bits):
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=bits, safe_primes=True, e=3)
+
+    for prime in engine.primes:
+        assert prime.bit_length() == bits
+        assert engine.is_safe_prime(prime)
+        assert engine.is_prime((prime - 1) // 2)
+        assert math.gcd(3, prime - 1) == 1
+    assert engine.verify("safe", engine.sign("safe"))
+
+
+def test_given_prime_must_be_safe():
+    with pytest.raises(ValueError):
+        # 13 là số nguyên tố nhưng 6 thì không - 13 is prime but 6 is not
+        RSAEngine().generate_keys(p=13, q=23, safe_primes=True)
+
+
+def test_table_primes_cover_each_bit_length():
+    engine = RSAEngine()
+
+    for bits in range(2, 17):
+        prime = engine.generate_prime(bits)
+        assert prime.bit_length() == bits and engine.is_prime(prime, k=20)
+
+
+def test_small_safe_primes_exact_fit():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=8, safe_primes=True, prime_count=3)
+
+    assert sorted(engine.primes) == [167, 179, 227]
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(prime_bits=3, prime_count=3),
+    dict(prime_bits=8, safe_primes=True, prime_count=4),
+])
+def test_exhausted_small_primes_raise(kwargs):
+    with pytest.raises(ValueError):
+        RSAEngine().generate_keys(**kwargs)
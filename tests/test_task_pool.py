@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử nhóm luồng xử lý - Worker pool tests
+"""
+
+import threading
+import time
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from ui.task_pool import TaskPool  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture
+def pool(app):
+    pool = TaskPool(max_concurrent=4)
+    yield pool
+    assert pool.shutdown()
+
+
+def _pump(condition, timeout: float = 5.0):
+    """Xử lý sự kiện đến khi điều kiện đúng - Process events until the condition holds"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Hết thời gian chờ - Timed out"
+        QtCore.QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
+def _gated(gate: threading.Event, value):
+    """Tác vụ chờ cổng rồi trả về, bỏ qua cờ hủy - Task that waits on a gate and ignores cancellation"""
+    def task(token, report_progress):
+        gate.wait(5)
+        report_progress(value)
+        return value
+    return task
+
+
+def test_new_task_supersedes_channel(pool):
+    gate = threading.Event()
+    tokens = []
+
+    def first(token, report_progress):
+        tokens.append(token)
+        gate.wait(5)
+        token.raise_if_cancelled()
+        return "old"
+
+    results = []
+    pool.submit(first, on_result=results.append, channel="sign")
+    _pump(lambda: tokens)
+    pool.submit(lambda token, report_progress: "new", on_result=results.append, channel="sign")
+
+    assert tokens[0].cancelled
+    gate.set()
+    _pump(lambda: results and not pool.is_active("sign"))
+    assert results == ["new"]
+
+
+def test_stale_result_and_progress_are_dropped(pool):
+    gate = threading.Event()
+    results, progress = [], []
+
+    pool.submit(_gated(gate, "old"), on_result=results.append, on_progress=progress.append, channel="verify")
+    pool.submit(_gated(gate, "new"), on_result=results.append, on_progress=progress.append, channel="verify")
+    gate.set()
+
+    _pump(lambda: results)
+    pool.shutdown()
+    QtCore.QCoreApplication.processEvents()
+    assert results == ["new"]
+    assert progress == ["new"]
+
+
+def test_channels_are_independent(pool):
+    gate = threading.Event()
+    results = []
+
+    pool.submit(_gated(gate, "render"), on_result=results.append, channel="diagram:signing")
+    pool.submit(_gated(gate, "refresh"), on_result=results.append, channel="diagram-refresh:signing")
+    gate.set()
+
+    _pump(lambda: len(results) == 2)
+    assert sorted(results) == ["refresh", "render"]
+
+
+def test_cancel_channel_drops_result(pool):
+    gate = threading.Event()
+    results, errors = [], []
+
+    pool.submit(_gated(gate, "value"), on_result=results.append, on_error=errors.append, channel="report")
+    pool.cancel_channel("report")
+    assert not pool.is_active("report")
+    gate.set()
+
+    assert pool.shutdown()
+    QtCore.QCoreApplication.processEvents()
+    assert results == [] and errors == []
+
+
+def test_error_is_delivered(pool):
+    errors = []
+
+    def fail(token, report_progress):
+        raise ValueError("boom")
+
+    pool.submit(fail, on_error=errors.append)
+    _pump(lambda: errors)
+    assert errors == ["boom"]
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử băm cây song song - Parallel tree hashing tests
+"""
+
+import hashlib
+import os
+import struct
+
+import pytest
+
+from crypto.rsa_engine import RSAEngine
+from crypto.tree_hash import (
+    DIGEST_SHA256, DIGEST_TREE_SHA256_V1, digest_bytes, digest_file, tree_hash, tree_hash_file
+)
+
+CHUNK = 1024
+
+
+def _serial_tree_hash(data: bytes, chunk_size: int) -> bytes:
+    """Cài đặt tham chiếu tuần tự theo định dạng v1 - Serial reference of the v1 format"""
+    root = hashlib.sha256(b'\x01' + DIGEST_TREE_SHA256_V1.encode('ascii'))
+    root.update(struct.pack('>QQ', chunk_size, len(data)))
+    for offset in range(0, len(data), chunk_size):
+        root.update(hashlib.sha256(b'\x00' + data[offset:offset + chunk_size]).digest())
+    if not data:
+        root.update(hashlib.sha256(b'\x00').digest())
+    return root.digest()
+
+
+@pytest.mark.parametrize("size", [0, 1, CHUNK - 1, CHUNK, CHUNK + 1, 2 * CHUNK, 7 * CHUNK + 3])
+def test_parallel_matches_serial(size, tmp_path):
+    data = os.urandom(size)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    expected = _serial_tree_hash(data, CHUNK)
+    for workers in (1, 2, 8):
+        assert tree_hash(data, CHUNK, max_workers=workers) == expected
+        assert tree_hash_file(str(path), CHUNK, max_workers=workers) == expected
+
+
+def test_chunk_boundary_digest_is_stable():
+    data = bytes(range(256)) * 8
+
+    # Giá trị cố định của định dạng v1: hai khối đầy - Pinned v1 value: exactly two full chunks
+    assert tree_hash(data, chunk_size=CHUNK).hex() == \
+        "acfb546856516c8689cfff5a06f0bf54d3c1adaeb04d8fd6c21630af1e167f18"
+    # Cách chia khác cho giá trị khác - A different split gives a different digest
+    assert tree_hash(data, chunk_size=CHUNK // 2) != tree_hash(data, chunk_size=CHUNK)
+    assert tree_hash(data[:-1], chunk_size=CHUNK) != tree_hash(data, chunk_size=CHUNK)
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        tree_hash(b"data", chunk_size=0)
+
+
+def test_digest_types(tmp_path):
+    path = tmp_path / "data.bin"
+    data = bytes(range(256)) * 1000
+    path.write_bytes(data)
+
+    expected = hashlib.sha256(data).digest()
+    assert digest_bytes(data) == expected
+    assert digest_file(str(path)) == expected
+    assert RSAEngine().hash_file(str(path)) == int.from_bytes(expected, 'big')
+    assert digest_file(str(path), DIGEST_TREE_SHA256_V1) == digest_bytes(data, DIGEST_TREE_SHA256_V1)
+    assert digest_bytes(data, DIGEST_SHA256) == expected
+    with pytest.raises(ValueError):
+        digest_bytes(data, "md5")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kiểm thử RSA vector hóa - Vectorized RSA tests
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from crypto.rsa_engine import RSAEngine  # noqa: E402
+from crypto.vectorized import (  # noqa: E402
+    MAX_VECTOR_MODULUS, batch_sign, batch_verify, hash_messages, powmod, supports_modulus
+)
+
+# Module lớn nhất được hỗ trợ - Largest supported modulus
+LARGEST_MODULUS = MAX_VECTOR_MODULUS - 5
+
+
+@pytest.mark.parametrize("modulus", [2, 3233, 65521 * 65519, LARGEST_MODULUS])
+def test_powmod_matches_pow(modulus):
+    rng = random.Random(modulus)
+    bases = [0, 1, modulus - 1] + [rng.randrange(modulus) for _ in range(200)]
+
+    for exponent in (0, 1, 2, 3, 65537, rng.getrandbits(64)):
+        expected = [pow(base, exponent, modulus) for base in bases]
+        assert powmod(np.array(bases, dtype=np.uint64), exponent, modulus).tolist() == expected
+
+
+def test_batch_sign_and_verify_match_engine():
+    engine = RSAEngine()
+    engine.generate_keys(prime_bits=16)
+    messages = [f"message {i}" for i in range(100)]
+
+    hashed = hash_messages(messages, engine.n)
+    signatures = batch_sign(hashed, engine.private_key)
+    assert signatures.tolist() == [engine.sign(message) for message in messages]
+    assert batch_verify(hashed, signatures, engine.public_key).all()
+
+    forged = signatures.copy()
+    forged[::2] = (forged[::2] + 1) % np.uint64(engine.n)
+    assert batch_verify(hashed, forged, engine.public_key).tolist() == [i % 2 == 1 for i in range(100)]
+
+
+def test_large_modulus_is_rejected():
+    assert supports_modulus(LARGEST_MODULUS)
+    assert not supports_modulus(MAX_VECTOR_MODULUS)
+    with pytest.raises(ValueError):
+        powmod(np.array([2], dtype=np.uint64), 3, MAX_VECTOR_MODULUS + 1)
+    with pytest.raises(ValueError):
+        powmod(np.array([2], dtype=np.uint64), -1, 3233)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Big Number Display
+Hiển thị số nguyên lớn
+
+Khóa RSA thực có hàng nghìn chữ số. Module này hiển thị dạng rút gọn kèm số
+bit, chỉ chuyển đổi đầy đủ khi người dùng yêu cầu và lưu lại kết quả.
+Real RSA keys have thousands of digits. This module shows an elided form with
+the bit length, converts the full value only on demand and caches the result.
+
+Các hàm định dạng nằm trong visualization.number_format.
+The formatting helpers live in visualization.number_format.
+"""
+
+from typing import Optional
+
+from PyQt6.QtWidgets import (
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton, QPlainTextEdit, QApplication
+)
+
+from visualization.number_format import (
+    BASE_DECIMAL, BASE_HEX, elide_int, full_text, parse_int
+)
+
+
+class BigNumberView(QWidget):
+    """
+    Hiển thị số nguyên lớn dạng rút gọn, mở rộng khi cần
+    Shows a big integer elided, expanding on demand
+
+    Nút ⇄ đổi giữa thập phân và hex; "Đầy đủ" hiện toàn bộ số; "Sao chép"
+    chép toàn bộ số vào bộ nhớ tạm.
+    The ⇄ button switches decimal/hex; "Full" shows the whole number; "Copy"
+    copies the whole number to the clipboard.
+    """
+
+    def __init__(self, placeholder: str = "Chưa có - None", parent: Optional[QWidget] = None):
+        """
+        Args:
+            placeholder: Chữ hiển thị khi chưa có giá trị - Text shown without a value
+            parent: Widget cha - Parent widget
+        """
+        super().__init__(parent)
+        self._value: Optional[int] = None
+        self._base = BASE_DECIMAL
+        self._placeholder = placeholder
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        row = QHBoxLayout()
+        self.label = QLabel(placeholder)
+        self.label.setStyleSheet(
+            "QLabel { font-family: monospace; background-color: #1e272e; color: #ecf0f1; padding: 8px 10px; border: 1px solid #2c3e50; border-radius: 6px; }"
+        )
+        row.addWidget(self.label, 1)
+
+        self.base_btn = QPushButton("⇄ hex")
+        self.base_btn.setToolTip("Đổi thập phân/hex - Toggle decimal/hex")
+        self.base_btn.clicked.connect(self.toggle_base)
+        row.addWidget(self.base_btn)
+
+        self.expand_btn = QPushButton("Đầy đủ - Full")
+        self.expand_btn.setCheckable(True)
+        self.expand_btn.toggled.connect(self.set_expanded)
+        row.addWidget(self.expand_btn)
+
+        self.copy_btn = QPushButton("📋")
+        self.copy_btn.setToolTip("Sao chép - Copy")
+        self.copy_btn.clicked.connect(self.copy_to_clipboard)
+        row.addWidget(self.copy_btn)
+        layout.addLayout(row)
+
+        # Ô hiển thị đầy đủ chỉ tạo khi cần - The full-text box is created on demand
+        self._full_view: Optional[QPlainTextEdit] = None
+        self._update_buttons()
+
+    def value(self) -> Optional[int]:
+        """Giá trị hiện tại - Current value"""
+        return self._value
+
+    def set_value(self, value: Optional[int]):
+        """
+        Đặt giá trị mới - Set a new value
+
+        Args:
+            value: Số nguyên, hoặc None để xóa - Integer, or None to clear
+        """
+        self._value = value
+        self._refresh()
+
+    def toggle_base(self):
+        """Đổi giữa thập phân và hex - Switch between decimal and hex"""
+        self._base = BASE_HEX if self._base == BASE_DECIMAL else BASE_DECIMAL
+        self.base_btn.setText("⇄ dec" if self._base == BASE_HEX else "⇄ hex")
+        self._refresh()
+
+    def set_expanded(self, expanded: bool):
+        """
+        Hiện/ẩn toàn bộ số - Show or hide the full number
+
+        Args:
+            expanded: True để hiện - True to show
+        """
+        if expanded and self._full_view is None:
+            self._full_view = QPlainTextEdit()
+            self._full_view.setReadOnly(True)
+            self._full_view.setMaximumHeight(120)
+            self._full_view.setStyleSheet("QPlainTextEdit { font-family: monospace; }")
+            self.layout().addWidget(self._full_view)
+        if self._full_view is not None:
+            self._full_view.setVisible(expanded)
+        self._refresh()
+
+    def copy_to_clipboard(self):
+        """Chép toàn bộ số vào bộ nhớ tạm - Copy the full number to the clipboard"""
+        if self._value is not None:
+            QApplication.clipboard().setText(full_text(self._value, self._base))
+
+    def _refresh(self):
+        """Cập nhật nhãn và ô đầy đủ - Update the label and the full-text box"""
+        if self._value is None:
+            self.label.setText(self._placeholder)
+        else:
+            self.label.setText(elide_int(self._value, base=self._base))
+
+        # Chỉ chuyển đổi đầy đủ khi ô đang hiện - Convert in full only while the box is shown
+        if self._full_view is not None and self._full_view.isVisibleTo(self):
+            self._full_view.setPlainText("" if self._value is None else full_text(self._value, self._base))
+        self._update_buttons()
+
+    def _update_buttons(self):
+        """Bật/tắt nút theo giá trị - Enable buttons depending on the value"""
+        has_value = self._value is not None
+        for button in (self.base_btn, self.expand_btn, self.copy_btn):
+            button.setEnabled(has_value)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Embedded Diagram Panel
+Bảng sơ đồ nhúng
+
+Module này vẽ sơ đồ trực tiếp lên FigureCanvasQTAgg trong cửa sổ, có phóng to
+và kéo, thay vì mã hóa PNG rồi mở trong cửa sổ thoại. Luồng xử lý chỉ tính nội
+dung chữ (prepare); luồng giao diện dựng các đối tượng vẽ một lần và chỉ cập
+nhật chữ (show_spec).
+This module draws diagrams directly onto a FigureCanvasQTAgg inside the window,
+with zoom and pan, instead of encoding a PNG and opening it in a dialog. A
+worker only computes the texts (prepare); the UI thread builds the artists once
+and then only updates texts (show_spec).
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QWidget
+
+from visualization.math_visualizer import DiagramSpec, MathVisualizer
+
+
+class DiagramPanel(QGroupBox):
+    """
+    Khung chứa canvas matplotlib tương tác - Group box holding an interactive matplotlib canvas
+
+    matplotlib chỉ được nạp khi sơ đồ đầu tiên được hiển thị. Khi cùng loại sơ
+    đồ được vẽ lại, chỉ nội dung chữ thay đổi và mức phóng to được giữ nguyên.
+    matplotlib is only imported when the first diagram is shown. When the same
+    kind of diagram is shown again, only its texts change and the zoom is kept.
+    """
+
+    MINIMUM_CANVAS_HEIGHT = 480
+
+    def __init__(self, title: str, visualizer: Callable[[], MathVisualizer],
+                 parent: Optional[QWidget] = None):
+        """
+        Args:
+            title: Tiêu đề khung - Group box title
+            visualizer: Hàm trả về trình trực quan hóa - Callable returning the visualizer
+            parent: Widget cha - Parent widget
+        """
+        super().__init__(title, parent)
+        self._visualizer = visualizer
+        self._layout = QVBoxLayout(self)
+        self.figure = None
+        self.canvas = None
+        self.toolbar = None
+        self._patches = None
+        self._current: Optional[Tuple[str, Any]] = None
+        self._artists: Dict[str, Any] = {}
+        self.setVisible(False)
+
+    @property
+    def diagram_type(self) -> Optional[str]:
+        """Loại sơ đồ đang hiển thị - Diagram type currently shown"""
+        return self._current[0] if self._current else None
+
+    def _ensure_canvas(self):
+        """Tạo canvas và thanh công cụ lần đầu - Create the canvas and toolbar on first use"""
+        if self.canvas is not None:
+            return
+
+        import matplotlib.patches as patches
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT
+
+        self._patches = patches
+        self.figure = Figure()
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.canvas.setMinimumHeight(self.MINIMUM_CANVAS_HEIGHT)
+        self.toolbar = NavigationToolbar2QT(self.canvas, self)
+        self._layout.addWidget(self.toolbar)
+        self._layout.addWidget(self.canvas)
+
+    def prepare(self, diagram_type: str, *args) -> DiagramSpec:
+        """
+        Tính nội dung sơ đồ; an toàn khi gọi trên luồng xử lý
+        Compute the diagram contents; safe to call on a worker thread
+
+        Không vẽ gì: chỉ định dạng các giá trị thành chữ.
+        Draws nothing: only formats the values into texts.
+
+        Args:
+            diagram_type: Loại sơ đồ có bố cục cố định - Fixed-layout diagram type
+            *args: Đối số của phương thức create_* tương ứng - Arguments of the matching create_* method
+
+        Returns:
+            DiagramSpec: Mô tả sơ đồ - Diagram description
+        """
+        return self._visualizer().diagram_spec(diagram_type, *args)
+
+    def show_spec(self, diagram_type: str, spec: DiagramSpec):
+        """
+        Vẽ hoặc cập nhật sơ đồ (luồng giao diện) - Draw or update a diagram (UI thread)
+
+        Args:
+            diagram_type: Loại sơ đồ - Diagram type
+            spec: Kết quả prepare - Result of prepare
+        """
+        self._ensure_canvas()
+        key = (diagram_type, spec.variant)
+
+        if key != self._current:
+            # Bố cục khác: dựng lại phần tĩnh - Different layout: rebuild the static part
+            self.figure.clear()
+            ax = self.figure.add_subplot(1, 1, 1)
+            self._artists = spec.build(ax, self._patches)
+            self.figure.tight_layout()
+            self.toolbar.update()
+            self._current = key
+
+        # Chỉ cập nhật chữ rồi vẽ lại khi rảnh - Update the texts only, then redraw when idle
+        for name, text in spec.texts.items():
+            self._artists[name].set_text(text)
+        self.canvas.draw_idle()
+        self.setVisible(True)
+
+    def wants_refresh(self, diagram_type: str) -> bool:
+        """
+        Sơ đồ cùng loại có đang hiển thị không - Whether a diagram of this type is shown
+
+        Args:
+            diagram_type: Loại sơ đồ - Diagram type
+
+        Returns:
+            bool: True nếu nên vẽ lại khi dữ liệu đổi - True if it should be redrawn when data changes
+        """
+        return self.isVisible() and self.diagram_type == diagram_type
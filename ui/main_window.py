@@ -8,100 +8,162 @@ Module này chứa giao diện đồ họa chính cho hệ chữ ký RSA
 This module contains the main GUI for the RSA signature system
 """
 
+import threading
+from functools import partial
+from typing import Callable, Optional
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QGridLayout,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QGroupBox,
-    QTabWidget, QScrollArea, QMessageBox, QProgressBar
+    QTabWidget, QScrollArea, QMessageBox, QProgressBar, QCheckBox, QComboBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
 
-from crypto.rsa_engine import RSAEngine
-from visualization.math_visualizer import MathVisualizer
-
-
-class RSAThread(QThread):
-    """Luồng xử lý RSA để tránh treo giao diện - RSA processing thread to avoid UI freezing"""
-
-    finished = pyqtSignal(dict)
-    error = pyqtSignal(str)
-
-    def __init__(self, operation: str, **kwargs):
-        super().__init__()
-        self.operation = operation
-        self.kwargs = kwargs
-
-    def run(self):
-        """Thực thi thao tác RSA - Execute RSA operation"""
-        try:
-            engine = RSAEngine()
-            result = {}
-
-            if self.operation == "generate_keys":
-                p = self.kwargs.get('p')
-                q = self.kwargs.get('q')
-                e = self.kwargs.get('e', 65537)
-
-                pub_key, priv_key = engine.generate_keys(p, q, e)
-                result = {
-                    'success': True,
-                    'key_info': engine.get_key_info(),
-                    'public_key': pub_key,
-                    'private_key': priv_key
-                }
-
-            elif self.operation == "sign":
-                message = self.kwargs.get('message')
-                d = self.kwargs.get('d')
-                n = self.kwargs.get('n')
-
-                # Cần gán khóa bí mật đầy đủ để phương thức sign không lấy None
-                engine.d = d
-                engine.n = n
-                engine.private_key = (d, n)
-                signature = engine.sign(message)
-
-                result = {
-                    'success': True,
-                    'signature': signature,
-                    'hashed_message': engine.hash_message(message)
-                }
-
-            elif self.operation == "verify":
-                message = self.kwargs.get('message')
-                signature = self.kwargs.get('signature')
-                e = self.kwargs.get('e')
-                n = self.kwargs.get('n')
-
-                # Tương tự, gán khóa công khai để verify không bị None
-                engine.e = e
-                engine.n = n
-                engine.public_key = (e, n)
-                is_valid = engine.verify(message, signature)
-
-                result = {
-                    'success': True,
-                    'is_valid': is_valid,
-                    'hashed_message': engine.hash_message(message),
-                    'decrypted_signature': pow(signature, e, n)
-                }
-
-            self.finished.emit(result)
-
-        except Exception as e:
-            self.error.emit(str(e))
+from crypto.rsa_engine import (
+    RSAEngine, CancellationToken, IncrementalHasher, MIN_PRIME_COUNT, MAX_PRIME_COUNT
+)
+from crypto.vectorized import MAX_VECTOR_MODULUS
+from crypto.key_audit import audit_key, format_finding
+from visualization.math_visualizer import (
+    MathVisualizer, DIAGRAM_KEY_GENERATION, DIAGRAM_SIGNING, DIAGRAM_VERIFICATION
+)
+from .big_number import BigNumberView, elide_int, full_text, parse_int
+from .diagram_panel import DiagramPanel
+from .task_pool import TaskPool
+
+
+# Mỗi luồng của nhóm giữ một RSAEngine riêng - Each pool thread keeps its own RSAEngine
+_thread_state = threading.local()
+
+
+def _thread_engine() -> RSAEngine:
+    """Lấy RSAEngine của luồng hiện tại - Get the current thread's RSAEngine"""
+    engine = getattr(_thread_state, 'engine', None)
+    if engine is None:
+        engine = _thread_state.engine = RSAEngine()
+    return engine
+
+
+def run_rsa_operation(operation: str, token: CancellationToken,
+                      report_progress: Callable[[dict], None], **kwargs) -> dict:
+    """
+    Thực thi thao tác RSA trên luồng xử lý - Execute an RSA operation on a worker thread
+
+    Args:
+        operation: "generate_keys", "sign" hoặc "verify"
+        token: Cờ hủy - Cancellation token
+        report_progress: Hàm báo tiến trình - Progress reporter
+        **kwargs: Tham số thao tác - Operation parameters
+
+    Returns:
+        dict: Kết quả thao tác - Operation result
+    """
+    engine = _thread_engine()
+    result = {}
+
+    if operation == "generate_keys":
+        p = kwargs.get('p')
+        q = kwargs.get('q')
+        e = kwargs.get('e', 65537)
+        prime_bits = kwargs.get('prime_bits', 8)
+        safe_primes = kwargs.get('safe_primes', False)
+        prime_count = kwargs.get('prime_count', 2)
+
+        pub_key, priv_key = engine.generate_keys(p, q, e, prime_bits,
+                                                 progress=report_progress, cancel_token=token,
+                                                 safe_primes=safe_primes, prime_count=prime_count)
+        token.raise_if_cancelled()
+
+        # Sàng lọc điểm yếu trước khi dùng khóa, nhất là với số nguyên tố tự nhập
+        # Screen for weaknesses before the key is used, especially with user-supplied primes
+        audit = audit_key(engine.e, engine.n, primes=engine.primes, d=engine.d)
+        result = {
+            'success': True,
+            'key_info': engine.get_key_info(),
+            'public_key': pub_key,
+            'private_key': priv_key,
+            'audit': audit
+        }
+
+    elif operation == "sign":
+        message = kwargs.get('message')
+        d = kwargs.get('d')
+        n = kwargs.get('n')
+        primes = kwargs.get('primes')
+
+        # Truyền khóa bí mật trực tiếp, không dựa vào trạng thái engine;
+        # có thừa số nguyên tố thì ký bằng CRT
+        # Pass the private key explicitly instead of relying on engine state;
+        # with the prime factors the signature uses the CRT
+        hashed_message = engine.hash_message(message)
+        signature = engine.sign_digest(hashed_message, (d, n), primes)
+
+        result = {
+            'success': True,
+            'message': message,
+            'signature': signature,
+            'hashed_message': hashed_message
+        }
+
+    elif operation == "verify":
+        message = kwargs.get('message')
+        signature = kwargs.get('signature')
+        e = kwargs.get('e')
+        n = kwargs.get('n')
+
+        # Xác thực trực tiếp truyền sẵn giá trị băm - Live verification passes a precomputed hash
+        hashed_message = kwargs.get('hashed_message')
+        if hashed_message is None:
+            hashed_message = engine.hash_message(message)
+        is_valid = engine.verify_digest(hashed_message, signature, (e, n))
+
+        result = {
+            'success': True,
+            'message': message,
+            'signature': signature,
+            'is_valid': is_valid,
+            'hashed_message': hashed_message,
+            'decrypted_signature': pow(signature, e, n)
+        }
+
+    token.raise_if_cancelled()
+    return result
 
 
 class MainWindow(QMainWindow):
     """Cửa sổ chính của ứng dụng RSA - Main window of RSA application"""
 
-    def __init__(self):
+    # Chỉ số các tab - Tab indices
+    TAB_KEY_GENERATION = 0
+    TAB_SIGNATURE = 1
+    TAB_EXPLANATION = 2
+
+    # Độ trễ chống dội khi xác thực trực tiếp - Live verification debounce delay
+    LIVE_VERIFY_DELAY_MS = 300
+
+    def __init__(self, max_concurrent_tasks: Optional[int] = None):
+        """
+        Args:
+            max_concurrent_tasks: Số thao tác chạy đồng thời tối đa (mặc định theo số lõi)
+                - Maximum concurrent operations (defaults to the core count)
+        """
         super().__init__()
         self.rsa_engine = RSAEngine()
-        self.visualizer = MathVisualizer()
+        self.task_pool = TaskPool(max_concurrent_tasks, self)
+        self._visualizer = None
         self.current_key_info = {}
+        self.current_signature: Optional[int] = None
+        self.live_hasher = IncrementalHasher()
         self.init_ui()
 
+    @property
+    def visualizer(self) -> MathVisualizer:
+        """Trình trực quan hóa, tạo khi cần lần đầu - Visualizer, created on first use"""
+        if self._visualizer is None:
+            self._visualizer = MathVisualizer()
+        return self._visualizer
+
     def init_ui(self):
         """Khởi tạo giao diện người dùng - Initialize user interface"""
 
@@ -131,21 +193,53 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
 
+        # Các tab chỉ được dựng khi mở lần đầu - Tabs are built on first activation
         # Tab 1: Tạo khóa - Key Generation Tab
-        self.create_key_generation_tab()
-
         # Tab 2: Ký và Xác thực - Sign and Verify Tab
-        self.create_signature_tab()
-
         # Tab 3: Giải thích các bước - Step Explanation Tab
-        self.create_explanation_tab()
+        self._tab_builders = [
+            ("🔑 Tạo Khóa - Key Generation", self.create_key_generation_tab),
+            ("✍️ Ký & Xác Thực - Sign & Verify", self.create_signature_tab),
+            ("📚 Giải Thích - Explanation", self.create_explanation_tab),
+        ]
+        self._tab_pages = []
+        self._built_tabs = set()
+        for title, _ in self._tab_builders:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+            self._tab_pages.append(page)
 
         # Đã bỏ Tab Giới thiệu - About Tab removed per request
 
+        # Hiển thị tab tạo khóa trước - Show the key generation tab first
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
+        self.tab_widget.setCurrentIndex(self.TAB_KEY_GENERATION)
+        self.ensure_tab_built(self.TAB_KEY_GENERATION)
+
         # Thanh trạng thái - Status bar
         self.statusBar().showMessage("Sẵn sàng - Ready")
 
-    def create_key_generation_tab(self):
+    def ensure_tab_built(self, index: int):
+        """
+        Dựng nội dung tab nếu chưa dựng - Build tab contents if not built yet
+
+        Args:
+            index: Chỉ số tab - Tab index
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+
+        self._built_tabs.add(index)
+        _, builder = self._tab_builders[index]
+        self._tab_pages[index].layout().addWidget(builder())
+
+    def is_tab_built(self, index: int) -> bool:
+        """Kiểm tra tab đã được dựng chưa - Check whether a tab has been built"""
+        return index in self._built_tabs
+
+    def create_key_generation_tab(self) -> QWidget:
         """Tạo tab tạo khóa - Create key generation tab"""
 
         # Widget và layout - Widget and layout
@@ -173,6 +267,25 @@ class MainWindow(QMainWindow):
         self.e_input = QLineEdit("65537")
         input_layout.addWidget(self.e_input, 2, 1)
 
+        # Độ dài bit số nguyên tố - Prime bit length
+        input_layout.addWidget(QLabel("Độ dài bit số nguyên tố:"), 3, 0)
+        self.prime_bits_input = QLineEdit("8")
+        self.prime_bits_input.setPlaceholderText("8 bit cho demo - 8 bits for demo")
+        input_layout.addWidget(self.prime_bits_input, 3, 1)
+
+        # Số thừa số nguyên tố (RFC 8017 đa số nguyên tố) - Prime count (RFC 8017 multi-prime)
+        input_layout.addWidget(QLabel("Số thừa số nguyên tố:"), 4, 0)
+        self.prime_count_combo = QComboBox()
+        for count in range(MIN_PRIME_COUNT, MAX_PRIME_COUNT + 1):
+            self.prime_count_combo.addItem(f"{count} (n = p × q{''.join(f' × r{i}' for i in range(3, count + 1))})", count)
+        self.prime_count_combo.setToolTip("Nhiều thừa số hơn: ký CRT nhanh hơn - More factors: faster CRT signing")
+        input_layout.addWidget(self.prime_count_combo, 4, 1)
+
+        # Số nguyên tố an toàn p = 2p' + 1 - Safe primes p = 2p' + 1
+        self.safe_primes_checkbox = QCheckBox("🛡 Số nguyên tố an toàn - Safe primes")
+        self.safe_primes_checkbox.setToolTip("p và (p-1)/2 cùng là số nguyên tố - p and (p-1)/2 both prime")
+        input_layout.addWidget(self.safe_primes_checkbox, 5, 1)
+
         # Nút tạo khóa - Generate keys button
         self.generate_btn = QPushButton("🔑 Tạo khóa RSA - Generate RSA Keys")
         self.generate_btn.clicked.connect(self.generate_keys)
@@ -189,7 +302,7 @@ class MainWindow(QMainWindow):
                 background-color: #2980b9;
             }
         """)
-        input_layout.addWidget(self.generate_btn, 3, 0, 1, 2)
+        input_layout.addWidget(self.generate_btn, 6, 0, 1, 2)
 
         # Nút trực quan hóa - Visualization button
         self.visualize_key_btn = QPushButton("📊 Xem Sơ Đồ Tạo Khóa - View Key Generation Diagram")
@@ -212,7 +325,32 @@ class MainWindow(QMainWindow):
                 color: #2c3e50;
             }
         """)
-        input_layout.addWidget(self.visualize_key_btn, 4, 0, 1, 2)
+        input_layout.addWidget(self.visualize_key_btn, 7, 0, 1, 2)
+
+        # Nút phân bố chữ ký (chỉ khi n < 2^32) - Signature distribution button (only when n < 2^32)
+        self.distribution_btn = QPushButton("📈 Phân Bố Chữ Ký - Signature Distribution")
+        self.distribution_btn.setToolTip("Ký và xác thực hàng chục nghìn thông điệp mẫu cùng lúc "
+                                         "- Sign and verify tens of thousands of sample messages at once")
+        self.distribution_btn.clicked.connect(self.show_signature_distribution)
+        self.distribution_btn.setEnabled(False)
+        self.distribution_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #9b59b6;
+                color: white;
+                border: none;
+                padding: 10px;
+                border-radius: 5px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #8e44ad;
+            }
+            QPushButton:disabled {
+                background-color: #bdc3c7;
+                color: #2c3e50;
+            }
+        """)
+        input_layout.addWidget(self.distribution_btn, 8, 0, 1, 2)
 
         layout.addWidget(input_group)
 
@@ -221,6 +359,18 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
 
+        # Chi tiết tiến trình và nút hủy - Progress details and cancel button
+        progress_layout = QHBoxLayout()
+        self.progress_label = QLabel()
+        self.progress_label.setVisible(False)
+        progress_layout.addWidget(self.progress_label, 1)
+
+        self.cancel_keygen_btn = QPushButton("⛔ Hủy - Cancel")
+        self.cancel_keygen_btn.clicked.connect(self.cancel_key_generation)
+        self.cancel_keygen_btn.setVisible(False)
+        progress_layout.addWidget(self.cancel_keygen_btn)
+        layout.addLayout(progress_layout)
+
         # Nhóm kết quả - Results group
         results_group = QGroupBox("📊 Kết quả - Results")
         results_layout = QGridLayout(results_group)
@@ -247,16 +397,30 @@ class MainWindow(QMainWindow):
         )
         results_layout.addWidget(self.private_key_label, 2, 1)
 
+        # Số lớn mở rộng khi cần - Big numbers, expanded on demand
+        results_layout.addWidget(QLabel("🧮 Module n:"), 3, 0)
+        self.modulus_view = BigNumberView("Chưa tạo - Not generated")
+        results_layout.addWidget(self.modulus_view, 3, 1)
+
+        results_layout.addWidget(QLabel("🔑 Số mũ bí mật d:"), 4, 0)
+        self.private_exponent_view = BigNumberView("Chưa tạo - Not generated")
+        results_layout.addWidget(self.private_exponent_view, 4, 1)
+
         layout.addWidget(results_group)
 
+        # Sơ đồ nhúng, hiện khi bấm nút xem sơ đồ - Embedded diagram, shown by the view button
+        self.key_diagram_panel = DiagramPanel("📊 Sơ Đồ Tạo Khóa - Key Generation Diagram",
+                                              lambda: self.visualizer)
+        layout.addWidget(self.key_diagram_panel)
+
         # Scroll area - Khu vực cuộn
         scroll = QScrollArea()
         scroll.setWidget(key_widget)
         scroll.setWidgetResizable(True)
 
-        self.tab_widget.addTab(scroll, "🔑 Tạo Khóa - Key Generation")
+        return scroll
 
-    def create_signature_tab(self):
+    def create_signature_tab(self) -> QWidget:
         """Tạo tab ký và xác thực - Create sign and verify tab"""
 
         # Widget và layout - Widget and layout
@@ -317,13 +481,8 @@ class MainWindow(QMainWindow):
 
         # Kết quả ký - Signature result
         sign_layout.addWidget(QLabel("Chữ ký số - Digital Signature:"))
-        self.signature_result = QTextEdit()
-        self.signature_result.setMaximumHeight(60)
-        self.signature_result.setReadOnly(True)
-        self.signature_result.setStyleSheet(
-            "QTextEdit { font-family: monospace; background-color: #1e272e; color: #ecf0f1; border: 1px solid #2c3e50; border-radius: 6px; }"
-        )
-        sign_layout.addWidget(self.signature_result)
+        self.signature_view = BigNumberView("Chưa ký - Not signed")
+        sign_layout.addWidget(self.signature_view)
 
         layout.addWidget(sign_group)
 
@@ -337,6 +496,18 @@ class MainWindow(QMainWindow):
         self.signature_input.setPlaceholderText("Nhập chữ ký số - Enter digital signature")
         verify_layout.addWidget(self.signature_input)
 
+        # Xác thực trực tiếp khi gõ - Live verification while typing
+        self.live_verify_checkbox = QCheckBox("⚡ Xác thực trực tiếp khi gõ - Live verify while typing")
+        self.live_verify_checkbox.toggled.connect(self.on_live_verify_toggled)
+        verify_layout.addWidget(self.live_verify_checkbox)
+
+        self.live_verify_timer = QTimer(self)
+        self.live_verify_timer.setSingleShot(True)
+        self.live_verify_timer.setInterval(self.LIVE_VERIFY_DELAY_MS)
+        self.live_verify_timer.timeout.connect(self.run_live_verification)
+        self.message_input.textChanged.connect(self.schedule_live_verification)
+        self.signature_input.textChanged.connect(self.schedule_live_verification)
+
         # Nút xác thực - Verify button
         self.verify_btn = QPushButton("✔️ Xác thực chữ ký - Verify Signature")
         self.verify_btn.clicked.connect(self.verify_signature)
@@ -378,6 +549,28 @@ class MainWindow(QMainWindow):
         """)
         verify_layout.addWidget(self.visualize_verify_btn)
 
+        # Nút xuất báo cáo PDF - Export PDF report button
+        self.export_report_btn = QPushButton("📄 Xuất báo cáo PDF - Export PDF Report")
+        self.export_report_btn.clicked.connect(self.export_pdf_report)
+        self.export_report_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #16a085;
+                color: white;
+                border: none;
+                padding: 10px;
+                border-radius: 5px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #138d75;
+            }
+            QPushButton:disabled {
+                background-color: #bdc3c7;
+                color: #2c3e50;
+            }
+        """)
+        verify_layout.addWidget(self.export_report_btn)
+
         # Kết quả xác thực - Verification result
         self.verify_result = QLabel("Chưa xác thực - Not verified")
         self.verify_result.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -409,14 +602,18 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(details_group)
 
+        # Sơ đồ ký/xác thực nhúng - Embedded signing/verification diagram
+        self.signature_diagram_panel = DiagramPanel("📊 Sơ Đồ - Diagram", lambda: self.visualizer)
+        layout.addWidget(self.signature_diagram_panel)
+
         # Scroll area - Khu vực cuộn
         scroll = QScrollArea()
         scroll.setWidget(sig_widget)
         scroll.setWidgetResizable(True)
 
-        self.tab_widget.addTab(scroll, "✍️ Ký & Xác Thực - Sign & Verify")
+        return scroll
 
-    def create_explanation_tab(self):
+    def create_explanation_tab(self) -> QWidget:
         """Tạo tab giải thích các bước - Create step explanation tab"""
 
         explanation_widget = QWidget()
@@ -508,7 +705,7 @@ class MainWindow(QMainWindow):
         # Nút xem chứng minh toán học - View mathematical proof button
         self.proof_btn = QPushButton("🧮 Xem Chứng Minh Toán Học RSA - View RSA Mathematical Proof")
         self.proof_btn.clicked.connect(self.show_mathematical_proof)
-        self.proof_btn.setEnabled(False)
+        self.proof_btn.setEnabled(bool(self.current_key_info))
         self.proof_btn.setStyleSheet("""
             QPushButton {
                 background-color: #e67e22;
@@ -528,7 +725,37 @@ class MainWindow(QMainWindow):
         """)
         layout.addWidget(self.proof_btn)
 
-        self.tab_widget.addTab(explanation_widget, "📚 Giải Thích - Explanation")
+        # Phá khóa nhỏ bằng phân tích thừa số - Break small keys by factoring
+        attack_layout = QHBoxLayout()
+        self.break_key_btn = QPushButton("🔓 Phá khóa này - Break This Key")
+        self.break_key_btn.setToolTip("Phân tích n để khôi phục d - Factor n to recover d")
+        self.break_key_btn.clicked.connect(self.break_current_key)
+        self.break_key_btn.setEnabled(bool(self.current_key_info))
+        self.factoring_benchmark_btn = QPushButton("⏱ Thời gian phá khóa - Factoring Benchmark")
+        self.factoring_benchmark_btn.setToolTip("Thời gian phân tích theo số bit của n - Factoring time against the bits of n")
+        self.factoring_benchmark_btn.clicked.connect(self.show_factoring_benchmark)
+        for button in (self.break_key_btn, self.factoring_benchmark_btn):
+            button.setStyleSheet("""
+                QPushButton {
+                    background-color: #c0392b;
+                    color: white;
+                    border: none;
+                    padding: 15px;
+                    border-radius: 5px;
+                    font-weight: bold;
+                    font-size: 12px;
+                }
+                QPushButton:hover {
+                    background-color: #a93226;
+                }
+                QPushButton:disabled {
+                    background-color: #bdc3c7;
+                }
+            """)
+            attack_layout.addWidget(button)
+        layout.addLayout(attack_layout)
+
+        return explanation_widget
 
     # Removed About tab implementation
 
@@ -540,21 +767,30 @@ class MainWindow(QMainWindow):
             p_text = self.p_input.text().strip()
             q_text = self.q_input.text().strip()
             e_text = self.e_input.text().strip()
+            bits_text = self.prime_bits_input.text().strip()
 
             p = int(p_text) if p_text else None
             q = int(q_text) if q_text else None
             e = int(e_text) if e_text else 65537
+            prime_bits = int(bits_text) if bits_text else 8
 
             # Hiển thị progress bar - Show progress bar
             self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)  # Indeterminate progress
+            self.progress_bar.setRange(0, 0)  # Chưa có ước lượng - No estimate yet
+            self.progress_label.setText("")
+            self.progress_label.setVisible(True)
+            self.cancel_keygen_btn.setVisible(True)
             self.generate_btn.setEnabled(False)
 
-            # Tạo luồng xử lý - Create processing thread
-            self.rsa_thread = RSAThread("generate_keys", p=p, q=q, e=e)
-            self.rsa_thread.finished.connect(self.on_keys_generated)
-            self.rsa_thread.error.connect(self.on_key_generation_error)
-            self.rsa_thread.start()
+            # Gửi vào nhóm luồng - Submit to the worker pool
+            self.task_pool.submit(partial(run_rsa_operation, "generate_keys",
+                                          p=p, q=q, e=e, prime_bits=prime_bits,
+                                          safe_primes=self.safe_primes_checkbox.isChecked(),
+                                          prime_count=self.prime_count_combo.currentData()),
+                                  on_result=self.on_keys_generated,
+                                  on_error=self.on_key_generation_error,
+                                  on_progress=self.on_key_generation_progress,
+                                  channel="generate_keys")
 
             self.statusBar().showMessage("Đang tạo khóa... - Generating keys...")
 
@@ -562,55 +798,113 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Lỗi đầu vào - Input Error",
                               f"Vui lòng nhập số nguyên hợp lệ - Please enter valid integers:\n{str(e)}")
 
-    def on_keys_generated(self, result):
-        """Xử lý kết quả tạo khóa - Handle key generation result"""
+    def on_key_generation_progress(self, stats: dict):
+        """
+        Cập nhật tiến trình tạo khóa - Update key generation progress
+
+        Args:
+            stats: Thống kê từ generate_prime - Statistics from generate_prime
+        """
+        # Mỗi thừa số chiếm một đoạn bằng nhau; trong mỗi đoạn dùng mô hình mật độ
+        # Each factor fills an equal share; each share follows the density model
+        share = 100 / stats.get('stage_count', 2)
+        stage_offset = stats.get('stage_index', 0) * share
+        fraction = 1.0 if stats['done'] else min(stats['candidates'] / stats['expected_candidates'], 0.95)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(int(stage_offset + fraction * share))
+
+        eta = stats['eta_seconds']
+        eta_text = f"{eta:.1f} s" if eta is not None else "?"
+        self.progress_label.setText(
+            f"{stats.get('stage', '')}: ứng viên - candidates {stats['candidates']} | "
+            f"loại bởi sàng - sieve rejections {stats['sieve_rejections']} | "
+            f"loại bởi e - e rejections {stats['e_rejections']} | "
+            f"vòng Miller-Rabin - rounds {stats['miller_rabin_rounds']} | "
+            f"còn lại - remaining ≈ {eta_text}"
+        )
 
+    def cancel_key_generation(self):
+        """Hủy tạo khóa - Cancel key generation"""
+        self.task_pool.cancel_channel("generate_keys")
+        self.reset_key_generation_progress()
+        self.statusBar().showMessage("⛔ Đã hủy tạo khóa - Key generation cancelled")
+
+    def reset_key_generation_progress(self):
+        """Ẩn tiến trình tạo khóa - Hide key generation progress"""
         self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.cancel_keygen_btn.setVisible(False)
         self.generate_btn.setEnabled(True)
 
+    def on_keys_generated(self, result):
+        """Xử lý kết quả tạo khóa - Handle key generation result"""
+
+        self.reset_key_generation_progress()
+
         if result['success']:
             # Lưu thông tin khóa - Save key information
             self.current_key_info = result['key_info']
 
-            # Hiển thị thông tin chi tiết - Show detailed information
+            # Hiển thị thông tin chi tiết, số lớn được rút gọn
+            # Show detailed information with big numbers elided
+            info = self.current_key_info
+            p, q, n, phi, e, d = (elide_int(info[name]) for name in ('p', 'q', 'n', 'phi', 'e', 'd'))
+            extra = info.get('primes', [])[2:]
+            names = ['p', 'q'] + [f'r{index + 3}' for index in range(len(extra))]
+            extra_lines = ''.join(f"\n  {name} = {elide_int(value)}" for name, value in zip(names[2:], extra))
+            product = ' × '.join(names)
+            totient = ' × '.join(f'({name}-1)' for name in names)
+            audit_lines = ''.join(f"\n  {format_finding(finding)}" for finding in result['audit'].findings)
             key_info_text = f"""
 ✅ THÔNG TIN KHÓA RSA - RSA KEY INFORMATION
 {'='*50}
 
 🔢 Số nguyên tố - Prime Numbers:
-  p = {self.current_key_info['p']}
-  q = {self.current_key_info['q']}
+  p = {p}
+  q = {q}{extra_lines}
 
 🧮 Module RSA - RSA Module:
-  n = p × q = {self.current_key_info['n']}
+  n = {product} = {n}
 
 📐 Hàm Euler - Euler's Function:
-  φ(n) = (p-1) × (q-1) = {self.current_key_info['phi']}
+  φ(n) = {totient} = {phi}
 
 🔑 Khóa công khai - Public Key:
-  e = {self.current_key_info['e']}
-  (e, n) = ({self.current_key_info['public_key'][0]}, {self.current_key_info['public_key'][1]})
+  e = {e}
+  (e, n) = ({e}, {n})
 
 🔒 Khóa bí mật - Private Key:
-  d = {self.current_key_info['d']}
-  (d, n) = ({self.current_key_info['private_key'][0]}, {self.current_key_info['private_key'][1]})
+  d = {d}
+  (d, n) = ({d}, {n})
 
 ✅ Kiểm tra - Verification:
-  e × d mod φ(n) = {self.current_key_info['e']} × {self.current_key_info['d']} mod {self.current_key_info['phi']} = {(self.current_key_info['e'] * self.current_key_info['d']) % self.current_key_info['phi']}
+  e × d mod φ(n) = {(info['e'] * info['d']) % info['phi']}
+
+🛡️ Kiểm tra chất lượng khóa - Key audit:{audit_lines}
 """
 
             self.key_info_text.setText(key_info_text)
-            self.public_key_label.setText(f"({self.current_key_info['public_key'][0]}, {self.current_key_info['public_key'][1]})")
-            self.private_key_label.setText(f"({self.current_key_info['private_key'][0]}, {self.current_key_info['private_key'][1]})")
+            self.public_key_label.setText(f"({e}, {n})")
+            self.private_key_label.setText(f"({d}, {n})")
+            self.modulus_view.set_value(info['n'])
+            self.private_exponent_view.set_value(info['d'])
 
-            self.statusBar().showMessage("✅ Tạo khóa thành công! - Key generation successful!")
+            if result['audit'].passed:
+                self.statusBar().showMessage("✅ Tạo khóa thành công! - Key generation successful!")
+            else:
+                self.statusBar().showMessage("⚠️ Đã tạo khóa nhưng khóa không đạt kiểm tra chất lượng "
+                                             "- Keys generated, but they failed the quality audit")
 
             # Bật các nút trực quan hóa - Enable visualization buttons
             self.visualize_key_btn.setEnabled(True)
-            self.proof_btn.setEnabled(True)
+            self.distribution_btn.setEnabled(info['n'] < MAX_VECTOR_MODULUS)
+            self.refresh_diagram_async(self.key_diagram_panel, DIAGRAM_KEY_GENERATION, dict(self.current_key_info))
+            if self.is_tab_built(self.TAB_EXPLANATION):
+                self.proof_btn.setEnabled(True)
+                self.break_key_btn.setEnabled(True)
 
             # Chuyển sang tab ký - Switch to sign tab
-            self.tab_widget.setCurrentIndex(1)
+            self.tab_widget.setCurrentIndex(self.TAB_SIGNATURE)
 
         else:
             QMessageBox.error(self, "Lỗi - Error", "Tạo khóa thất bại - Key generation failed")
@@ -618,8 +912,7 @@ class MainWindow(QMainWindow):
     def on_key_generation_error(self, error_message):
         """Xử lý lỗi tạo khóa - Handle key generation error"""
 
-        self.progress_bar.setVisible(False)
-        self.generate_btn.setEnabled(True)
+        self.reset_key_generation_progress()
 
         QMessageBox.critical(self, "Lỗi Tạo Khóa - Key Generation Error",
                            f"Lỗi khi tạo khóa RSA - Error generating RSA keys:\n{error_message}")
@@ -645,14 +938,15 @@ class MainWindow(QMainWindow):
             # Vô hiệu hóa nút - Disable button
             self.sign_btn.setEnabled(False)
 
-            # Tạo luồng xử lý - Create processing thread
+            # Gửi vào nhóm luồng - Submit to the worker pool
             d = self.current_key_info['d']
             n = self.current_key_info['n']
+            primes = self.current_key_info.get('primes')
 
-            self.sign_thread = RSAThread("sign", message=message, d=d, n=n)
-            self.sign_thread.finished.connect(self.on_message_signed)
-            self.sign_thread.error.connect(self.on_sign_error)
-            self.sign_thread.start()
+            self.task_pool.submit(partial(run_rsa_operation, "sign", message=message, d=d, n=n, primes=primes),
+                                  on_result=self.on_message_signed,
+                                  on_error=self.on_sign_error,
+                                  channel="sign")
 
             self.statusBar().showMessage("Đang ký thông điệp... - Signing message...")
 
@@ -666,12 +960,16 @@ class MainWindow(QMainWindow):
         self.sign_btn.setEnabled(True)
 
         if result['success']:
-            # Hiển thị chữ ký - Show signature
-            signature_str = str(result['signature'])
-            self.signature_result.setText(signature_str)
+            # Lưu chữ ký dạng số, không đọc lại từ chuỗi - Keep the signature as an int, never re-parse it
+            self.current_signature = result['signature']
+            self.signature_view.set_value(self.current_signature)
 
             # Tự động điền vào ô xác thực - Auto-fill verification field
-            self.signature_input.setText(signature_str)
+            self.signature_input.setText(full_text(self.current_signature))
+
+            info = self.current_key_info
+            hashed, d, n, signature = (elide_int(value) for value in
+                                       (result['hashed_message'], info['d'], info['n'], result['signature']))
 
             # Hiển thị thông tin chi tiết - Show detailed information
             details = f"""
@@ -682,22 +980,24 @@ class MainWindow(QMainWindow):
   "{self.message_input.toPlainText()}"
 
 🔐 Giá trị băm SHA-256 - SHA-256 Hash Value:
-  {result['hashed_message']}
+  {hashed}
 
 🔒 Dùng khóa bí mật - Using Private Key:
-  d = {self.current_key_info['d']}
-  n = {self.current_key_info['n']}
+  d = {d}
+  n = {n}
 
 ✍️ Chữ ký số - Digital Signature:
   S = Hash(M)ᵈ mod n
-  S = {result['hashed_message']}^{self.current_key_info['d']} mod {self.current_key_info['n']}
-  S = {result['signature']}
+  S = {hashed}^{d} mod {n}
+  S = {signature}
 """
 
             self.verify_details.setText(details)
 
             # Bật nút trực quan hóa ký - Enable signing visualization button
             self.visualize_sign_btn.setEnabled(True)
+            self.refresh_diagram_async(self.signature_diagram_panel, DIAGRAM_SIGNING, result['message'],
+                                       result['signature'], result['hashed_message'], dict(self.current_key_info))
 
             self.statusBar().showMessage("✅ Ký thành công! - Signing successful!")
 
@@ -736,20 +1036,25 @@ class MainWindow(QMainWindow):
                                   "Vui lòng nhập chữ ký cần xác thực - Please enter signature to verify")
                 return
 
-            signature = int(signature_text)
+            signature = self.read_signature_input(signature_text)
 
             # Vô hiệu hóa nút - Disable button
             self.verify_btn.setEnabled(False)
 
-            # Tạo luồng xử lý - Create processing thread
+            # Kết quả trực tiếp cũ không được ghi đè kết quả này
+            # A stale live result must not overwrite this one
+            self.live_verify_timer.stop()
+            self.task_pool.cancel_channel("live_verify")
+
+            # Gửi vào nhóm luồng - Submit to the worker pool
             e = self.current_key_info['e']
             n = self.current_key_info['n']
 
-            self.verify_thread = RSAThread("verify", message=message,
-                                         signature=signature, e=e, n=n)
-            self.verify_thread.finished.connect(self.on_signature_verified)
-            self.verify_thread.error.connect(self.on_verify_error)
-            self.verify_thread.start()
+            self.task_pool.submit(partial(run_rsa_operation, "verify", message=message,
+                                          signature=signature, e=e, n=n),
+                                  on_result=self.on_signature_verified,
+                                  on_error=self.on_verify_error,
+                                  channel="verify")
 
             self.statusBar().showMessage("Đang xác thực... - Verifying...")
 
@@ -757,41 +1062,156 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Lỗi định dạng - Format Error",
                               "Chữ ký phải là số nguyên - Signature must be an integer")
 
+    def read_signature_input(self, signature_text: str) -> int:
+        """
+        Đọc chữ ký từ ô nhập - Read the signature from the input field
+
+        Nếu ô vẫn chứa chữ ký vừa tạo thì dùng lại số đã lưu thay vì đọc lại chuỗi.
+        If the field still holds the signature just produced, the stored int is
+        reused instead of parsing the text again.
+
+        Args:
+            signature_text: Nội dung ô nhập - Input field text
+
+        Returns:
+            int: Chữ ký - Signature
+
+        Raises:
+            ValueError: Nếu không phải số nguyên - If the text is not an integer
+        """
+        if self.current_signature is not None and signature_text == full_text(self.current_signature):
+            return self.current_signature
+        return parse_int(signature_text)
+
+    def on_live_verify_toggled(self, checked: bool):
+        """Bật/tắt xác thực trực tiếp - Toggle live verification"""
+        if checked:
+            self.schedule_live_verification()
+        else:
+            self.live_verify_timer.stop()
+
+    def schedule_live_verification(self):
+        """Hẹn xác thực sau khi ngừng gõ - Schedule verification once typing pauses"""
+        if self.live_verify_checkbox.isChecked():
+            # Khởi động lại bộ đếm để chống dội - Restart the timer to debounce
+            self.live_verify_timer.start()
+
+    def run_live_verification(self):
+        """Xác thực trực tiếp trên luồng xử lý - Run live verification on a worker"""
+        if not self.current_key_info:
+            return
+
+        message = self.message_input.toPlainText().strip()
+        signature_text = self.signature_input.text().strip()
+        if not message or not signature_text:
+            return
+
+        try:
+            signature = self.read_signature_input(signature_text)
+        except ValueError:
+            self.verify_result.setText("⚠️ Chữ ký phải là số nguyên - Signature must be an integer")
+            return
+
+        # Băm tăng dần trên luồng giao diện, lũy thừa trên luồng xử lý
+        # Incremental hashing on the UI thread, exponentiation on a worker
+        hashed_message = self.live_hasher.hash_text(message)
+        e = self.current_key_info['e']
+        n = self.current_key_info['n']
+
+        # Kênh riêng: tác vụ trực tiếp không được hủy tác vụ của nút xác thực,
+        # nếu không nút sẽ bị vô hiệu hóa mãi
+        # Own channel: a live task must not cancel the verify button's task,
+        # or the button would stay disabled
+        self.task_pool.submit(partial(run_rsa_operation, "verify", message=message,
+                                      signature=signature, e=e, n=n,
+                                      hashed_message=hashed_message),
+                              on_result=self.on_live_verified,
+                              on_error=self.on_live_verify_error,
+                              channel="live_verify")
+
+    def on_live_verify_error(self, error_message):
+        """Xử lý lỗi xác thực trực tiếp - Handle live verification error"""
+        self.statusBar().showMessage(f"❌ Lỗi xác thực - Verification error: {error_message}")
+
     def on_signature_verified(self, result):
         """Xử lý kết quả xác thực - Handle verification result"""
 
         self.verify_btn.setEnabled(True)
 
         if result['success']:
-            # Hiển thị kết quả - Show result
-            is_valid = result['is_valid']
-
-            if is_valid:
-                result_text = "✅ CHỮ KÝ HỢP LỆ! - SIGNATURE VALID!"
-                result_style = """
-                    QLabel {
-                        color: white;
-                        background-color: #27ae60;
-                        font-size: 16px;
-                    }
-                """
-                status_text = "✅ Xác thực thành công! - Verification successful!"
-            else:
-                result_text = "❌ CHỮ KÝ KHÔNG HỢP LỆ! - SIGNATURE INVALID!"
-                result_style = """
-                    QLabel {
-                        color: white;
-                        background-color: #e74c3c;
-                        font-size: 16px;
-                    }
-                """
-                status_text = "❌ Xác thực thất bại! - Verification failed!"
-
-            self.verify_result.setText(result_text)
-            self.verify_result.setStyleSheet(result_style)
-
-            # Hiển thị chi tiết - Show details
-            details = f"""
+            status_text = self.show_verification_result(result)
+
+            # Bật nút trực quan hóa xác thực - Enable verification visualization button
+            self.visualize_verify_btn.setEnabled(True)
+            verify_info = {
+                'hashed_message': result['hashed_message'],
+                'decrypted_signature': result['decrypted_signature']
+            }
+            self.refresh_diagram_async(self.signature_diagram_panel, DIAGRAM_VERIFICATION, result['message'],
+                                       result['signature'], result['is_valid'], verify_info)
+
+            self.statusBar().showMessage(status_text)
+
+        else:
+            QMessageBox.critical(self, "Lỗi xác thực - Verification Error", "Xác thực thất bại - Verification failed")
+
+    def on_live_verified(self, result):
+        """
+        Xử lý kết quả xác thực trực tiếp - Handle a live verification result
+
+        Chỉ cập nhật huy hiệu và chi tiết; nút xác thực thuộc về tác vụ của nút
+        và có thể vẫn đang chạy.
+        Only updates the badge and details; the verify button belongs to the
+        button's task, which may still be running.
+        """
+        if result['success']:
+            self.show_verification_result(result)
+        else:
+            self.on_live_verify_error("Xác thực thất bại - Verification failed")
+
+    def show_verification_result(self, result) -> str:
+        """
+        Hiển thị huy hiệu và chi tiết xác thực - Show the verification badge and details
+
+        Args:
+            result: Kết quả xác thực thành công - Successful verification result
+
+        Returns:
+            str: Thông báo cho thanh trạng thái - Status bar message
+        """
+        # Hiển thị kết quả - Show result
+        is_valid = result['is_valid']
+
+        if is_valid:
+            result_text = "✅ CHỮ KÝ HỢP LỆ! - SIGNATURE VALID!"
+            result_style = """
+                QLabel {
+                    color: white;
+                    background-color: #27ae60;
+                    font-size: 16px;
+                }
+            """
+            status_text = "✅ Xác thực thành công! - Verification successful!"
+        else:
+            result_text = "❌ CHỮ KÝ KHÔNG HỢP LỆ! - SIGNATURE INVALID!"
+            result_style = """
+                QLabel {
+                    color: white;
+                    background-color: #e74c3c;
+                    font-size: 16px;
+                }
+            """
+            status_text = "❌ Xác thực thất bại! - Verification failed!"
+
+        self.verify_result.setText(result_text)
+        self.verify_result.setStyleSheet(result_style)
+
+        # Hiển thị chi tiết, số lớn được rút gọn - Show details with big numbers elided
+        info = self.current_key_info
+        hashed, decrypted, signature, e, n = (elide_int(value) for value in (
+            result['hashed_message'], result['decrypted_signature'], result['signature'],
+            info['e'], info['n']))
+        details = f"""
 🔍 THÔNG TIN XÁC THỰC - VERIFICATION INFORMATION
 {'='*50}
 
@@ -799,19 +1219,19 @@ class MainWindow(QMainWindow):
   "{self.message_input.toPlainText()}"
 
 🔐 Băm thông điệp - Message Hash:
-  Hash(M) = {result['hashed_message']}
+  Hash(M) = {hashed}
 
 🔓 Dùng khóa công khai - Using Public Key:
-  e = {self.current_key_info['e']}
-  n = {self.current_key_info['n']}
+  e = {e}
+  n = {n}
 
 🔍 Giải mã chữ ký - Decrypt Signature:
-  Sᵉ mod n = {self.signature_input.text()}^{self.current_key_info['e']} mod {self.current_key_info['n']}
-  Sᵉ mod n = {result['decrypted_signature']}
+  Sᵉ mod n = {signature}^{e} mod {n}
+  Sᵉ mod n = {decrypted}
 
 ⚖️ So sánh - Comparison:
-  Hash(M) = {result['hashed_message']}
-  Sᵉ mod n = {result['decrypted_signature']}
+  Hash(M) = {hashed}
+  Sᵉ mod n = {decrypted}
 
   Kết quả - Result: {'Bằng nhau - Equal ✓' if is_valid else 'Khác nhau - Different ✗'}
 
@@ -819,15 +1239,9 @@ class MainWindow(QMainWindow):
   Chữ ký {'HỢP LỆ - VALID' if is_valid else 'KHÔNG HỢP LỆ - INVALID'}
 """
 
-            self.verify_details.setText(details)
+        self.verify_details.setText(details)
 
-            # Bật nút trực quan hóa xác thực - Enable verification visualization button
-            self.visualize_verify_btn.setEnabled(True)
-
-            self.statusBar().showMessage(status_text)
-
-        else:
-            QMessageBox.error(self, "Lỗi xác thực - Verification Error", "Xác thực thất bại - Verification failed")
+        return status_text
 
     def on_verify_error(self, error_message):
         """Xử lý lỗi xác thực - Handle verification error"""
@@ -837,128 +1251,339 @@ class MainWindow(QMainWindow):
                            f"Lỗi khi xác thực chữ ký - Error verifying signature:\n{error_message}")
         self.statusBar().showMessage("❌ Lỗi xác thực - Verification error")
 
-    def show_key_generation_diagram(self):
-        """Hiển thị sơ đồ tạo khóa - Show key generation diagram"""
-        try:
-            if not self.current_key_info:
-                QMessageBox.warning(self, "Chưa có khóa - No Keys",
-                                  "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
-                return
-
-            # Tạo sơ đồ - Create diagram
-            diagram_file = self.visualizer.create_key_generation_flowchart(self.current_key_info)
+    def run_diagram_task(self, channel: str, button: QPushButton, compute: Callable[[], object],
+                         on_done: Callable[[object], None]):
+        """
+        Chuẩn bị sơ đồ trên luồng xử lý - Prepare a diagram on a worker thread
 
-            # Hiển thị trong cửa sổ mới - Show in new window
-            self.show_image_dialog("Sơ Đồ Tạo Khóa RSA - RSA Key Generation Diagram", diagram_file)
+        Trong lúc chạy, nút hiển thị trạng thái chờ thay vì làm treo cửa sổ.
+        While running, the button shows a placeholder instead of freezing the window.
 
-        except Exception as e:
+        Args:
+            channel: Kênh của nhóm luồng - Task pool channel
+            button: Nút đã bấm - Button that was clicked
+            compute: Hàm chạy trên luồng xử lý - Callable run on the worker
+            on_done: Callback nhận kết quả (luồng giao diện) - Result callback (UI thread)
+        """
+        original_text = button.text()
+        button.setEnabled(False)
+        button.setText("⏳ Đang vẽ sơ đồ... - Rendering diagram...")
+        self.statusBar().showMessage("⏳ Đang vẽ sơ đồ... - Rendering diagram...")
+
+        def restore_button():
+            button.setText(original_text)
+            button.setEnabled(True)
+
+        def on_rendered(result):
+            restore_button()
+            self.statusBar().showMessage("✅ Đã vẽ sơ đồ - Diagram rendered")
+            on_done(result)
+
+        def on_failed(error_message: str):
+            restore_button()
             QMessageBox.critical(self, "Lỗi trực quan hóa - Visualization Error",
-                               f"Lỗi khi tạo sơ đồ - Error creating diagram:\n{str(e)}")
+                               f"Lỗi khi tạo sơ đồ - Error creating diagram:\n{error_message}")
+
+        self.task_pool.submit(lambda token, report_progress: compute(),
+                              on_result=on_rendered, on_error=on_failed,
+                              channel=channel)
+
+    def render_diagram_async(self, title: str, button: QPushButton, render: Callable[[], bytes]):
+        """
+        Vẽ sơ đồ trên luồng xử lý rồi mở cửa sổ - Render a diagram on a worker, then open it
+
+        Args:
+            title: Tiêu đề cửa sổ - Dialog title
+            button: Nút đã bấm - Button that was clicked
+            render: Hàm vẽ trả về dữ liệu PNG - Render callable returning PNG data
+        """
+        self.run_diagram_task(f"diagram:{title}", button, render,
+                              lambda image_data: self.show_image_dialog(title, image_data))
+
+    def show_diagram_async(self, panel: DiagramPanel, button: QPushButton, diagram_type: str,
+                           compute_args: Callable[[], tuple]):
+        """
+        Tính đầu vào và chữ của sơ đồ trên luồng xử lý, rồi vẽ lên bảng nhúng
+        Compute the diagram inputs and texts on a worker, then draw them on the embedded panel
+
+        Args:
+            panel: Bảng sơ đồ - Diagram panel
+            button: Nút đã bấm - Button that was clicked
+            diagram_type: Loại sơ đồ - Diagram type
+            compute_args: Hàm trả về đối số của sơ đồ - Callable returning the diagram arguments
+        """
+        # Lần vẽ này mới hơn mọi lần cập nhật đang chờ - This render supersedes any pending refresh
+        self.task_pool.cancel_channel(f"diagram-refresh:{diagram_type}")
+        self.run_diagram_task(f"diagram:{diagram_type}", button,
+                              lambda: panel.prepare(diagram_type, *compute_args()),
+                              lambda spec: panel.show_spec(diagram_type, spec))
+
+    def refresh_diagram_async(self, panel: DiagramPanel, diagram_type: str, *args):
+        """
+        Cập nhật sơ đồ đang hiển thị khi dữ liệu đổi; chữ được tính trên luồng xử lý
+        Update the shown diagram when its data changes; texts are computed on a worker
+
+        Cập nhật chạy trên kênh riêng để không hủy lần vẽ từ nút bấm (nút sẽ bị
+        kẹt ở trạng thái "Đang vẽ").
+        Refreshes run on their own channel so they never cancel a button render
+        (which would leave the button stuck on "Rendering").
+
+        Args:
+            panel: Bảng sơ đồ - Diagram panel
+            diagram_type: Loại sơ đồ - Diagram type
+            *args: Đối số của sơ đồ - Diagram arguments
+        """
+        if not panel.wants_refresh(diagram_type):
+            return
+
+        def on_failed(error_message: str):
+            self.statusBar().showMessage(f"❌ Lỗi vẽ sơ đồ - Diagram error: {error_message}")
+
+        self.task_pool.submit(lambda token, report_progress: panel.prepare(diagram_type, *args),
+                              on_result=lambda spec: panel.show_spec(diagram_type, spec),
+                              on_error=on_failed, channel=f"diagram-refresh:{diagram_type}")
+
+    def show_key_generation_diagram(self):
+        """Hiển thị sơ đồ tạo khóa - Show key generation diagram"""
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
+            return
+
+        key_info = dict(self.current_key_info)
+        self.show_diagram_async(self.key_diagram_panel, self.visualize_key_btn,
+                                DIAGRAM_KEY_GENERATION, lambda: (key_info,))
 
     def show_signing_diagram(self):
         """Hiển thị sơ đồ quá trình ký - Show signing process diagram"""
-        try:
-            if not self.current_key_info:
-                QMessageBox.warning(self, "Chưa có khóa - No Keys",
-                                  "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
-                return
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
+            return
 
-            message = self.message_input.toPlainText().strip()
-            if not message:
-                QMessageBox.warning(self, "Thiếu thông điệp - Missing Message",
-                                  "Vui lòng nhập thông điệp trước khi xem sơ đồ - Please enter message before viewing diagram")
-                return
+        message = self.message_input.toPlainText().strip()
+        if not message:
+            QMessageBox.warning(self, "Thiếu thông điệp - Missing Message",
+                              "Vui lòng nhập thông điệp trước khi xem sơ đồ - Please enter message before viewing diagram")
+            return
 
-            signature_text = self.signature_result.toPlainText().strip()
-            if not signature_text:
-                QMessageBox.warning(self, "Chưa ký - Not Signed",
-                                  "Vui lòng ký thông điệp trước khi xem sơ đồ - Please sign message before viewing diagram")
-                return
+        signature = self.current_signature
+        if signature is None:
+            QMessageBox.warning(self, "Chưa ký - Not Signed",
+                              "Vui lòng ký thông điệp trước khi xem sơ đồ - Please sign message before viewing diagram")
+            return
 
-            # Tạo sơ đồ - Create diagram
-            hashed_msg = self.rsa_engine.hash_message(message)
-            signature = int(signature_text)
+        key_info = dict(self.current_key_info)
 
-            diagram_file = self.visualizer.create_signing_process_diagram(
-                message, signature, hashed_msg, self.current_key_info
-            )
+        def compute_args():
+            # Băm trên luồng xử lý - Hash on the worker thread
+            hashed_msg = _thread_engine().hash_message(message)
+            return message, signature, hashed_msg, key_info
 
-            # Hiển thị trong cửa sổ mới - Show in new window
-            self.show_image_dialog("Sơ Đồ Quá Trình Ký - RSA Signing Process Diagram", diagram_file)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi trực quan hóa - Visualization Error",
-                               f"Lỗi khi tạo sơ đồ - Error creating diagram:\n{str(e)}")
+        self.show_diagram_async(self.signature_diagram_panel, self.visualize_sign_btn,
+                                DIAGRAM_SIGNING, compute_args)
 
     def show_verification_diagram(self):
         """Hiển thị sơ đồ quá trình xác thực - Show verification process diagram"""
-        try:
-            if not self.current_key_info:
-                QMessageBox.warning(self, "Chưa có khóa - No Keys",
-                                  "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
-                return
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
+            return
 
-            message = self.message_input.toPlainText().strip()
-            signature_text = self.signature_input.text().strip()
+        message = self.message_input.toPlainText().strip()
+        signature_text = self.signature_input.text().strip()
 
-            if not message or not signature_text:
-                QMessageBox.warning(self, "Thiếu thông tin - Missing Information",
-                                  "Vui lòng nhập thông điệp và chữ ký trước khi xem sơ đồ - Please enter message and signature before viewing diagram")
-                return
+        if not message or not signature_text:
+            QMessageBox.warning(self, "Thiếu thông tin - Missing Information",
+                              "Vui lòng nhập thông điệp và chữ ký trước khi xem sơ đồ - Please enter message and signature before viewing diagram")
+            return
 
-            # Lấy thông tin xác thực - Get verification info
-            verify_details_text = self.verify_details.toPlainText()
-            is_valid = "HỢP LỆ" in verify_details_text
+        try:
+            signature = self.read_signature_input(signature_text)
+        except ValueError:
+            QMessageBox.warning(self, "Lỗi định dạng - Format Error",
+                              "Chữ ký phải là số nguyên - Signature must be an integer")
+            return
 
-            # Trích xuất thông tin từ chi tiết - Extract info from details
-            hashed_msg = self.rsa_engine.hash_message(message)
-            signature = int(signature_text)
-            e = self.current_key_info['e']
-            n = self.current_key_info['n']
-            decrypted_signature = pow(signature, e, n)
+        # Lấy thông tin xác thực - Get verification info
+        is_valid = "HỢP LỆ" in self.verify_details.toPlainText()
+        e = self.current_key_info['e']
+        n = self.current_key_info['n']
 
+        def compute_args():
             verify_info = {
-                'hashed_message': hashed_msg,
-                'decrypted_signature': decrypted_signature
+                'hashed_message': _thread_engine().hash_message(message),
+                'decrypted_signature': pow(signature, e, n)
             }
+            return message, signature, is_valid, verify_info
 
-            # Tạo sơ đồ - Create diagram
-            diagram_file = self.visualizer.create_verification_process_diagram(
-                message, signature, is_valid, verify_info
-            )
-
-            # Hiển thị trong cửa sổ mới - Show in new window
-            self.show_image_dialog("Sơ Đồ Quá Trình Xác Thực - RSA Verification Process Diagram", diagram_file)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi trực quan hóa - Visualization Error",
-                               f"Lỗi khi tạo sơ đồ - Error creating diagram:\n{str(e)}")
+        self.show_diagram_async(self.signature_diagram_panel, self.visualize_verify_btn,
+                                DIAGRAM_VERIFICATION, compute_args)
 
     def show_mathematical_proof(self):
         """Hiển thị chứng minh toán học - Show mathematical proof"""
-        try:
-            if not self.current_key_info:
-                QMessageBox.warning(self, "Chưa có khóa - No Keys",
-                                  "Vui lòng tạo khóa trước khi xem chứng minh - Please generate keys before viewing proof")
-                return
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước khi xem chứng minh - Please generate keys before viewing proof")
+            return
+
+        key_info = dict(self.current_key_info)
+        visualizer = self.visualizer
+        self.render_diagram_async("Chứng Minh Đúng Đắn RSA - RSA Correctness Proof",
+                                  self.proof_btn,
+                                  lambda: visualizer.create_mathematical_proof(key_info))
+
+    def show_signature_distribution(self):
+        """Hiển thị phân bố chữ ký của khóa hiện tại - Show the signature distribution of the current key"""
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước khi xem sơ đồ - Please generate keys before viewing diagram")
+            return
+
+        if self.current_key_info['n'] >= MAX_VECTOR_MODULUS:
+            QMessageBox.warning(self, "Khóa quá lớn - Key Too Large",
+                              "Sơ đồ phân bố chỉ hỗ trợ n < 2^32 - The distribution diagram only supports n < 2^32")
+            return
+
+        key_info = dict(self.current_key_info)
+        visualizer = self.visualizer
+        self.render_diagram_async("Phân Bố Chữ Ký - Signature Distribution",
+                                  self.distribution_btn,
+                                  lambda: visualizer.create_signature_distribution(key_info))
+
+    def break_current_key(self):
+        """Khôi phục d của khóa hiện tại bằng phân tích n - Recover d of the current key by factoring n"""
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước - Please generate keys first")
+            return
+
+        e = self.current_key_info['e']
+        n = self.current_key_info['n']
+        d = self.current_key_info['d']
+        button = self.break_key_btn
+        original_text = button.text()
+        button.setEnabled(False)
+        button.setText("⏳ Đang phân tích n... - Factoring n...")
+
+        def restore_button():
+            button.setText(original_text)
+            button.setEnabled(True)
+
+        def attack(token: CancellationToken, report_progress: Callable):
+            from crypto.factoring import break_key
+            return break_key(e, n, cancel_token=token)
+
+        def on_broken(result: dict):
+            restore_button()
+            factors = ' × '.join(elide_int(value) for value in result['factors'])
+            QMessageBox.information(
+                self, "Đã phá khóa - Key Broken",
+                f"n = {factors}\n"
+                f"Phương pháp - Methods: {', '.join(result['methods'])}\n"
+                f"d = {elide_int(result['d'])} "
+                f"({'khớp - matches' if result['d'] == d else 'khác d của khóa - differs from the key d'})\n"
+                f"Thời gian - Time: {result['elapsed']:.3f} s")
+            self.statusBar().showMessage(f"🔓 Đã phân tích n trong {result['elapsed']:.3f} s - Factored n")
+
+        def on_failed(error_message: str):
+            restore_button()
+            QMessageBox.warning(self, "Chưa phá được - Not Broken", error_message)
+
+        self.task_pool.submit(attack, on_result=on_broken, on_error=on_failed, channel="break_key")
+        self.statusBar().showMessage("⏳ Đang phân tích n... - Factoring n...")
+
+    def show_factoring_benchmark(self):
+        """Đo và vẽ thời gian phá khóa theo kích thước - Measure and chart factoring time against size"""
+        visualizer = self.visualizer
+        title = "Thời Gian Phá Khóa - Factoring Benchmark"
+
+        def render(token: CancellationToken, report_progress: Callable):
+            from crypto.factoring import benchmark_factoring
+            rows = benchmark_factoring(trials=1, progress=report_progress, cancel_token=token)
+            return visualizer.create_factoring_benchmark(rows)
+
+        def on_progress(row: dict):
+            self.statusBar().showMessage(
+                f"⏳ Đang đo... {row['bits']} bit: {row['seconds']:.3f} s - Benchmarking...")
+
+        def on_rendered(image_data: bytes):
+            self.factoring_benchmark_btn.setEnabled(True)
+            self.statusBar().showMessage("✅ Đã đo xong - Benchmark finished")
+            self.show_image_dialog(title, image_data)
+
+        def on_failed(error_message: str):
+            self.factoring_benchmark_btn.setEnabled(True)
+            QMessageBox.critical(self, "Lỗi trực quan hóa - Visualization Error",
+                               f"Lỗi khi tạo sơ đồ - Error creating diagram:\n{error_message}")
+
+        # Kênh riêng và cờ hủy thật để closeEvent không phải chờ hết thời gian
+        # Own channel and a real cancel token so closeEvent need not wait out its timeout
+        self.factoring_benchmark_btn.setEnabled(False)
+        self.statusBar().showMessage("⏳ Đang đo thời gian phá khóa... - Benchmarking factoring...")
+        self.task_pool.submit(render, on_result=on_rendered, on_error=on_failed,
+                              channel="factoring_benchmark", on_progress=on_progress)
+
+    def export_pdf_report(self):
+        """Xuất mọi sơ đồ của phiên hiện tại ra PDF - Export every diagram of the current session to PDF"""
+        if not self.current_key_info:
+            QMessageBox.warning(self, "Chưa có khóa - No Keys",
+                              "Vui lòng tạo khóa trước khi xuất báo cáo - Please generate keys before exporting a report")
+            return
+
+        message = self.message_input.toPlainText().strip()
+        if not message:
+            QMessageBox.warning(self, "Thiếu thông điệp - Missing Message",
+                              "Vui lòng nhập thông điệp trước khi xuất báo cáo - Please enter message before exporting a report")
+            return
 
-            # Tạo sơ đồ chứng minh - Create proof diagram
-            proof_file = self.visualizer.create_mathematical_proof(self.current_key_info)
+        import PyQt6.QtWidgets as QtW
 
-            # Hiển thị trong cửa sổ mới - Show in new window
-            self.show_image_dialog("Chứng Minh Đúng Đắn RSA - RSA Correctness Proof", proof_file)
+        file_path, _ = QtW.QFileDialog.getSaveFileName(
+            self, "Xuất Báo Cáo PDF - Export PDF Report", "rsa_report.pdf",
+            "PDF Files (*.pdf);;All Files (*)"
+        )
+        if not file_path:
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Lỗi trực quan hóa - Visualization Error",
-                               f"Lỗi khi tạo sơ đồ chứng minh - Error creating proof diagram:\n{str(e)}")
+        # Chữ ký trống sẽ được tính lại khi xuất - A missing signature is computed during export
+        session = {'key_info': dict(self.current_key_info), 'message': message}
+        if self.current_signature is not None:
+            session['signature'] = self.current_signature
+
+        def export(token: CancellationToken, report_progress: Callable):
+            from visualization.report import export_report
 
-    def show_image_dialog(self, title: str, image_path: str):
+            def on_page(pages: int, session_count: int):
+                token.raise_if_cancelled()
+                report_progress(pages)
+
+            # Một phiên chỉ có vài trang, dựng tuần tự là nhanh nhất - A single session has only a few pages; serial is fastest
+            return export_report([session], file_path, max_workers=1, progress=on_page)
+
+        def on_exported(pages: int):
+            self.export_report_btn.setEnabled(True)
+            self.statusBar().showMessage(f"✅ Đã xuất {pages} trang - Exported {pages} pages: {file_path}")
+
+        def on_failed(error_message: str):
+            self.export_report_btn.setEnabled(True)
+            QMessageBox.critical(self, "Lỗi xuất báo cáo - Export Error",
+                               f"Không thể xuất báo cáo - Cannot export report:\n{error_message}")
+
+        self.export_report_btn.setEnabled(False)
+        self.statusBar().showMessage("⏳ Đang xuất báo cáo... - Exporting report...")
+        self.task_pool.submit(export, on_result=on_exported, on_error=on_failed,
+                              channel="report",
+                              on_progress=lambda pages: self.statusBar().showMessage(
+                                  f"⏳ Đang xuất báo cáo... {pages} trang - Exporting report... {pages} pages"))
+
+    def show_image_dialog(self, title: str, image_data: bytes):
         """
         Hiển thị hình ảnh trong cửa sổ thoại - Show image in dialog window
 
         Args:
             title: Tiêu đề cửa sổ - Window title
-            image_path: Đường dẫn hình ảnh - Image path
+            image_data: Dữ liệu PNG trong bộ nhớ - In-memory PNG data
         """
         import PyQt6.QtWidgets as QtW
         import PyQt6.QtGui as QtG
@@ -971,8 +1596,8 @@ class MainWindow(QMainWindow):
 
         # Hiển thị hình ảnh - Display image
         image_label = QtW.QLabel()
-        pixmap = QtG.QPixmap(image_path)
-        if not pixmap.isNull():
+        pixmap = QtG.QPixmap()
+        if pixmap.loadFromData(image_data, "PNG"):
             # Scale image to fit window
             scaled_pixmap = pixmap.scaled(950, 600, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             image_label.setPixmap(scaled_pixmap)
@@ -986,7 +1611,7 @@ class MainWindow(QMainWindow):
         button_layout = QtW.QHBoxLayout()
 
         save_btn = QtW.QPushButton("💾 Lưu hình ảnh - Save Image")
-        save_btn.clicked.connect(lambda: self.save_image(image_path))
+        save_btn.clicked.connect(lambda: self.save_image(image_data))
         button_layout.addWidget(save_btn)
 
         close_btn = QtW.QPushButton("Đóng - Close")
@@ -995,18 +1620,15 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(button_layout)
 
-        # Dọn dẹp file tạm khi đóng - Cleanup temp file when closed
-        dialog.finished.connect(lambda: self.visualizer.cleanup_temp_file(image_path))
-
         # Hiển thị cửa sổ - Show dialog
         dialog.exec()
 
-    def save_image(self, image_path: str):
+    def save_image(self, image_data: bytes):
         """
-        Lưu hình ảnh - Save image
+        Lưu hình ảnh ra đĩa theo yêu cầu - Save image to disk on request
 
         Args:
-            image_path: Đường dẫn hình ảnh - Image path
+            image_data: Dữ liệu PNG - PNG data
         """
         import PyQt6.QtWidgets as QtW
 
@@ -1017,14 +1639,21 @@ class MainWindow(QMainWindow):
 
         if file_path:
             try:
-                import shutil
-                shutil.copy2(image_path, file_path)
+                with open(file_path, 'wb') as f:
+                    f.write(image_data)
                 QMessageBox.information(self, "Thành công - Success",
                                       f"Hình ảnh đã được lưu tại - Image saved at:\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Lỗi lưu - Save Error",
                                    f"Không thể lưu hình ảnh - Cannot save image:\n{str(e)}")
 
+    def closeEvent(self, event):
+        """Dừng nhóm luồng và dọn bộ đệm sơ đồ khi đóng - Stop workers and clear the diagram cache on close"""
+        self.task_pool.shutdown()
+        if self._visualizer is not None:
+            self._visualizer.clear_cache()
+        super().closeEvent(event)
+
     def center_on_screen(self):
         """Căn giữa cửa sổ trên màn hình - Center window on screen"""
 
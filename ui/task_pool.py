@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent Worker Pool
+Nhóm luồng xử lý dùng lại
+
+Module này chạy các thao tác nặng trên một QThreadPool dùng chung thay vì
+tạo QThread mới cho mỗi lần bấm nút.
+This module runs heavy operations on a shared QThreadPool instead of
+creating a new QThread for every button click.
+"""
+
+import itertools
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from crypto.rsa_engine import CancellationToken, OperationCancelled
+
+
+class TaskSignals(QObject):
+    """Tín hiệu từ luồng xử lý về luồng giao diện - Signals from workers to the UI thread"""
+
+    finished = pyqtSignal(int, object)  # (mã tác vụ, kết quả) - (task id, result)
+    error = pyqtSignal(int, str)  # (mã tác vụ, thông báo lỗi) - (task id, error message)
+    cancelled = pyqtSignal(int)  # mã tác vụ - task id
+    progress = pyqtSignal(int, object)  # (mã tác vụ, dữ liệu tiến trình) - (task id, progress payload)
+
+
+class _TaskRunnable(QRunnable):
+    """Bọc một hàm thành tác vụ cho QThreadPool - Wrap a callable as a QThreadPool task"""
+
+    def __init__(self, task_id: int, fn: Callable[[CancellationToken, Callable], Any],
+                 token: CancellationToken, signals: TaskSignals):
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.token = token
+        self.signals = signals
+
+    def report_progress(self, payload: Any):
+        """Gửi tiến trình về luồng giao diện - Send progress to the UI thread"""
+        if not self.token.cancelled:
+            self.signals.progress.emit(self.task_id, payload)
+
+    def run(self):
+        """Thực thi tác vụ - Execute the task"""
+        try:
+            self.token.raise_if_cancelled()
+            result = self.fn(self.token, self.report_progress)
+            self.signals.finished.emit(self.task_id, result)
+        except OperationCancelled:
+            self.signals.cancelled.emit(self.task_id)
+        except Exception as e:
+            self.signals.error.emit(self.task_id, str(e))
+
+
+class _TaskEntry:
+    """Thông tin một tác vụ đang chờ/chạy - Bookkeeping for a queued or running task"""
+
+    def __init__(self, token: CancellationToken, channel: Optional[str],
+                 on_result: Optional[Callable], on_error: Optional[Callable],
+                 on_progress: Optional[Callable]):
+        self.token = token
+        self.channel = channel
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_progress = on_progress
+
+
+class TaskPool(QObject):
+    """
+    Nhóm luồng dùng lại có hỗ trợ hủy - Reusable thread pool with cancellation
+
+    Mỗi tác vụ có thể thuộc một kênh (ví dụ "sign"); gửi tác vụ mới vào kênh sẽ
+    hủy tác vụ cũ và kết quả cũ bị bỏ qua, nên giao diện không bao giờ nhận
+    kết quả lỗi thời.
+    Each task may belong to a channel (e.g. "sign"); submitting a new task on a
+    channel cancels the previous one and its result is dropped, so the UI never
+    receives a stale result.
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        if max_concurrent:
+            self._pool.setMaxThreadCount(max_concurrent)
+
+        # Tín hiệu sống trên luồng giao diện nên callback chạy ở đó
+        # The signals object lives on the UI thread, so callbacks run there
+        self._signals = TaskSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.error.connect(self._on_error)
+        self._signals.cancelled.connect(self._on_cancelled)
+        self._signals.progress.connect(self._on_progress)
+
+        self._ids = itertools.count(1)
+        self._tasks: Dict[int, _TaskEntry] = {}
+        self._channels: Dict[str, int] = {}
+
+    @property
+    def max_concurrent(self) -> int:
+        """Số tác vụ chạy đồng thời tối đa - Maximum number of concurrent tasks"""
+        return self._pool.maxThreadCount()
+
+    def set_max_concurrent(self, count: int):
+        """
+        Đặt số tác vụ chạy đồng thời tối đa - Set the maximum number of concurrent tasks
+
+        Args:
+            count: Số luồng tối đa - Maximum thread count
+        """
+        self._pool.setMaxThreadCount(max(1, count))
+
+    def submit(self, fn: Callable[[CancellationToken, Callable], Any],
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None,
+               channel: Optional[str] = None,
+               on_progress: Optional[Callable[[Any], None]] = None) -> int:
+        """
+        Gửi tác vụ vào nhóm luồng - Submit a task to the pool
+
+        Args:
+            fn: Hàm nhận (CancellationToken, hàm báo tiến trình)
+                - Callable receiving (CancellationToken, progress reporter)
+            on_result: Callback kết quả (luồng giao diện) - Result callback (UI thread)
+            on_error: Callback lỗi (luồng giao diện) - Error callback (UI thread)
+            channel: Kênh; tác vụ mới thay thế tác vụ cũ cùng kênh
+                - Channel; a new task supersedes the previous one on the same channel
+            on_progress: Callback tiến trình (luồng giao diện) - Progress callback (UI thread)
+
+        Returns:
+            int: Mã tác vụ - Task id
+        """
+        if channel is not None:
+            self.cancel_channel(channel)
+
+        task_id = next(self._ids)
+        token = CancellationToken()
+        self._tasks[task_id] = _TaskEntry(token, channel, on_result, on_error, on_progress)
+        if channel is not None:
+            self._channels[channel] = task_id
+
+        # Tác vụ đã hủy khi còn trong hàng đợi sẽ thoát ngay khi được chạy
+        # A task cancelled while still queued exits as soon as it is picked up
+        self._pool.start(_TaskRunnable(task_id, fn, token, self._signals))
+        return task_id
+
+    def cancel(self, task_id: int):
+        """
+        Hủy tác vụ; kết quả của nó sẽ bị bỏ qua - Cancel a task; its result is dropped
+
+        Args:
+            task_id: Mã tác vụ - Task id
+        """
+        entry = self._take(task_id)
+        if entry is not None:
+            entry.token.cancel()
+
+    def cancel_channel(self, channel: str):
+        """Hủy tác vụ hiện tại của một kênh - Cancel the current task of a channel"""
+        task_id = self._channels.get(channel)
+        if task_id is not None:
+            self.cancel(task_id)
+
+    def cancel_all(self):
+        """Hủy mọi tác vụ - Cancel every task"""
+        for task_id in list(self._tasks):
+            self.cancel(task_id)
+
+    def is_active(self, channel: str) -> bool:
+        """Kênh có tác vụ đang chờ/chạy không - Whether a channel has a pending task"""
+        return channel in self._channels
+
+    def shutdown(self, timeout_ms: int = 3000) -> bool:
+        """
+        Hủy mọi tác vụ và chờ các luồng dừng - Cancel everything and wait for workers
+
+        Args:
+            timeout_ms: Thời gian chờ tối đa - Maximum wait in milliseconds
+
+        Returns:
+            bool: True nếu mọi luồng đã dừng - True if all workers stopped
+        """
+        self.cancel_all()
+        return self._pool.waitForDone(timeout_ms)
+
+    def _take(self, task_id: int) -> Optional[_TaskEntry]:
+        """Lấy và xóa thông tin tác vụ - Pop a task's entry"""
+        entry = self._tasks.pop(task_id, None)
+        if entry is not None and entry.channel is not None and self._channels.get(entry.channel) == task_id:
+            del self._channels[entry.channel]
+        return entry
+
+    def _on_finished(self, task_id: int, result: Any):
+        """Chuyển kết quả nếu tác vụ chưa lỗi thời - Deliver the result unless stale"""
+        entry = self._take(task_id)
+        if entry is not None and entry.on_result is not None:
+            entry.on_result(result)
+
+    def _on_error(self, task_id: int, message: str):
+        """Chuyển lỗi nếu tác vụ chưa lỗi thời - Deliver the error unless stale"""
+        entry = self._take(task_id)
+        if entry is not None and entry.on_error is not None:
+            entry.on_error(message)
+
+    def _on_progress(self, task_id: int, payload: Any):
+        """Chuyển tiến trình nếu tác vụ còn hiệu lực - Deliver progress while the task is current"""
+        entry = self._tasks.get(task_id)
+        if entry is not None and entry.on_progress is not None:
+            entry.on_progress(payload)
+
+    def _on_cancelled(self, task_id: int):
+        """Dọn tác vụ tự dừng vì bị hủy - Clean up a task that stopped on cancellation"""
+        self._take(task_id)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diagram Rendering Benchmark
+Đo hiệu năng vẽ sơ đồ
+
+So sánh vẽ năm loại sơ đồ tuần tự, trên nhóm luồng và trên nhóm tiến trình
+Compares rendering the five diagram types serially, on a thread pool and on a process pool
+
+Chạy - Run:
+    python -m visualization.benchmark [số vòng - rounds]
+"""
+
+import sys
+import time
+from typing import List, Tuple
+
+from .math_visualizer import (
+    MathVisualizer, EXECUTOR_THREAD, EXECUTOR_PROCESS,
+    DIAGRAM_KEY_GENERATION, DIAGRAM_SIGNING, DIAGRAM_VERIFICATION,
+    DIAGRAM_PROOF, DIAGRAM_EUCLIDEAN
+)
+
+
+def sample_jobs() -> List[Tuple[str, tuple]]:
+    """Năm sơ đồ với dữ liệu mẫu - The five diagrams with sample data"""
+    key_info = {'p': 61, 'q': 53, 'n': 3233, 'phi': 3120, 'e': 17, 'd': 2753}
+    verify_info = {'hashed_message': 67890, 'decrypted_signature': 67890}
+    return [
+        (DIAGRAM_KEY_GENERATION, (key_info,)),
+        (DIAGRAM_SIGNING, ("Hello RSA", 12345, 67890, key_info)),
+        (DIAGRAM_VERIFICATION, ("Hello RSA", 12345, True, verify_info)),
+        (DIAGRAM_PROOF, (key_info,)),
+        (DIAGRAM_EUCLIDEAN, (3120, 17)),
+    ]
+
+
+def run_benchmark(rounds: int = 3):
+    """
+    Chạy đo hiệu năng và in kết quả - Run the benchmark and print results
+
+    Mọi cách chạy dùng MathVisualizer mới ở mỗi vòng, nên bộ đệm và các mẫu
+    dựng sẵn của vòng trước không ảnh hưởng kết quả: tuần tự và nhóm luồng
+    phải dựng lại mẫu trong vòng đo. Nhóm tiến trình được tạo mới mỗi vòng,
+    nên thời gian của nó gồm cả khởi động tiến trình con và nạp matplotlib.
+    Every path uses a fresh MathVisualizer in each round, so neither the cache
+    nor the prebuilt templates of an earlier round skew the results: serial
+    and thread runs rebuild their templates inside the timed round. The
+    process pool is created anew each round, so its time includes starting
+    the worker processes and importing matplotlib in them.
+
+    Args:
+        rounds: Số vòng đo - Number of rounds
+    """
+    jobs = sample_jobs()
+
+    # Khởi động: nạp matplotlib và font trước khi đo - Warm-up: load matplotlib and fonts first
+    MathVisualizer(use_templates=False).create_diagram(jobs[0][0], *jobs[0][1])
+
+    timings = {}
+    for label, executor in (("serial", None), ("threads", EXECUTOR_THREAD), ("processes", EXECUTOR_PROCESS)):
+        best = float('inf')
+        for _ in range(rounds):
+            start = time.perf_counter()
+            visualizer = MathVisualizer()
+            if executor is None:
+                for diagram_type, args in jobs:
+                    visualizer.create_diagram(diagram_type, *args)
+            else:
+                visualizer.render_many(jobs, executor=executor)
+            best = min(best, time.perf_counter() - start)
+        timings[label] = best
+
+    print(f"Rendering {len(jobs)} diagrams (best of {rounds}) - Vẽ {len(jobs)} sơ đồ:")
+    for label, seconds in timings.items():
+        speedup = timings['serial'] / seconds if seconds else float('inf')
+        print(f"  {label:<10} {seconds * 1000:8.1f} ms   x{speedup:.2f}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
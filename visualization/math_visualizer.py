@@ -8,24 +8,369 @@ Module này cung cấp các công cụ trực quan hóa các bước tính toán
 This module provides visualization tools for RSA calculation steps
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import numpy as np
-from typing import List, Tuple, Dict, Any
-import tempfile
-import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import List, Tuple, Dict, Any, Callable, Optional, Sequence, NamedTuple
+import hashlib
+import io
+import threading
+
+from .number_format import elide_int
+
+# Loại sơ đồ - Diagram types
+DIAGRAM_KEY_GENERATION = 'key_generation'
+DIAGRAM_SIGNING = 'signing'
+DIAGRAM_VERIFICATION = 'verification'
+DIAGRAM_PROOF = 'proof'
+DIAGRAM_EUCLIDEAN = 'euclidean'
+DIAGRAM_SIGNATURE_DISTRIBUTION = 'signature_distribution'
+DIAGRAM_FACTORING_BENCHMARK = 'factoring_benchmark'
+
+# Loại sơ đồ -> phương thức vẽ - Diagram type -> drawing method
+_DRAW_METHODS = {
+    DIAGRAM_KEY_GENERATION: '_draw_key_generation_flowchart',
+    DIAGRAM_SIGNING: '_draw_signing_process_diagram',
+    DIAGRAM_VERIFICATION: '_draw_verification_process_diagram',
+    DIAGRAM_PROOF: '_draw_mathematical_proof',
+    DIAGRAM_EUCLIDEAN: '_draw_euclidean_algorithm_visualization',
+    DIAGRAM_SIGNATURE_DISTRIBUTION: '_draw_signature_distribution',
+    DIAGRAM_FACTORING_BENCHMARK: '_draw_factoring_benchmark',
+}
+
+# Sơ đồ có bố cục cố định -> phương thức mô tả - Fixed-layout diagram type -> spec method
+_SPEC_METHODS = {
+    DIAGRAM_KEY_GENERATION: '_key_generation_spec',
+    DIAGRAM_SIGNING: '_signing_process_spec',
+    DIAGRAM_VERIFICATION: '_verification_process_spec',
+    DIAGRAM_PROOF: '_mathematical_proof_spec',
+}
+
+# Sơ đồ vẽ tự do -> phương thức dựng Figure - Free-form diagram type -> Figure builder method
+_FIGURE_METHODS = {
+    DIAGRAM_EUCLIDEAN: '_euclidean_figure',
+    DIAGRAM_SIGNATURE_DISTRIBUTION: '_signature_distribution_figure',
+    DIAGRAM_FACTORING_BENCHMARK: '_factoring_benchmark_figure',
+}
+
+# Kiểu thực thi song song - Parallel executor kinds
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_PROCESS = 'process'
+
+# Giới hạn bộ đệm sơ đồ mặc định - Default diagram cache bounds
+DEFAULT_CACHE_ENTRIES = 32
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Độ phân giải ảnh xuất - Output image resolution
+RENDER_DPI = 150
+
+# Giới hạn sơ đồ Euclid - Euclidean diagram bounds
+EUCLID_LISTED_HEAD = 6  # Số bước đầu được liệt kê - Leading steps listed
+EUCLID_LISTED_TAIL = 4  # Số bước cuối được liệt kê - Trailing steps listed
+EUCLID_MAX_BAR_STEPS = 120  # Số bước tối đa trên biểu đồ cột - Maximum steps on the bar chart
+
+# Số thông điệp mẫu của sơ đồ phân bố chữ ký - Sample messages in the signature distribution diagram
+DISTRIBUTION_SAMPLES = 20000
+DISTRIBUTION_MAX_BINS = 64  # Số cột tối đa của biểu đồ tần suất - Maximum histogram bins
+
+
+def _digest_inputs(inputs: Any) -> str:
+    """
+    Băm đầu vào của sơ đồ thành khóa bộ đệm - Hash diagram inputs into a cache key
+
+    Số nguyên được băm dưới dạng bytes, không chuyển sang chuỗi thập phân,
+    nên số rất lớn vẫn rẻ và không chạm giới hạn chữ số của CPython.
+    Integers are hashed as bytes, not decimal strings, so huge values stay
+    cheap and never hit CPython's int-to-string digit limit.
+    """
+    digest = hashlib.sha256()
+
+    def feed(value):
+        if isinstance(value, dict):
+            digest.update(b'{')
+            for key in sorted(value, key=str):
+                feed(key)
+                feed(value[key])
+            digest.update(b'}')
+        elif isinstance(value, (list, tuple)):
+            digest.update(b'[')
+            for item in value:
+                feed(item)
+            digest.update(b']')
+        elif isinstance(value, bool) or value is None:
+            digest.update(repr(value).encode('ascii'))
+        elif isinstance(value, int):
+            raw = value.to_bytes(value.bit_length() // 8 + 1, 'big', signed=True)
+            digest.update(b'i%d:' % len(raw) + raw)
+        else:
+            raw = str(value).encode('utf-8')
+            digest.update(b's%d:' % len(raw) + raw)
+
+    feed(inputs)
+    return digest.hexdigest()
+
+
+def _load_matplotlib():
+    """
+    Nạp matplotlib khi lần đầu cần vẽ - Import matplotlib on first use
+
+    matplotlib tốn nhiều thời gian nạp nên không được nạp lúc khởi động.
+    Chỉ dùng API hướng đối tượng, không chạm trạng thái toàn cục của pyplot.
+    matplotlib is slow to import, so it is kept off the startup path.
+    Only the object-oriented API is used; pyplot global state is never touched.
+
+    Returns:
+        tuple: (Figure, FigureCanvasAgg, patches)
+    """
+    import matplotlib.patches as patches
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    return Figure, FigureCanvasAgg, patches
+
+
+def _label(value: Any) -> str:
+    """
+    Chữ hiển thị của một giá trị trên sơ đồ; số nguyên được rút gọn
+    Display text of a diagram value; integers are elided
+
+    Args:
+        value: Giá trị, thường là số nguyên hoặc "?" - Value, usually an integer or "?"
+
+    Returns:
+        str: Chuỗi hiển thị - Display text
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return elide_int(value)
+    return str(value)
+
+
+def _euclid_steps(a: int, b: int):
+    """
+    Chạy thuật toán Euclid và lưu số bit từng bước - Run Euclid's algorithm, recording bit lengths
+
+    Chỉ giữ vài bước đầu/cuối dưới dạng số nguyên; mọi bước còn lại chỉ là độ
+    dài bit trong mảng NumPy, nên bộ nhớ không phụ thuộc kích thước khóa.
+    Only a few leading/trailing steps are kept as integers; every step is
+    otherwise just bit lengths in NumPy arrays, so memory is independent of key size.
+
+    Args:
+        a, b: Số nguyên không âm - Non-negative integers
+
+    Returns:
+        tuple: (gcd, mảng số bit (bước, 3) của a, b×q, r - (steps, 3) bit lengths of a, b×q, r,
+                bước đầu - leading steps, bước cuối - trailing steps)
+    """
+    import numpy as np
+
+    bits = []
+    head = []
+    tail = deque(maxlen=EUCLID_LISTED_TAIL)
+    while b != 0:
+        q, r = divmod(a, b)
+        bits.append((a.bit_length(), (a - r).bit_length(), r.bit_length()))
+        step = (len(bits), a, b, q, r)
+        if len(head) < EUCLID_LISTED_HEAD:
+            head.append(step)
+        else:
+            tail.append(step)
+        a, b = b, r
+
+    return a, np.array(bits, dtype=np.float64).reshape(-1, 3), head, list(tail)
+
+
+def _new_figure(figsize: Tuple[float, float], dpi: Optional[float] = None, nrows: int = 1):
+    """
+    Tạo Figure trên canvas Agg (không cần GUI) - Create a Figure on a non-GUI Agg canvas
+
+    Không dùng pyplot nên có thể vẽ an toàn trên luồng xử lý.
+    pyplot is not involved, so this is safe to call from a worker thread.
+
+    Args:
+        figsize: Kích thước hình (inch) - Figure size in inches
+        dpi: Độ phân giải canvas (mặc định của matplotlib) - Canvas resolution (matplotlib default)
+        nrows: Số hàng Axes xếp dọc - Number of vertically stacked Axes
+
+    Returns:
+        tuple: (Figure, Axes hoặc mảng Axes nếu nrows > 1 - Axes, or an array of Axes if nrows > 1, patches)
+    """
+    Figure, FigureCanvasAgg, patches = _load_matplotlib()
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.subplots(nrows, 1)
+    return fig, ax, patches
+
+
+def _render_png(fig) -> bytes:
+    """
+    Mã hóa Figure thành PNG trong bộ nhớ - Encode a Figure as PNG in memory
+
+    Args:
+        fig: Figure cần mã hóa - Figure to encode
+
+    Returns:
+        bytes: Dữ liệu PNG - PNG data
+    """
+    buffer = io.BytesIO()
+    fig.tight_layout()
+    fig.savefig(buffer, format='png', dpi=RENDER_DPI, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+class DiagramTemplate:
+    """
+    Sơ đồ dựng sẵn, chỉ vẽ lại phần chữ thay đổi - Prebuilt diagram that redraws only its variable texts
+
+    Các phần tĩnh (hộp, mũi tên, tiêu đề) được vẽ một lần vào ảnh nền; mỗi lần
+    vẽ lại chỉ khôi phục ảnh nền rồi vẽ các chữ được đặt tên lên trên.
+    Static artists (boxes, arrows, titles) are drawn once into a background
+    buffer; each re-render restores that buffer and draws the named texts on top.
+    """
+
+    # Lề quanh vùng cắt, giống pad_inches mặc định của savefig
+    # Padding around the crop box, same as savefig's default pad_inches
+    PAD_INCHES = 0.1
+
+    def __init__(self, fig, artists: Dict[str, Any]):
+        """
+        Khởi tạo mẫu và vẽ ảnh nền - Initialize the template and draw its background
+
+        Args:
+            fig: Figure trên canvas Agg - Figure on an Agg canvas
+            artists: Tên -> đối tượng chữ thay đổi - Name -> variable text artist
+        """
+        self.fig = fig
+        self.artists = artists
+        self.lock = threading.Lock()
+
+        for artist in artists.values():
+            artist.set_animated(True)
+
+        canvas = fig.canvas
+        fig.tight_layout()
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(fig.bbox)
+
+        # Vùng cắt cố định theo bố cục tĩnh - Fixed crop box from the static layout
+        pad = self.PAD_INCHES * fig.dpi
+        tight = fig.get_tightbbox(canvas.get_renderer()).transformed(fig.dpi_scale_trans)
+        self._crop = (max(0, int(tight.x0 - pad)), max(0, int(tight.y0 - pad)),
+                      min(int(fig.bbox.width), int(tight.x1 + pad + 1)),
+                      min(int(fig.bbox.height), int(tight.y1 + pad + 1)))
+
+    def update(self, texts: Dict[str, str]):
+        """
+        Đặt nội dung mới cho các chữ - Set new contents for the texts
+
+        Args:
+            texts: Tên -> nội dung - Name -> text content
+        """
+        for name, value in texts.items():
+            self.artists[name].set_text(value)
+
+    def render(self) -> Optional[bytes]:
+        """
+        Vẽ lại phần chữ và mã hóa PNG - Redraw the texts and encode PNG
+
+        Returns:
+            Optional[bytes]: Dữ liệu PNG, hoặc None nếu chữ tràn khỏi vùng cắt
+                - PNG data, or None if a text overflows the crop box
+        """
+        import numpy as np
+        from PIL import Image
+
+        canvas = self.fig.canvas
+        renderer = canvas.get_renderer()
+        x0, y0, x1, y1 = self._crop
+        for artist in self.artists.values():
+            extent = artist.get_window_extent(renderer)
+            if extent.x0 < x0 or extent.y0 < y0 or extent.x1 > x1 or extent.y1 > y1:
+                return None
+
+        canvas.restore_region(self._background)
+        for artist in self.artists.values():
+            self.fig.draw_artist(artist)
+
+        # Gốc ảnh ở góc trên, gốc tọa độ hiển thị ở góc dưới; nền đục nên bỏ kênh alpha
+        # Image rows start at the top, display coordinates at the bottom; the
+        # background is opaque, so the alpha channel is dropped to speed up encoding
+        pixels = np.asarray(canvas.buffer_rgba())
+        height = pixels.shape[0]
+        image = Image.fromarray(np.ascontiguousarray(pixels[height - y1:height - y0, x0:x1, :3]))
+
+        buffer = io.BytesIO()
+        image.save(buffer, format='png', compress_level=1,
+                   dpi=(self.fig.dpi, self.fig.dpi))
+        return buffer.getvalue()
+
+
+class DiagramSpec(NamedTuple):
+    """
+    Mô tả sơ đồ có bố cục cố định - Description of a fixed-layout diagram
+
+    build(ax, patches) dựng phần tĩnh lên Axes bất kỳ và trả về các chữ được
+    đặt tên; texts là nội dung hiện tại của chúng.
+    build(ax, patches) draws the static part onto any Axes and returns the
+    named texts; texts holds their current contents.
+    """
+    variant: Any  # Biến thể bố cục (ví dụ hợp lệ/không) - Layout variant (e.g. valid/invalid)
+    figsize: Tuple[float, float]
+    build: Callable[..., Dict[str, Any]]
+    texts: Dict[str, str]
+
+
+# Trình trực quan riêng của mỗi tiến trình con - Per-process visualizer for pool workers
+_process_visualizer = None
+
+
+def render_diagram(diagram_type: str, args: tuple) -> bytes:
+    """
+    Vẽ một sơ đồ không qua bộ đệm - Render one diagram without caching
+
+    Hàm cấp mô-đun nên có thể gửi sang ProcessPoolExecutor.
+    Module-level so it can be sent to a ProcessPoolExecutor.
+
+    Args:
+        diagram_type: Loại sơ đồ - Diagram type
+        args: Đối số của phương thức create_* tương ứng - Arguments of the matching create_* method
+
+    Returns:
+        bytes: Dữ liệu PNG - PNG data
+    """
+    global _process_visualizer
+    if _process_visualizer is None:
+        _process_visualizer = MathVisualizer()
+    return _process_visualizer._render_uncached(diagram_type, args)
 
 
 class MathVisualizer:
     """Lớp trực quan hóa các bước tính toán RSA - Class for RSA calculation visualization"""
 
-    def __init__(self):
-        """Khởi tạo trình thị trực quan - Initialize visualizer"""
-        self.figure = Figure(figsize=(12, 8))
-        self.canvas = None
-        plt.style.use('default')
+    def __init__(self, cache_max_entries: int = DEFAULT_CACHE_ENTRIES,
+                 cache_max_bytes: int = DEFAULT_CACHE_BYTES,
+                 use_templates: bool = True):
+        """
+        Khởi tạo trình thị trực quan - Initialize visualizer
+
+        Args:
+            cache_max_entries: Số sơ đồ tối đa trong bộ đệm - Maximum cached diagrams
+            cache_max_bytes: Tổng dung lượng tối đa của bộ đệm - Maximum total cache size
+            use_templates: Dùng lại sơ đồ dựng sẵn, chỉ cập nhật chữ
+                - Reuse prebuilt diagrams and update only their texts
+        """
+        # Bộ đệm LRU: (loại, băm đầu vào) -> dữ liệu PNG
+        # LRU cache: (type, input hash) -> PNG data
+        self.cache_max_entries = cache_max_entries
+        self.cache_max_bytes = cache_max_bytes
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+
+        # Mẫu sơ đồ: (loại, biến thể) -> DiagramTemplate
+        # Diagram templates: (type, variant) -> DiagramTemplate
+        self.use_templates = use_templates
+        self._templates: Dict[Tuple[str, Any], DiagramTemplate] = {}
+        self._templates_lock = threading.Lock()
+
         self.colors = {
             'primary': '#3498db',
             'secondary': '#2ecc71',
@@ -35,7 +380,201 @@ class MathVisualizer:
             'highlight': '#f39c12'
         }
 
-    def create_key_generation_flowchart(self, key_info: Dict[str, Any]) -> str:
+    def _cached_render(self, diagram_type: str, inputs: tuple, render: Callable[[], bytes]) -> bytes:
+        """
+        Lấy sơ đồ từ bộ đệm hoặc vẽ mới - Return a cached diagram or render a new one
+
+        Args:
+            diagram_type: Loại sơ đồ - Diagram type
+            inputs: Đầu vào của sơ đồ - Diagram inputs
+            render: Hàm vẽ trả về dữ liệu PNG - Render callable returning PNG data
+
+        Returns:
+            bytes: Dữ liệu PNG - PNG data
+        """
+        key = (diagram_type, _digest_inputs(inputs))
+        with self._cache_lock:
+            image_data = self._cache.get(key)
+            if image_data is not None:
+                self._cache.move_to_end(key)
+                return image_data
+
+        # Vẽ ngoài khóa để các luồng khác không phải chờ - Render outside the lock
+        image_data = render()
+
+        with self._cache_lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cache_bytes -= len(old)
+            self._cache[key] = image_data
+            self._cache_bytes += len(image_data)
+
+            # Loại mục ít dùng nhất, luôn giữ mục vừa thêm
+            # Evict least recently used entries, always keeping the newest one
+            while len(self._cache) > 1 and (len(self._cache) > self.cache_max_entries
+                                            or self._cache_bytes > self.cache_max_bytes):
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+        return image_data
+
+    def clear_cache(self):
+        """Xóa bộ đệm sơ đồ và các mẫu - Clear the diagram cache and templates"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+        with self._templates_lock:
+            self._templates.clear()
+
+    def _render_uncached(self, diagram_type: str, args: tuple) -> bytes:
+        """Vẽ một sơ đồ không qua bộ đệm - Render one diagram without caching"""
+        return getattr(self, _DRAW_METHODS[diagram_type])(*args)
+
+    def create_diagram(self, diagram_type: str, *args) -> bytes:
+        """
+        Tạo sơ đồ theo loại, có bộ đệm - Create a diagram by type, with caching
+
+        Args:
+            diagram_type: Loại sơ đồ - Diagram type
+            *args: Đối số của phương thức create_* tương ứng - Arguments of the matching create_* method
+
+        Returns:
+            bytes: Dữ liệu PNG - PNG data
+        """
+        draw = getattr(self, _DRAW_METHODS[diagram_type])
+        return self._cached_render(diagram_type, args, lambda: draw(*args))
+
+    def diagram_spec(self, diagram_type: str, *args) -> DiagramSpec:
+        """
+        Mô tả sơ đồ để vẽ lên Figure khác (ví dụ canvas nhúng trong giao diện)
+        Describe a diagram so it can be drawn on another Figure (e.g. an embedded canvas)
+
+        Args:
+            diagram_type: Loại sơ đồ có bố cục cố định - Fixed-layout diagram type
+            *args: Đối số của phương thức create_* tương ứng - Arguments of the matching create_* method
+
+        Returns:
+            DiagramSpec: Mô tả sơ đồ - Diagram description
+        """
+        if diagram_type not in _SPEC_METHODS:
+            raise ValueError(f"Sơ đồ không có bố cục cố định - Not a fixed-layout diagram: {diagram_type}")
+        return getattr(self, _SPEC_METHODS[diagram_type])(*args)
+
+    def diagram_figure(self, diagram_type: str, *args):
+        """
+        Dựng sơ đồ thành Figure dạng vector, không qua ảnh PNG
+        Build a diagram as a vector Figure, without going through PNG
+
+        Dùng khi cần ghi sơ đồ vào PDF; Figure mới được tạo mỗi lần nên có thể
+        gọi từ nhiều luồng.
+        Used to write diagrams into a PDF; a new Figure is created on every
+        call, so it can be called from several threads.
+
+        Args:
+            diagram_type: Loại sơ đồ - Diagram type
+            *args: Đối số của phương thức create_* tương ứng - Arguments of the matching create_* method
+
+        Returns:
+            Figure: Figure trên canvas Agg, đã căn bố cục - Laid-out Figure on an Agg canvas
+        """
+        if diagram_type in _SPEC_METHODS:
+            _, figsize, build, texts = self.diagram_spec(diagram_type, *args)
+            fig, ax, patches = _new_figure(figsize)
+            for name, artist in build(ax, patches).items():
+                artist.set_text(texts[name])
+        else:
+            fig = getattr(self, _FIGURE_METHODS[diagram_type])(*args)
+        fig.tight_layout()
+        return fig
+
+    def _render_template(self, diagram_type: str, spec: DiagramSpec) -> bytes:
+        """
+        Vẽ sơ đồ có bố cục cố định - Render a fixed-layout diagram
+
+        Ở chế độ mẫu, phần tĩnh chỉ được dựng một lần cho mỗi (loại, biến thể);
+        nếu chữ tràn khỏi bố cục thì vẽ lại toàn bộ để ảnh tự nới rộng.
+        In template mode the static part is built once per (type, variant); if
+        a text overflows the layout, the full render is used so the image grows.
+
+        Args:
+            diagram_type: Loại sơ đồ - Diagram type
+            spec: Mô tả sơ đồ - Diagram description
+
+        Returns:
+            bytes: Dữ liệu PNG - PNG data
+        """
+        variant, figsize, build, texts = spec
+        if self.use_templates:
+            key = (diagram_type, variant)
+            with self._templates_lock:
+                template = self._templates.get(key)
+                if template is None:
+                    fig, ax, patches = _new_figure(figsize, dpi=RENDER_DPI)
+                    template = DiagramTemplate(fig, build(ax, patches))
+                    self._templates[key] = template
+
+            with template.lock:
+                template.update(texts)
+                image_data = template.render()
+            if image_data is not None:
+                return image_data
+
+        fig, ax, patches = _new_figure(figsize)
+        for name, artist in build(ax, patches).items():
+            artist.set_text(texts[name])
+        return _render_png(fig)
+
+    def render_many(self, jobs: Sequence[Tuple[str, tuple]], executor: str = EXECUTOR_THREAD,
+                    max_workers: Optional[int] = None) -> List[bytes]:
+        """
+        Vẽ nhiều sơ đồ song song - Render several diagrams in parallel
+
+        Mỗi sơ đồ dùng Figure riêng nên có thể vẽ đồng thời. Luồng chia sẻ
+        bộ nhớ nhưng bị GIL giới hạn một phần; tiến trình mở rộng theo số lõi.
+        Each diagram uses its own Figure, so they can be drawn concurrently.
+        Threads share memory but are partly GIL-bound; processes scale with cores.
+
+        Args:
+            jobs: Danh sách (loại sơ đồ, đối số) - List of (diagram type, args)
+            executor: 'thread' hoặc 'process' - 'thread' or 'process'
+            max_workers: Số worker tối đa - Maximum workers
+
+        Returns:
+            List[bytes]: Dữ liệu PNG theo thứ tự jobs - PNG data in job order
+        """
+        # Luồng vẽ bằng chính trình trực quan này (và các mẫu của nó); tiến trình
+        # con dùng trình trực quan riêng của tiến trình
+        # Threads draw with this visualizer (and its templates); worker
+        # processes use their own per-process visualizer
+        if executor == EXECUTOR_THREAD:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            render = self._render_uncached
+        elif executor == EXECUTOR_PROCESS:
+            pool = ProcessPoolExecutor(max_workers=max_workers)
+            render = render_diagram
+        else:
+            raise ValueError(f"Kiểu thực thi không hỗ trợ - Unsupported executor: {executor}")
+
+        # Mục đã có trong bộ đệm không cần vẽ lại - Cached entries are not re-rendered
+        results: List[Optional[bytes]] = []
+        pending = {}
+        with pool:
+            for index, (diagram_type, args) in enumerate(jobs):
+                key = (diagram_type, _digest_inputs(args))
+                with self._cache_lock:
+                    cached = self._cache.get(key)
+                results.append(cached)
+                if cached is None:
+                    pending[index] = pool.submit(render, diagram_type, tuple(args))
+
+            for index, future in pending.items():
+                diagram_type, args = jobs[index]
+                image_data = future.result()
+                results[index] = self._cached_render(diagram_type, tuple(args), lambda: image_data)
+
+        return results
+
+    def create_key_generation_flowchart(self, key_info: Dict[str, Any]) -> bytes:
         """
         Tạo sơ đồ luồng tạo khóa RSA - Create RSA key generation flowchart
 
@@ -43,9 +582,49 @@ class MathVisualizer:
             key_info: Thông tin khóa - Key information
 
         Returns:
-            str: Đường dẫn file hình ảnh - Image file path
+            bytes: Dữ liệu PNG - PNG data
+        """
+        return self._cached_render(DIAGRAM_KEY_GENERATION, (key_info,),
+                                   lambda: self._draw_key_generation_flowchart(key_info))
+
+    def _draw_key_generation_flowchart(self, key_info: Dict[str, Any]) -> bytes:
+        """Vẽ sơ đồ tạo khóa - Draw the key generation flowchart"""
+        return self._render_template(DIAGRAM_KEY_GENERATION, self._key_generation_spec(key_info))
+
+    @staticmethod
+    def _factor_formulas(key_info: Dict[str, Any]) -> Tuple[str, str, str]:
+        """
+        Công thức n, φ(n) và các thừa số thêm của khóa đa số nguyên tố
+        Formulas for n, φ(n) and the extra factors of a multi-prime key
+
+        Returns:
+            Tuple[str, str, str]: ("p × q × r3", "(p-1)(q-1)(r3-1)", ", r3 = ...")
         """
-        fig, ax = plt.subplots(figsize=(14, 10))
+        extra = key_info.get('primes', [])[2:]
+        names = ['p', 'q'] + [f'r{index + 3}' for index in range(len(extra))]
+        extra_text = ''.join(f', {name} = {_label(value)}' for name, value in zip(names[2:], extra))
+        return ' × '.join(names), ''.join(f'({name}-1)' for name in names), extra_text
+
+    def _key_generation_spec(self, key_info: Dict[str, Any]) -> DiagramSpec:
+        """Mô tả sơ đồ tạo khóa - Describe the key generation flowchart"""
+        def get(name: str) -> str:
+            return _label(key_info.get(name, "?"))
+
+        product, totient, extra = self._factor_formulas(key_info)
+        texts = {
+            'p': f'Chọn p = {get("p")}',
+            'q': f'Chọn q = {get("q")}{extra}',
+            'n': f'Tính n = {product} = {get("n")}',
+            'phi': f'Tính φ(n) = {totient} = {get("phi")}',
+            'e': f'Chọn e = {get("e")}',
+            'd': f'Tính d = e⁻¹ mod φ(n) = {get("d")}',
+            'public': f'Khóa công khai: (e, n) = ({get("e")}, {get("n")})',
+            'private': f'Khóa bí mật: (d, n) = ({get("d")}, {get("n")})',
+        }
+        return DiagramSpec(None, (14, 10), self._build_key_generation_flowchart, texts)
+
+    def _build_key_generation_flowchart(self, ax, patches) -> Dict[str, Any]:
+        """Dựng phần tĩnh của sơ đồ tạo khóa - Build the static part of the key generation flowchart"""
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 12)
         ax.axis('off')
@@ -55,22 +634,23 @@ class MathVisualizer:
                 ha='center', va='center', fontsize=16, fontweight='bold',
                 color=self.colors['text'])
 
-        # Flow elements - Các phần tử luồng
+        # Flow elements; tên None là nội dung cố định - Flow elements; a None name is fixed text
         steps = [
-            (5, 10, 'Bắt đầu\nStart', 'ellipse', self.colors['primary']),
-            (5, 8.5, f'Chọn p = {key_info.get("p", "?")}', 'rectangle', self.colors['background']),
-            (5, 7.5, f'Chọn q = {key_info.get("q", "?")}', 'rectangle', self.colors['background']),
-            (5, 6.5, f'Tính n = p × q = {key_info.get("n", "?")}', 'rectangle', self.colors['secondary']),
-            (5, 5.5, f'Tính φ(n) = (p-1)(q-1) = {key_info.get("phi", "?")}', 'rectangle', self.colors['secondary']),
-            (5, 4.5, f'Chọn e = {key_info.get("e", "?")}', 'rectangle', self.colors['background']),
-            (5, 3.5, f'Tính d = e⁻¹ mod φ(n) = {key_info.get("d", "?")}', 'rectangle', self.colors['secondary']),
-            (5, 2.5, f'Khóa công khai: (e, n) = ({key_info.get("e", "?")}, {key_info.get("n", "?")})', 'rectangle', self.colors['accent']),
-            (5, 1.5, f'Khóa bí mật: (d, n) = ({key_info.get("d", "?")}, {key_info.get("n", "?")})', 'rectangle', self.colors['accent']),
-            (5, 0.5, 'Hoàn thành\nComplete', 'ellipse', self.colors['primary'])
+            (5, 10, None, 'Bắt đầu\nStart', 'ellipse', self.colors['primary']),
+            (5, 8.5, 'p', '', 'rectangle', self.colors['background']),
+            (5, 7.5, 'q', '', 'rectangle', self.colors['background']),
+            (5, 6.5, 'n', '', 'rectangle', self.colors['secondary']),
+            (5, 5.5, 'phi', '', 'rectangle', self.colors['secondary']),
+            (5, 4.5, 'e', '', 'rectangle', self.colors['background']),
+            (5, 3.5, 'd', '', 'rectangle', self.colors['secondary']),
+            (5, 2.5, 'public', '', 'rectangle', self.colors['accent']),
+            (5, 1.5, 'private', '', 'rectangle', self.colors['accent']),
+            (5, 0.5, None, 'Hoàn thành\nComplete', 'ellipse', self.colors['primary'])
         ]
 
         # Draw elements - Vẽ các phần tử
-        for x, y, text, shape, color in steps:
+        artists = {}
+        for x, y, name, text, shape, color in steps:
             if shape == 'ellipse':
                 circle = patches.Ellipse((x, y), 2, 0.8, facecolor=color, edgecolor='black', linewidth=2)
                 ax.add_patch(circle)
@@ -78,25 +658,21 @@ class MathVisualizer:
                 rect = patches.Rectangle((x-1.5, y-0.4), 3, 0.8, facecolor=color, edgecolor='black', linewidth=2)
                 ax.add_patch(rect)
 
-            ax.text(x, y, text, ha='center', va='center', fontsize=10, fontweight='bold')
+            label = ax.text(x, y, text, ha='center', va='center', fontsize=10, fontweight='bold')
+            if name is not None:
+                artists[name] = label
 
         # Draw arrows - Vẽ mũi tên
         for i in range(len(steps)-1):
-            x1, y1, _, _, _ = steps[i]
-            x2, y2, _, _, _ = steps[i+1]
+            x1, y1 = steps[i][:2]
+            x2, y2 = steps[i+1][:2]
             ax.arrow(x1, y1-0.4, 0, y2-y1+0.8, head_width=0.1, head_length=0.1,
                     fc='black', ec='black', linewidth=2)
 
-        # Save image - Lưu hình ảnh
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        plt.tight_layout()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return temp_file.name
+        return artists
 
     def create_signing_process_diagram(self, message: str, signature: int,
-                                     hashed_msg: int, key_info: Dict[str, Any]) -> str:
+                                     hashed_msg: int, key_info: Dict[str, Any]) -> bytes:
         """
         Tạo sơ đồ quá trình ký - Create signing process diagram
 
@@ -107,9 +683,31 @@ class MathVisualizer:
             key_info: Thông tin khóa - Key information
 
         Returns:
-            str: Đường dẫn file hình ảnh - Image file path
+            bytes: Dữ liệu PNG - PNG data
         """
-        fig, ax = plt.subplots(figsize=(14, 10))
+        return self._cached_render(DIAGRAM_SIGNING, (message, signature, hashed_msg, key_info),
+                                   lambda: self._draw_signing_process_diagram(message, signature, hashed_msg, key_info))
+
+    def _draw_signing_process_diagram(self, message: str, signature: int,
+                                     hashed_msg: int, key_info: Dict[str, Any]) -> bytes:
+        """Vẽ sơ đồ ký - Draw the signing diagram"""
+        return self._render_template(DIAGRAM_SIGNING,
+                                     self._signing_process_spec(message, signature, hashed_msg, key_info))
+
+    def _signing_process_spec(self, message: str, signature: int,
+                              hashed_msg: int, key_info: Dict[str, Any]) -> DiagramSpec:
+        """Mô tả sơ đồ ký - Describe the signing diagram"""
+        texts = {
+            'message': f'Thông điệp gốc:\n"{message[:50]}{"..." if len(message) > 50 else ""}"',
+            'hash': f'H = Hash(M) = {_label(hashed_msg)}',
+            'private_key': f'Private Key:\nd = {_label(key_info.get("d", "?"))}\nn = {_label(key_info.get("n", "?"))}',
+            'signature': f'Chữ ký số - Digital Signature:\nS = {_label(signature)}',
+        }
+        return DiagramSpec(None, (14, 10), self._build_signing_process_diagram, texts)
+
+    def _build_signing_process_diagram(self, ax, patches) -> Dict[str, Any]:
+        """Dựng phần tĩnh của sơ đồ ký - Build the static part of the signing diagram"""
+        artists = {}
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 8)
         ax.axis('off')
@@ -123,8 +721,7 @@ class MathVisualizer:
         message_box = patches.Rectangle((0.5, 6), 4, 0.8, facecolor=self.colors['background'],
                                       edgecolor='black', linewidth=2)
         ax.add_patch(message_box)
-        ax.text(2.5, 6.4, f'Thông điệp gốc:\n"{message[:50]}{"..." if len(message) > 50 else ""}"',
-                ha='center', va='center', fontsize=10)
+        artists['message'] = ax.text(2.5, 6.4, '', ha='center', va='center', fontsize=10)
 
         # Hash function - Hàm băm
         hash_box = patches.FancyBboxPatch((6, 5.8), 3, 1.2,
@@ -143,8 +740,8 @@ class MathVisualizer:
         hash_value_box = patches.Rectangle((0.5, 4.5), 9, 0.8, facecolor=self.colors['highlight'],
                                          edgecolor='black', linewidth=2)
         ax.add_patch(hash_value_box)
-        ax.text(5, 4.9, f'H = Hash(M) = {hashed_msg}', ha='center', va='center',
-                fontsize=10, fontweight='bold')
+        artists['hash'] = ax.text(5, 4.9, '', ha='center', va='center',
+                                  fontsize=10, fontweight='bold')
 
         # Arrow from hash to hash value - Mũi tên từ hàm băm xuống giá trị băm
         ax.arrow(7.5, 5.8, 0, -0.5, head_width=0.2, head_length=0.1,
@@ -160,8 +757,8 @@ class MathVisualizer:
                 fontsize=11, fontweight='bold', color='white')
 
         # Private key info - Thông tin khóa bí mật
-        ax.text(1, 3.5, f'Private Key:\nd = {key_info.get("d", "?")}\nn = {key_info.get("n", "?")}',
-                fontsize=10, bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['background']))
+        artists['private_key'] = ax.text(1, 3.5, '', fontsize=10,
+                                         bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['background']))
 
         # Arrow from hash value to signing - Mũi tên từ giá trị băm xuống khối ký
         ax.arrow(7.5, 4.5, 0, -0.4, head_width=0.2, head_length=0.1,
@@ -171,23 +768,17 @@ class MathVisualizer:
         signature_box = patches.Rectangle((0.5, 0.8), 9, 1, facecolor=self.colors['primary'],
                                         edgecolor='black', linewidth=2)
         ax.add_patch(signature_box)
-        ax.text(5, 1.3, f'Chữ ký số - Digital Signature:\nS = {signature}', ha='center', va='center',
-                fontsize=11, fontweight='bold', color='white')
+        artists['signature'] = ax.text(5, 1.3, '', ha='center', va='center',
+                                       fontsize=11, fontweight='bold', color='white')
 
         # Arrow from signing to signature - Mũi tên từ khối ký xuống kết quả chữ ký
         ax.arrow(7.5, 2.5, 0, -0.6, head_width=0.2, head_length=0.1,
                 fc='black', ec='black', linewidth=2)
 
-        # Save image - Lưu hình ảnh
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        plt.tight_layout()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return temp_file.name
+        return artists
 
     def create_verification_process_diagram(self, message: str, signature: int,
-                                          is_valid: bool, verify_info: Dict[str, Any]) -> str:
+                                          is_valid: bool, verify_info: Dict[str, Any]) -> bytes:
         """
         Tạo sơ đồ quá trình xác thực - Create verification process diagram
 
@@ -198,9 +789,34 @@ class MathVisualizer:
             verify_info: Thông tin xác thực - Verification information
 
         Returns:
-            str: Đường dẫn file hình ảnh - Image file path
+            bytes: Dữ liệu PNG - PNG data
         """
-        fig, ax = plt.subplots(figsize=(14, 10))
+        return self._cached_render(DIAGRAM_VERIFICATION, (message, signature, is_valid, verify_info),
+                                   lambda: self._draw_verification_process_diagram(message, signature, is_valid, verify_info))
+
+    def _draw_verification_process_diagram(self, message: str, signature: int,
+                                          is_valid: bool, verify_info: Dict[str, Any]) -> bytes:
+        """Vẽ sơ đồ xác thực - Draw the verification diagram"""
+        return self._render_template(DIAGRAM_VERIFICATION,
+                                     self._verification_process_spec(message, signature, is_valid, verify_info))
+
+    def _verification_process_spec(self, message: str, signature: int,
+                                   is_valid: bool, verify_info: Dict[str, Any]) -> DiagramSpec:
+        """Mô tả sơ đồ xác thực - Describe the verification diagram"""
+        texts = {
+            'message': f'Thông điệp:\n"{message[:30]}{"..." if len(message) > 30 else ""}"',
+            'signature': f'Chữ ký:\n{_label(signature)}',
+            'h1': f'H1 = {_label(verify_info.get("hashed_message", "?"))}',
+            'h2': f'H2 = {_label(verify_info.get("decrypted_signature", "?"))}',
+        }
+        # Kết quả hợp lệ/không hợp lệ là hai mẫu riêng - Valid and invalid results are separate templates
+        return DiagramSpec(bool(is_valid), (14, 10),
+                           partial(self._build_verification_process_diagram, is_valid=bool(is_valid)),
+                           texts)
+
+    def _build_verification_process_diagram(self, ax, patches, is_valid: bool) -> Dict[str, Any]:
+        """Dựng phần tĩnh của sơ đồ xác thực - Build the static part of the verification diagram"""
+        artists = {}
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
         ax.axis('off')
@@ -214,14 +830,13 @@ class MathVisualizer:
         msg_box = patches.Rectangle((0.5, 8), 4, 0.8, facecolor=self.colors['background'],
                                    edgecolor='black', linewidth=2)
         ax.add_patch(msg_box)
-        ax.text(2.5, 8.4, f'Thông điệp:\n"{message[:30]}{"..." if len(message) > 30 else ""}"',
-                ha='center', va='center', fontsize=10)
+        artists['message'] = ax.text(2.5, 8.4, '', ha='center', va='center', fontsize=10)
 
         # Signature input - Chữ ký đầu vào
         sig_box = patches.Rectangle((5.5, 8), 4, 0.8, facecolor=self.colors['background'],
                                    edgecolor='black', linewidth=2)
         ax.add_patch(sig_box)
-        ax.text(7.5, 8.4, f'Chữ ký:\n{signature}', ha='center', va='center', fontsize=10)
+        artists['signature'] = ax.text(7.5, 8.4, '', ha='center', va='center', fontsize=10)
 
         # Hash message - Băm thông điệp
         hash1_box = patches.FancyBboxPatch((0.5, 6), 4, 1,
@@ -245,14 +860,14 @@ class MathVisualizer:
         hash1_val = patches.Rectangle((0.5, 4.5), 4, 0.8, facecolor=self.colors['highlight'],
                                      edgecolor='black', linewidth=2)
         ax.add_patch(hash1_val)
-        ax.text(2.5, 4.9, f'H1 = {verify_info.get("hashed_message", "?")}', ha='center', va='center',
-                fontsize=9, fontweight='bold')
+        artists['h1'] = ax.text(2.5, 4.9, '', ha='center', va='center',
+                                fontsize=9, fontweight='bold')
 
         hash2_val = patches.Rectangle((5.5, 4.5), 4, 0.8, facecolor=self.colors['highlight'],
                                      edgecolor='black', linewidth=2)
         ax.add_patch(hash2_val)
-        ax.text(7.5, 4.9, f'H2 = {verify_info.get("decrypted_signature", "?")}', ha='center', va='center',
-                fontsize=9, fontweight='bold')
+        artists['h2'] = ax.text(7.5, 4.9, '', ha='center', va='center',
+                                fontsize=9, fontweight='bold')
 
         # Comparison - So sánh
         comparison_color = self.colors['secondary'] if is_valid else self.colors['accent']
@@ -275,15 +890,9 @@ class MathVisualizer:
         ax.arrow(2.5, 4.5, 1.2, -0.5, head_width=0.15, head_length=0.1, fc='black', ec='black', linewidth=2)
         ax.arrow(7.5, 4.5, -1.2, -0.5, head_width=0.15, head_length=0.1, fc='black', ec='black', linewidth=2)
 
-        # Save image - Lưu hình ảnh
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        plt.tight_layout()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return temp_file.name
+        return artists
 
-    def create_mathematical_proof(self, key_info: Dict[str, Any]) -> str:
+    def create_mathematical_proof(self, key_info: Dict[str, Any]) -> bytes:
         """
         Tạo sơ đồ chứng minh toán học - Create mathematical proof diagram
 
@@ -291,9 +900,29 @@ class MathVisualizer:
             key_info: Thông tin khóa - Key information
 
         Returns:
-            str: Đường dẫn file hình ảnh - Image file path
+            bytes: Dữ liệu PNG - PNG data
         """
-        fig, ax = plt.subplots(figsize=(14, 10))
+        return self._cached_render(DIAGRAM_PROOF, (key_info,),
+                                   lambda: self._draw_mathematical_proof(key_info))
+
+    def _draw_mathematical_proof(self, key_info: Dict[str, Any]) -> bytes:
+        """Vẽ chứng minh toán học - Draw the mathematical proof"""
+        return self._render_template(DIAGRAM_PROOF, self._mathematical_proof_spec(key_info))
+
+    def _mathematical_proof_spec(self, key_info: Dict[str, Any]) -> DiagramSpec:
+        """Mô tả chứng minh toán học - Describe the mathematical proof"""
+        product, totient, extra = self._factor_formulas(key_info)
+        texts = {
+            'given_n': f'p = {_label(key_info.get("p", "?"))}, q = {_label(key_info.get("q", "?"))}{extra}, '
+                       f'n = {product.replace(" ", "")} = {_label(key_info.get("n", "?"))}',
+            'given_phi': f'φ(n) = {totient} = {_label(key_info.get("phi", "?"))}',
+            'exponent': f'= M^{_label(key_info.get("phi", "?"))} × k + 1',
+        }
+        return DiagramSpec(None, (14, 10), self._build_mathematical_proof, texts)
+
+    def _build_mathematical_proof(self, ax, patches) -> Dict[str, Any]:
+        """Dựng phần tĩnh của chứng minh toán học - Build the static part of the mathematical proof"""
+        artists = {}
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
         ax.axis('off')
@@ -312,26 +941,28 @@ class MathVisualizer:
         ax.text(5, 8.1, 'Định lý - Theorem:\n(Mᵈ)ᵉ ≡ M (mod n) với M là thông điệp',
                 ha='center', va='center', fontsize=12, fontweight='bold', color='white')
 
-        # Proof steps - Các bước chứng minh
+        # Proof steps; tên None là nội dung cố định - Proof steps; a None name is fixed text
         proof_steps = [
-            (1, 6.5, 'Cho - Given:'),
-            (1, 6, f'p = {key_info.get("p", "?")}, q = {key_info.get("q", "?")}, n = p×q = {key_info.get("n", "?")}'),
-            (1, 5.5, f'φ(n) = (p-1)(q-1) = {key_info.get("phi", "?")}'),
-            (1, 5, f'e × d ≡ 1 (mod φ(n)) → e × d = k × φ(n) + 1'),
-            (1, 4.5, ''),
-            (1, 4, 'Chứng minh - Proof:'),
-            (1, 3.5, '(Mᵈ)ᵉ = M^{key_info.get("e", "?") × key_info.get("d", "?")}'),
-            (1, 3, f'= M^{key_info.get("phi", "?")} × k + 1'),
-            (1, 2.5, '= (M^{key_info.get("phi", "?")})ᵏ × M¹'),
-            (1, 2, f'= (1 mod p)ᵏ × M (theo định lý nhỏ Fermat)'),
-            (1, 1.5, f'= M (mod p) và M (mod q)'),
-            (1, 1, '→ M (mod n) theo định lý số dư Trung Hoa'),
-            (1, 0.5, '✅ Đpcm - QED')
+            (1, 6.5, None, 'Cho - Given:'),
+            (1, 6, 'given_n', ''),
+            (1, 5.5, 'given_phi', ''),
+            (1, 5, None, 'e × d ≡ 1 (mod φ(n)) → e × d = k × φ(n) + 1'),
+            (1, 4.5, None, ''),
+            (1, 4, None, 'Chứng minh - Proof:'),
+            (1, 3.5, None, '(Mᵈ)ᵉ = M^{key_info.get("e", "?") × key_info.get("d", "?")}'),
+            (1, 3, 'exponent', ''),
+            (1, 2.5, None, '= (M^{key_info.get("phi", "?")})ᵏ × M¹'),
+            (1, 2, None, '= (1 mod p)ᵏ × M (theo định lý nhỏ Fermat)'),
+            (1, 1.5, None, '= M (mod p) và M (mod q)'),
+            (1, 1, None, '→ M (mod n) theo định lý số dư Trung Hoa'),
+            (1, 0.5, None, '✅ Đpcm - QED')
         ]
 
-        for x, y, text in proof_steps:
-            ax.text(x, y, text, fontsize=10,
-                   bbox=dict(boxstyle="round,pad=0.2", facecolor=self.colors['background'], alpha=0.8))
+        for x, y, name, text in proof_steps:
+            step = ax.text(x, y, text, fontsize=10,
+                           bbox=dict(boxstyle="round,pad=0.2", facecolor=self.colors['background'], alpha=0.8))
+            if name is not None:
+                artists[name] = step
 
         # Highlight important result - Làm nổi bật kết quả quan trọng
         highlight_box = patches.Rectangle((6, 1.5), 3.5, 1, facecolor=self.colors['highlight'],
@@ -340,15 +971,9 @@ class MathVisualizer:
         ax.text(7.75, 2, 'Kết quả - Result:\n(Mᵈ)ᵉ ≡ M (mod n)', ha='center', va='center',
                 fontsize=11, fontweight='bold')
 
-        # Save image - Lưu hình ảnh
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        plt.tight_layout()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-        plt.close()
+        return artists
 
-        return temp_file.name
-
-    def create_euclidean_algorithm_visualization(self, a: int, b: int) -> str:
+    def create_euclidean_algorithm_visualization(self, a: int, b: int) -> bytes:
         """
         Tạo trực quan hóa thuật toán Euclid - Create Euclidean algorithm visualization
 
@@ -356,79 +981,187 @@ class MathVisualizer:
             a, b: Số nguyên - Integers
 
         Returns:
-            str: Đường dẫn file hình ảnh - Image file path
+            bytes: Dữ liệu PNG - PNG data
         """
-        fig, ax = plt.subplots(figsize=(12, 8))
-        ax.set_xlim(0, 10)
-        ax.set_ylim(0, 8)
-        ax.axis('off')
-
-        # Title - Tiêu đề
-        ax.text(5, 7.5, f'Thuật Toán Euclid Mở Rộng\nExtended Euclidean Algorithm for {a} and {b}',
-                ha='center', va='center', fontsize=14, fontweight='bold',
-                color=self.colors['text'])
+        return self._cached_render(DIAGRAM_EUCLIDEAN, (a, b),
+                                   lambda: self._draw_euclidean_algorithm_visualization(a, b))
 
-        # Calculate steps - Tính các bước
-        steps = []
-        original_a, original_b = a, b
+    def _draw_euclidean_algorithm_visualization(self, a: int, b: int) -> bytes:
+        """Vẽ thuật toán Euclid - Draw the Euclidean algorithm"""
+        return _render_png(self._euclidean_figure(a, b))
 
-        while b != 0:
-            q = a // b
-            r = a % b
-            steps.append((a, b, q, r))
-            a, b = b, r
-
-        # Display steps - Hiển thị các bước
-        y_pos = 6
-        for i, (a_i, b_i, q_i, r_i) in enumerate(steps):
-            # Equation - Phương trình
-            equation = f"{a_i} = {b_i} × {q_i} + {r_i}"
-            ax.text(1, y_pos, f"Bước {i+1} - Step {i+1}: {equation}", fontsize=11,
-                   bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['background']))
-
-            # Visual representation - Trực quan hóa
-            if r_i > 0:
-                # Show division - Hiển thị phép chia
-                ax.bar([2], [a_i], width=0.8, color=self.colors['primary'], alpha=0.7)
-                ax.bar([3], [b_i * q_i], width=0.8, color=self.colors['secondary'], alpha=0.7)
-                ax.bar([4], [r_i], width=0.8, color=self.colors['accent'], alpha=0.7)
+    def _euclidean_figure(self, a: int, b: int):
+        """
+        Dựng Figure thuật toán Euclid - Build the Euclidean algorithm Figure
 
-                ax.text(2, a_i + 0.2, str(a_i), ha='center', fontsize=9)
-                ax.text(3, b_i * q_i + 0.2, f"{b_i}×{q_i}", ha='center', fontsize=9)
-                ax.text(4, r_i + 0.2, str(r_i), ha='center', fontsize=9)
+        Thời gian vẽ bị chặn bất kể kích thước khóa: danh sách bước được tóm tắt,
+        số lớn được rút gọn và mọi cột được vẽ trong một lệnh bar trên thang số bit.
+        Render time is bounded whatever the key size: the step list is summarized,
+        big numbers are elided and all bars are drawn by one bar call on a bit-length scale.
+        """
+        import numpy as np
 
-                ax.text(2.5, -0.5, "a", ha='center', fontsize=10, fontweight='bold')
-                ax.text(3.5, -0.5, "b×q", ha='center', fontsize=10, fontweight='bold')
-                ax.text(4.5, -0.5, "r", ha='center', fontsize=10, fontweight='bold')
+        gcd, bits, head, tail = _euclid_steps(a, b)
+        step_count = len(bits)
 
-            y_pos -= 1.2
+        fig, (ax, chart), patches = _new_figure((12, 9), nrows=2)
+        ax.axis('off')
 
-        # Final result - Kết quả cuối cùng
-        gcd = a
-        ax.text(1, y_pos, f"gcd({original_a}, {original_b}) = {gcd}", fontsize=12,
-               bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['highlight']),
-               fontweight='bold')
+        # Title - Tiêu đề
+        ax.text(0.5, 1.0, f'Thuật Toán Euclid Mở Rộng\nExtended Euclidean Algorithm for '
+                f'{elide_int(a)} and {elide_int(b)}',
+                ha='center', va='top', fontsize=14, fontweight='bold',
+                color=self.colors['text'], transform=ax.transAxes)
+
+        # Danh sách bước, bỏ bớt phần giữa - Step list with the middle summarized
+        def describe(step):
+            index, a_i, b_i, q_i, r_i = step
+            return (f"Bước {index} - Step {index}: {elide_int(a_i)} = "
+                    f"{elide_int(b_i)} × {elide_int(q_i)} + {elide_int(r_i)}")
+
+        lines = [describe(step) for step in head]
+        omitted = step_count - len(head) - len(tail)
+        if omitted > 0:
+            lines.append(f"… {omitted} bước ở giữa được lược bỏ - {omitted} middle steps omitted …")
+        lines.extend(describe(step) for step in tail)
+        lines.append(f"gcd = {elide_int(gcd)}  ({step_count} bước - steps)")
+
+        ax.text(0.0, 0.78, "\n".join(lines), ha='left', va='top', fontsize=10, family='monospace',
+                transform=ax.transAxes,
+                bbox=dict(boxstyle="round,pad=0.4", facecolor=self.colors['background']))
+
+        # Biểu đồ cột: lấy mẫu đều nếu quá nhiều bước - Bar chart, sampled evenly for long runs
+        if step_count:
+            indices = np.unique(np.linspace(0, step_count - 1,
+                                            min(step_count, EUCLID_MAX_BAR_STEPS)).astype(np.int64))
+            stride = max(1.0, step_count / len(indices))
+            width = 0.27 * stride
+            offsets = np.array([-width, 0.0, width])
+
+            x = (indices[:, None] + 1 + offsets[None, :]).ravel()
+            heights = bits[indices].ravel()
+            series_colors = [self.colors['primary'], self.colors['secondary'], self.colors['accent']]
+            colors = np.tile(np.array(series_colors, dtype=object), len(indices))
+            chart.bar(x, heights, width=width, color=colors, alpha=0.8)
+
+            for color, label in zip(series_colors, ("a", "b×q", "r")):
+                chart.bar([np.nan], [np.nan], color=color, alpha=0.8, label=label)
+            chart.legend(loc='upper right')
+
+        chart.set_xlabel("Bước - Step" if step_count <= EUCLID_MAX_BAR_STEPS
+                         else f"Bước (mẫu {EUCLID_MAX_BAR_STEPS}/{step_count}) - Step (sampled)")
+        chart.xaxis.get_major_locator().set_params(integer=True)
+        chart.set_ylabel("Số bit - Bit length (≈ log₂)")
+        chart.grid(axis='y', alpha=0.3)
+
+        return fig
+
+    def create_signature_distribution(self, key_info: Dict[str, Any],
+                                      samples: int = DISTRIBUTION_SAMPLES) -> bytes:
+        """
+        Tạo sơ đồ phân bố chữ ký - Create the signature distribution diagram
 
-        # Save image - Lưu hình ảnh
-        temp_file = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-        plt.tight_layout()
-        plt.savefig(temp_file.name, dpi=150, bbox_inches='tight')
-        plt.close()
+        Ký và xác thực nhiều thông điệp mẫu cùng lúc bằng đường vector hóa, nên
+        chỉ dùng được khi n < 2^32.
+        Signs and verifies many sample messages at once on the vectorized path,
+        so it only works for n < 2^32.
 
-        return temp_file.name
+        Args:
+            key_info: Thông tin khóa (e, d, n) - Key information (e, d, n)
+            samples: Số thông điệp mẫu - Number of sample messages
 
-    def cleanup_temp_file(self, file_path: str):
+        Returns:
+            bytes: Dữ liệu PNG - PNG data
+        """
+        return self._cached_render(DIAGRAM_SIGNATURE_DISTRIBUTION, (key_info, samples),
+                                   lambda: self._draw_signature_distribution(key_info, samples))
+
+    def _draw_signature_distribution(self, key_info: Dict[str, Any],
+                                     samples: int = DISTRIBUTION_SAMPLES) -> bytes:
+        """Vẽ phân bố chữ ký - Draw the signature distribution"""
+        return _render_png(self._signature_distribution_figure(key_info, samples))
+
+    def _signature_distribution_figure(self, key_info: Dict[str, Any],
+                                       samples: int = DISTRIBUTION_SAMPLES):
+        """Dựng Figure phân bố chữ ký - Build the signature distribution Figure"""
+        import numpy as np
+        from crypto.vectorized import batch_sign, batch_verify, hash_messages
+
+        e, d, n = key_info['e'], key_info['d'], key_info['n']
+        hashed = hash_messages((f"#{index}" for index in range(samples)), n)
+        signatures = batch_sign(hashed, (d, n))
+        valid = int(np.count_nonzero(batch_verify(hashed, signatures, (e, n))))
+
+        fig, (scatter, histogram), patches = _new_figure((12, 9), nrows=2)
+        fig.suptitle(f'Phân Bố Chữ Ký - Signature Distribution (n = {elide_int(n)}, {samples} mẫu - samples)\n'
+                     f'Xác thực hợp lệ - Verified: {valid}/{samples}',
+                     fontsize=14, fontweight='bold', color=self.colors['text'])
+
+        # Băm → chữ ký: s = h^d mod n là một hoán vị của Z_n
+        # Hash → signature: s = h^d mod n is a permutation of Z_n
+        scatter.scatter(hashed, signatures, s=2, alpha=0.4, color=self.colors['primary'],
+                        linewidths=0, rasterized=True)
+        scatter.set_xlim(0, n)
+        scatter.set_ylim(0, n)
+        scatter.set_xlabel("Giá trị băm h mod n - Hash h mod n")
+        scatter.set_ylabel("Chữ ký s - Signature s")
+        scatter.grid(alpha=0.3)
+
+        # Tần suất chữ ký so với phân bố đều - Signature frequencies against the uniform distribution
+        bins = min(n, DISTRIBUTION_MAX_BINS)
+        counts, edges = np.histogram(signatures, bins=bins, range=(0, n))
+        histogram.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                      color=self.colors['secondary'], alpha=0.8, label="Chữ ký - Signatures")
+        histogram.axhline(samples / bins, color=self.colors['accent'], linestyle='--',
+                          label="Phân bố đều - Uniform")
+        histogram.set_xlim(0, n)
+        histogram.set_xlabel("Chữ ký s - Signature s")
+        histogram.set_ylabel("Số lượng - Count")
+        histogram.legend(loc='lower right')
+        histogram.grid(axis='y', alpha=0.3)
+
+        return fig
+
+    def create_factoring_benchmark(self, rows: Sequence[Dict[str, Any]]) -> bytes:
         """
-        Xóa file tạm - Clean up temporary file
+        Tạo biểu đồ thời gian phân tích theo kích thước module
+        Create the chart of factoring time against modulus size
 
         Args:
-            file_path: Đường dẫn file - File path
+            rows: Kết quả của crypto.factoring.benchmark_factoring - Rows from crypto.factoring.benchmark_factoring
+
+        Returns:
+            bytes: Dữ liệu PNG - PNG data
         """
-        try:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-        except Exception:
-            pass  # Ignore cleanup errors
+        rows = [dict(row) for row in rows]
+        return self._cached_render(DIAGRAM_FACTORING_BENCHMARK, (rows,),
+                                   lambda: self._draw_factoring_benchmark(rows))
+
+    def _draw_factoring_benchmark(self, rows: Sequence[Dict[str, Any]]) -> bytes:
+        """Vẽ biểu đồ thời gian phân tích - Draw the factoring time chart"""
+        return _render_png(self._factoring_benchmark_figure(rows))
+
+    def _factoring_benchmark_figure(self, rows: Sequence[Dict[str, Any]]):
+        """Dựng Figure thời gian phân tích - Build the factoring time Figure"""
+        fig, ax, patches = _new_figure((12, 7))
+        fig.suptitle('Thời Gian Phá Khóa Nhỏ - Time to Break Small Keys',
+                     fontsize=14, fontweight='bold', color=self.colors['text'])
+
+        bits = [row['bits'] for row in rows]
+        # Thang log cần giá trị dương - The log scale needs positive values
+        seconds = [max(row['seconds'], 1e-6) for row in rows]
+        ax.plot(bits, seconds, marker='o', color=self.colors['accent'], linewidth=2)
+        for row, value in zip(rows, seconds):
+            label = ', '.join(row['methods']) + ('' if row['complete'] else ' (hết giờ - timed out)')
+            ax.annotate(label, (row['bits'], value), textcoords='offset points', xytext=(0, 8),
+                        ha='center', fontsize=7, rotation=30, color=self.colors['text'])
+
+        ax.set_yscale('log')
+        ax.set_xlabel("Số bit của n - Bits of n")
+        ax.set_ylabel("Thời gian (giây, trung vị) - Time (seconds, median)")
+        ax.grid(alpha=0.3, which='both')
+
+        return fig
 
 
 def test_visualizer():
@@ -446,22 +1179,22 @@ def test_visualizer():
     }
 
     # Generate visualizations - Tạo trực quan hóa
-    flowchart_file = visualizer.create_key_generation_flowchart(key_info)
-    signing_file = visualizer.create_signing_process_diagram(
+    flowchart_png = visualizer.create_key_generation_flowchart(key_info)
+    signing_png = visualizer.create_signing_process_diagram(
         "Hello RSA", 12345, 67890, key_info
     )
-    verification_file = visualizer.create_verification_process_diagram(
+    verification_png = visualizer.create_verification_process_diagram(
         "Hello RSA", 12345, True, {"hashed_message": 67890, "decrypted_signature": 67890}
     )
-    proof_file = visualizer.create_mathematical_proof(key_info)
-    euclidean_file = visualizer.create_euclidean_algorithm_visualization(3120, 17)
-
-    print("Visualization files created:")
-    print(f"- Flowchart: {flowchart_file}")
-    print(f"- Signing: {signing_file}")
-    print(f"- Verification: {verification_file}")
-    print(f"- Proof: {proof_file}")
-    print(f"- Euclidean: {euclidean_file}")
+    proof_png = visualizer.create_mathematical_proof(key_info)
+    euclidean_png = visualizer.create_euclidean_algorithm_visualization(3120, 17)
+
+    print("Visualizations rendered (PNG bytes):")
+    print(f"- Flowchart: {len(flowchart_png)}")
+    print(f"- Signing: {len(signing_png)}")
+    print(f"- Verification: {len(verification_png)}")
+    print(f"- Proof: {len(proof_png)}")
+    print(f"- Euclidean: {len(euclidean_png)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Big Number Formatting
+Định dạng số nguyên lớn
+
+Các hàm chuyển số nguyên lớn sang chữ, dùng chung cho giao diện và sơ đồ.
+Module không phụ thuộc Qt nên tiến trình vẽ sơ đồ cũng dùng được.
+Text helpers for big integers, shared by the UI and the diagrams. The module
+does not depend on Qt, so diagram worker processes can use it too.
+
+Chuyển đổi thập phân ở đây không bị giới hạn chữ số của CPython (mặc định 4300).
+Decimal conversion here is not bound by CPython's int/str digit limit (4300 by default).
+"""
+
+import math
+from functools import lru_cache
+
+# Số chữ số giữ lại mỗi đầu khi rút gọn - Digits kept at each end when eliding
+ELIDE_DIGITS = 16
+
+# Kích thước khối khi chuyển đổi chia để trị - Chunk size for divide-and-conquer conversion
+_CHUNK_DIGITS = 2000
+
+_LOG10_2 = math.log10(2)
+
+BASE_DECIMAL = 10
+BASE_HEX = 16
+
+_HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+@lru_cache(maxsize=64)
+def _pow10(exponent: int) -> int:
+    """Lũy thừa của 10, có lưu đệm - Cached power of ten"""
+    return 10 ** exponent
+
+
+def _decimal_digits(value: int) -> int:
+    """Số chữ số thập phân của |value| mà không chuyển đổi - Decimal digit count without converting"""
+    value = abs(value)
+    if value == 0:
+        return 1
+    digits = int((value.bit_length() - 1) * _LOG10_2) + 1
+    if value >= _pow10(digits):
+        digits += 1
+    return digits
+
+
+def _to_decimal(value: int) -> str:
+    """Chuyển số không âm sang thập phân bằng chia để trị - Divide-and-conquer decimal conversion"""
+    digits = _decimal_digits(value)
+    if digits <= _CHUNK_DIGITS:
+        return str(value)
+    low_digits = digits // 2
+    high, low = divmod(value, _pow10(low_digits))
+    return _to_decimal(high) + _to_decimal(low).zfill(low_digits)
+
+
+@lru_cache(maxsize=64)
+def full_text(value: int, base: int = BASE_DECIMAL) -> str:
+    """
+    Chuỗi đầy đủ của một số nguyên, có lưu đệm - Full text of an integer, cached
+
+    Args:
+        value: Số nguyên - Integer
+        base: 10 hoặc 16 - 10 or 16
+
+    Returns:
+        str: Chuỗi đầy đủ - Full text
+    """
+    sign = '-' if value < 0 else ''
+    if base == BASE_HEX:
+        return f"{sign}0x{abs(value):x}"
+    return sign + _to_decimal(abs(value))
+
+
+def parse_int(text: str) -> int:
+    """
+    Đọc số nguyên thập phân hoặc hex (0x) không bị giới hạn chữ số
+    Parse a decimal or hex (0x) integer without the digit limit
+
+    Args:
+        text: Chuỗi số - Number text
+
+    Returns:
+        int: Số nguyên - Integer
+
+    Raises:
+        ValueError: Nếu chuỗi không phải số nguyên - If the text is not an integer
+    """
+    text = text.strip().replace('_', '')
+    # Chỉ một dấu ở đầu - At most one leading sign
+    sign = -1 if text.startswith('-') else 1
+    body = text[1:] if text[:1] in ('+', '-') else text
+    if body[:2].lower() == '0x':
+        digits = body[2:]
+        if not digits or not all(c in _HEX_DIGITS for c in digits):
+            raise ValueError(f"Không phải số nguyên - Not an integer: {text[:32]}")
+        return sign * int(digits, 16)
+    if not (body.isascii() and body.isdigit()):
+        raise ValueError(f"Không phải số nguyên - Not an integer: {text[:32]}")
+    if len(body) <= _CHUNK_DIGITS:
+        return sign * int(body)
+    split = len(body) // 2
+    low = body[split:]
+    return sign * (parse_int(body[:split]) * _pow10(len(low)) + parse_int(low))
+
+
+def elide_int(value: int, digits: int = ELIDE_DIGITS, base: int = BASE_DECIMAL) -> str:
+    """
+    Dạng rút gọn của số nguyên, ví dụ "1234…5678 (2048 bit)"
+    Elided form of an integer, e.g. "1234…5678 (2048 bit)"
+
+    Chỉ tính các chữ số đầu và cuối, không chuyển đổi cả số.
+    Only the leading and trailing digits are computed, never the whole number.
+
+    Args:
+        value: Số nguyên - Integer
+        digits: Số chữ số giữ lại mỗi đầu - Digits kept at each end
+        base: 10 hoặc 16 - 10 or 16
+
+    Returns:
+        str: Chuỗi rút gọn - Elided text
+    """
+    sign = '-' if value < 0 else ''
+    magnitude = abs(value)
+    bits = magnitude.bit_length()
+
+    if base == BASE_HEX:
+        hex_digits = max(1, (bits + 3) // 4)
+        if hex_digits <= 2 * digits + 1:
+            return f"{sign}0x{magnitude:x}"
+        head = magnitude >> (4 * (hex_digits - digits))
+        tail = magnitude & ((1 << (4 * digits)) - 1)
+        return f"{sign}0x{head:x}…{tail:0{digits}x} ({bits} bit)"
+
+    total_digits = _decimal_digits(magnitude)
+    if total_digits <= 2 * digits + 1:
+        return sign + str(magnitude)
+    head = magnitude // _pow10(total_digits - digits)
+    tail = magnitude % _pow10(digits)
+    return f"{sign}{head}…{tail:0{digits}d} ({bits} bit)"
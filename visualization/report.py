@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PDF Report Export
+Xuất báo cáo PDF
+
+Vẽ mọi sơ đồ của nhiều phiên ký (khóa, thông điệp, chữ ký) vào một file PDF
+nhiều trang. Trang được ghi dạng vector (không phải ảnh) và ghi ra theo luồng,
+nên hàng trăm phiên không bao giờ nằm hết trong bộ nhớ. Figure được dựng trên
+nhóm tiến trình vì việc dựng bị giới hạn bởi GIL.
+Draws every diagram of many signing sessions (key, message, signature) into
+one multi-page PDF. Pages are written as vectors (not images) and as a
+stream, so hundreds of sessions are never held in memory at once. Figures are
+built on a process pool because building them is bound by the GIL.
+
+Chạy - Run:
+    python -m visualization.report sessions.jsonl report.pdf
+
+Mỗi dòng của sessions.jsonl là một phiên - Each line of sessions.jsonl is one session:
+    {"key_info": {"p": 61, "q": 53, "n": 3233, "phi": 3120, "e": 17, "d": 2753},
+     "message": "Hello RSA"}
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .math_visualizer import (
+    MathVisualizer, DIAGRAM_KEY_GENERATION, DIAGRAM_SIGNING, DIAGRAM_VERIFICATION,
+    DIAGRAM_PROOF, DIAGRAM_EUCLIDEAN
+)
+
+# Tiêu đề trang theo loại sơ đồ - Page titles by diagram type
+PAGE_TITLES = {
+    DIAGRAM_KEY_GENERATION: "Tạo khóa - Key generation",
+    DIAGRAM_SIGNING: "Ký - Signing",
+    DIAGRAM_VERIFICATION: "Xác thực - Verification",
+    DIAGRAM_PROOF: "Chứng minh - Proof",
+    DIAGRAM_EUCLIDEAN: "Thuật toán Euclid - Euclidean algorithm",
+}
+
+# Chiều cao dải tiêu đề trang (inch) - Height of the page heading strip (inches)
+HEADING_INCHES = 0.4
+
+# Trình trực quan của mỗi tiến trình con - Per-worker-process visualizer
+_worker_visualizer: Optional[MathVisualizer] = None
+
+
+def complete_session(session: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bổ sung giá trị còn thiếu của một phiên - Fill in the missing values of a session
+
+    Chỉ cần key_info và message; băm, chữ ký và kết quả xác thực được tính
+    nếu chưa có.
+    Only key_info and message are required; hash, signature and verification
+    result are computed when absent.
+
+    Args:
+        session: Phiên ký - Signing session
+
+    Returns:
+        Dict[str, Any]: Phiên đầy đủ - Completed session
+    """
+    from crypto.rsa_engine import RSAEngine
+
+    engine = RSAEngine()
+    key_info = session['key_info']
+    message = session['message']
+    e, d, n = key_info['e'], key_info['d'], key_info['n']
+
+    hashed_message = session.get('hashed_message')
+    if hashed_message is None:
+        hashed_message = engine.hash_message(message)
+
+    signature = session.get('signature')
+    if signature is None:
+        signature = engine.sign_digest(hashed_message, (d, n), key_info.get('primes'))
+
+    is_valid = session.get('is_valid')
+    if is_valid is None:
+        is_valid = engine.verify_digest(hashed_message, signature, (e, n))
+
+    return dict(session, hashed_message=hashed_message, signature=signature, is_valid=is_valid)
+
+
+def session_jobs(session: Dict[str, Any]) -> List[Tuple[str, tuple]]:
+    """
+    Các sơ đồ của một phiên - The diagrams of one session
+
+    Args:
+        session: Phiên đầy đủ - Completed session
+
+    Returns:
+        List[Tuple[str, tuple]]: Danh sách (loại sơ đồ, đối số) - List of (diagram type, args)
+    """
+    key_info = session['key_info']
+    message = session['message']
+    signature = session['signature']
+    verify_info = {
+        'hashed_message': session['hashed_message'],
+        'decrypted_signature': pow(signature, key_info['e'], key_info['n'])
+    }
+    return [
+        (DIAGRAM_KEY_GENERATION, (key_info,)),
+        (DIAGRAM_SIGNING, (message, signature, session['hashed_message'], key_info)),
+        (DIAGRAM_VERIFICATION, (message, signature, session['is_valid'], verify_info)),
+        (DIAGRAM_PROOF, (key_info,)),
+        (DIAGRAM_EUCLIDEAN, (key_info['phi'], key_info['e'])),
+    ]
+
+
+def load_sessions(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Đọc phiên từ file JSON Lines theo luồng - Stream sessions from a JSON Lines file
+
+    Args:
+        path: Đường dẫn file - File path
+
+    Yields:
+        Dict[str, Any]: Từng phiên - Each session
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _page_figure(visualizer: MathVisualizer, diagram_type: str, args: tuple, heading: str):
+    """
+    Dựng Figure của một trang, có dải tiêu đề phía trên
+    Build the Figure of one page, with a heading strip on top
+
+    Args:
+        visualizer: Trình trực quan - Visualizer
+        diagram_type: Loại sơ đồ - Diagram type
+        args: Đối số của sơ đồ - Diagram arguments
+        heading: Dòng tiêu đề trang - Page heading
+
+    Returns:
+        Figure: Trang cần ghi - Page to write
+    """
+    fig = visualizer.diagram_figure(diagram_type, *args)
+    width, height = fig.get_size_inches()
+    page_height = height + HEADING_INCHES
+    fig.set_size_inches(width, page_height)
+    fig.tight_layout(rect=(0, 0, 1, height / page_height))
+    fig.text(0.01, 1 - HEADING_INCHES / (2 * page_height), heading,
+             va='center', fontsize=10, color='#2c3e50')
+    return fig
+
+
+def _session_pages(visualizer: MathVisualizer, session: Dict[str, Any], number: int) -> list:
+    """
+    Dựng mọi trang của một phiên - Build every page of one session
+
+    Args:
+        visualizer: Trình trực quan - Visualizer
+        session: Phiên ký (có thể thiếu giá trị) - Signing session (may be incomplete)
+        number: Số thứ tự phiên (từ 1) - Session number (from 1)
+
+    Returns:
+        list: Figure của các trang theo thứ tự - Page Figures in order
+    """
+    session = complete_session(session)
+    return [_page_figure(visualizer, diagram_type, args,
+                         f"Phiên {number} - Session {number}: {PAGE_TITLES[diagram_type]}")
+            for diagram_type, args in session_jobs(session)]
+
+
+def _init_worker():
+    """Tạo trình trực quan một lần cho mỗi tiến trình con - Create one visualizer per worker process"""
+    global _worker_visualizer
+    _worker_visualizer = MathVisualizer()
+
+
+def _build_session(session: Dict[str, Any], number: int) -> list:
+    """Dựng các trang của một phiên trong tiến trình con - Build a session's pages in a worker process"""
+    return _session_pages(_worker_visualizer, session, number)
+
+
+def export_report(sessions: Iterable[Dict[str, Any]], path: str,
+                  max_workers: Optional[int] = None,
+                  progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """
+    Xuất mọi sơ đồ của các phiên vào một PDF nhiều trang
+    Export every diagram of the sessions into one multi-page PDF
+
+    Phiên được đọc dần và trang được ghi theo đúng thứ tự bằng pdf.savefig nên
+    chữ và hình vẫn là vector. Với max_workers > 1, các phiên sau được hoàn
+    thiện và dựng Figure trên nhóm tiến trình "spawn" trong khi phiên trước
+    đang được ghi; Figure được pickle về tiến trình chính để ghi. Số phiên
+    đang dựng bị giới hạn nên bộ nhớ không tăng theo số phiên. max_workers=1
+    dựng tuần tự trong tiến trình hiện tại.
+    Sessions are consumed lazily and pages are written in order with
+    pdf.savefig, so text and shapes stay vectors. With max_workers > 1, later
+    sessions are completed and their Figures built on a "spawn" process pool
+    while earlier ones are written; the Figures are pickled back to the main
+    process for writing. The number of sessions in flight is bounded, so
+    memory does not grow with the number of sessions. max_workers=1 builds
+    serially in the current process.
+
+    Args:
+        sessions: Các phiên (có thể là generator) - Sessions (may be a generator)
+        path: Đường dẫn file PDF - PDF file path
+        max_workers: Số tiến trình tối đa - Maximum worker processes
+        progress: Callback (số trang đã ghi, số phiên đã đọc) - Callback (pages written, sessions read)
+
+    Returns:
+        int: Số trang đã ghi - Number of pages written
+    """
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1:
+        visualizer = None
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_init_worker)
+    else:
+        visualizer = MathVisualizer()
+        pool = None
+
+    pages = 0
+    session_count = 0
+    pending = deque()
+
+    def write_oldest(pdf):
+        nonlocal pages
+        figures = pending.popleft()
+        for fig in figures if pool is None else figures.result():
+            pdf.savefig(fig, bbox_inches='tight')
+            pages += 1
+            if progress is not None:
+                progress(pages, session_count)
+
+    try:
+        with PdfPages(path) as pdf:
+            for session in sessions:
+                session_count += 1
+                if pool is None:
+                    pending.append(_session_pages(visualizer, session, session_count))
+                else:
+                    pending.append(pool.submit(_build_session, session, session_count))
+
+                # Giới hạn số phiên đang dựng - Bound the number of sessions in flight
+                if len(pending) >= workers * 2:
+                    write_oldest(pdf)
+
+            while pending:
+                write_oldest(pdf)
+
+            info = pdf.infodict()
+            info['Title'] = 'RSA Signature Report - Báo cáo chữ ký RSA'
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return pages
+
+
+def main(argv: List[str]) -> int:
+    """Điểm vào dòng lệnh - Command-line entry point"""
+    if len(argv) != 2:
+        print("Cách dùng - Usage: python -m visualization.report sessions.jsonl report.pdf", file=sys.stderr)
+        return 2
+
+    sessions_path, output_path = argv
+
+    def report_progress(pages: int, session_count: int):
+        print(f"\r{pages} trang - pages, {session_count} phiên - sessions", end='', file=sys.stderr)
+
+    pages = export_report(load_sessions(sessions_path), output_path, progress=report_progress)
+    print(f"\nĐã ghi - Wrote {pages} trang - pages: {output_path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))